@@ -103,7 +103,7 @@ class QualityAnalyzer:
         self, report: ScheduleQualityReport, config=None
     ) -> None:
         """Gibt den Qualitätsbericht formatiert über Rich aus."""
-        from rich.console import Console
+        from rich.console import Console, Group
         from rich.panel import Panel
         from rich.table import Table
         from rich import box
@@ -121,7 +121,7 @@ class QualityAnalyzer:
             else "yellow" if report.double_fulfillment_rate >= 0.70
             else "red"
         )
-        console.print(Panel(
+        overview = Panel(
             f"Status: [bold]{report.solver_status}[/bold] | "
             f"Zeit: {report.solve_time}s\n"
             f"Gesamt-Springstunden: [bold]{report.total_gaps}[/bold] | "
@@ -133,7 +133,7 @@ class QualityAnalyzer:
             f"[{double_color}]{report.double_fulfillment_rate:.1%}[/{double_color}]",
             title="Qualitätsbericht – Übersicht",
             border_style="cyan",
-        ))
+        )
 
         # Lehrer-Tabelle
         t_table = Table(title="Lehrer-Auslastung", box=box.ROUNDED, show_lines=False)
@@ -161,7 +161,6 @@ class QualityAnalyzer:
                 str(m.free_days),
                 status,
             )
-        console.print(t_table)
 
         # Klassen-Tabelle
         c_table = Table(title="Klassen-Qualität", box=box.ROUNDED, show_lines=False)
@@ -182,7 +181,8 @@ class QualityAnalyzer:
                 str(m.double_requested), str(m.double_fulfilled),
                 f"[{spread_color}]{m.subject_spread_score:.2f}[/{spread_color}]",
             )
-        console.print(c_table)
+        # Übersicht und beide Tabellen in einem Durchgang rendern
+        console.print(Group(overview, t_table, c_table))
 
     # ── Private Berechnungen ──────────────────────────────────────────────────
 
@@ -193,8 +193,9 @@ class QualityAnalyzer:
         day_names = school_data.config.time_grid.day_names
         metrics = []
 
+        by_teacher = solution.entries_by_teacher()
         for teacher in school_data.teachers:
-            entries = solution.get_teacher_schedule(teacher.id)
+            entries = by_teacher.get(teacher.id, [])
             actual = count_teacher_actual_hours(solution.entries, teacher.id)
 
             # Springstunden gesamt und pro Tag
@@ -255,8 +256,9 @@ class QualityAnalyzer:
             if s.double_lesson_required or s.double_lesson_preferred
         }
 
+        by_class = solution.entries_by_class()
         for cls in school_data.classes:
-            entries = solution.get_class_schedule(cls.id)
+            entries = by_class.get(cls.id, [])
             total_hours = sum(1 for e in entries if not _is_duplicate_coupling(e, entries))
 
             # Stunden pro Tag
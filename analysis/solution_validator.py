@@ -31,7 +31,7 @@ class ValidationReport(BaseModel):
 
     def print_rich(self) -> None:
         """Gibt den Report formatiert über Rich aus."""
-        from rich.console import Console
+        from rich.console import Console, Group
         from rich.panel import Panel
         from rich.table import Table
         from rich import box
@@ -46,10 +46,10 @@ class ValidationReport(BaseModel):
             else "[bold red]✗ VERLETZUNGEN GEFUNDEN[/bold red]"
         )
         lines = [status, f"Fehler: {len(errors)} | Warnungen: {len(warnings)}"]
-        console.print(Panel("\n".join(lines), title="Lösung-Validierung", border_style="cyan"))
+        panel = Panel("\n".join(lines), title="Lösung-Validierung", border_style="cyan")
 
         if not self.violations:
-            console.print("[dim]Keine Verletzungen gefunden.[/dim]")
+            console.print(panel, "[dim]Keine Verletzungen gefunden.[/dim]")
             return
 
         table = Table(box=box.ROUNDED, show_lines=True)
@@ -66,7 +66,8 @@ class ValidationReport(BaseModel):
                 v.entity,
                 v.description,
             )
-        console.print(table)
+        # Panel und Tabelle in einem Durchgang rendern
+        console.print(Group(panel, table))
 
 
 class SolutionValidator:
@@ -236,7 +237,6 @@ class SolutionValidator:
     ) -> list[ValidationViolation]:
         """Prüft ob Deputat-Grenzen (min ≤ actual ≤ max) eingehalten werden."""
         violations: list[ValidationViolation] = []
-        teacher_map = {t.id: t for t in school_data.teachers}
 
         for teacher in school_data.teachers:
             actual = count_teacher_actual_hours(solution.entries, teacher.id)
@@ -299,11 +299,17 @@ class SolutionValidator:
     ) -> list[ValidationViolation]:
         """Kein Lehrer darf in gesperrten Slots eingeplant sein."""
         violations: list[ValidationViolation] = []
-        teacher_map = {t.id: t for t in school_data.teachers}
+        # Einmal alle Sperren als Set – statt Listen-Suche pro Eintrag
+        blocked = {
+            (t.id, day, slot_nr)
+            for t in school_data.teachers
+            for (day, slot_nr) in t.unavailable_slots
+        }
+        if not blocked:
+            return violations
 
         for e in solution.entries:
-            teacher = teacher_map.get(e.teacher_id)
-            if teacher and (e.day, e.slot_number) in teacher.unavailable_slots:
+            if (e.teacher_id, e.day, e.slot_number) in blocked:
                 violations.append(ValidationViolation(
                     severity="error",
                     constraint="unavailable_slot_violation",
@@ -0,0 +1 @@
+"""CLI-Befehle des Stundenplan-Generators (ein Modul pro Befehl, lazy geladen von main.py)."""
@@ -0,0 +1,69 @@
+"""Befehlsgruppe ``config``: Konfiguration anzeigen und bearbeiten."""
+
+from cli._common import click, console, _load_config_or_abort
+
+
+@click.group("config")
+def cmd_config():
+    """Konfiguration anzeigen oder bearbeiten."""
+
+
+@cmd_config.command("show")
+def config_show():
+    """Zeigt die aktuelle Konfiguration an."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    mgr, config = _load_config_or_abort()
+
+    header = Panel(
+        f"[bold]{config.school_name}[/bold]  |  "
+        f"{config.school_type.value}  |  {config.bundesland}",
+        title="Schulkonfiguration",
+        border_style="cyan",
+    )
+
+    tg = config.time_grid
+    sek1_slots = [s for s in tg.lesson_slots if not s.is_sek2_only]
+    table = Table(title="Zeitraster", box=box.ROUNDED)
+    table.add_column("Std.")
+    table.add_column("Beginn")
+    table.add_column("Ende")
+    for slot in sek1_slots:
+        table.add_row(str(slot.slot_number), slot.start_time, slot.end_time)
+
+    table2 = Table(title="Jahrgänge", box=box.ROUNDED)
+    table2.add_column("Jahrgang")
+    table2.add_column("Klassen")
+    table2.add_column("Soll-Stunden")
+    for g in config.grades.grades:
+        table2.add_row(str(g.grade), str(g.num_classes), str(g.weekly_hours_target))
+    table2.add_row("[bold]Gesamt[/bold]", f"[bold]{config.grades.total_classes}[/bold]", "")
+
+    tc = config.teachers
+    sc = config.solver
+    # Ein einziger Render-Durchlauf statt fünf separater console.print-Aufrufe
+    console.print(Group(
+        header,
+        table,
+        table2,
+        Text.from_markup(
+            f"\n[bold]Lehrkräfte:[/bold] {tc.total_count} gesamt | "
+            f"Vollzeit: {tc.vollzeit_deputat}h | "
+            f"Teilzeit-Anteil: {tc.teilzeit_percentage:.0%}"
+        ),
+        Text.from_markup(
+            f"[bold]Solver:[/bold] Zeitlimit {sc.time_limit_seconds}s | "
+            f"Gewicht Springstunden: {sc.weight_gaps}"
+        ),
+    ))
+
+
+@cmd_config.command("edit")
+def config_edit():
+    """Bearbeitet die Konfiguration interaktiv."""
+    mgr, config = _load_config_or_abort()
+    mgr.edit_interactive(config)
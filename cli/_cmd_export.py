@@ -0,0 +1,86 @@
+"""Befehl ``export``: Excel- und PDF-Export."""
+
+from pathlib import Path
+
+from cli._common import (
+    click,
+    console,
+    _maybe_status,
+    PATH_TYPE,
+    DEFAULT_DATA_JSON,
+    DEFAULT_SOLUTION_JSON,
+    DEFAULT_EXPORT_DIR,
+    _load_or_abort,
+)
+
+
+def _export_files(solution, school_data, fmt: str, output_dir: Path):
+    """Schreibt die Export-Dateien für fmt und liefert je Datei eine Erfolgsmeldung.
+
+    Excel und die beiden PDFs sind voneinander unabhängig und lesen
+    solution/school_data nur; zlib-Kompression und Dateischreiben geben
+    den GIL frei, daher laufen die Exporte in einem Thread-Pool parallel.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from export import ExcelExporter, PdfExporter
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = []   # (Future, Erfolgsmeldung)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        if fmt in ("excel", "both"):
+            xlsx_path = output_dir / "stundenplan.xlsx"
+            jobs.append((
+                pool.submit(ExcelExporter(solution, school_data).export, xlsx_path),
+                f"[green]✓[/green] Excel gespeichert: {xlsx_path}",
+            ))
+
+        if fmt in ("pdf", "both"):
+            pdf_classes  = output_dir / "klassen_stundenplaene.pdf"
+            pdf_teachers = output_dir / "lehrer_stundenplaene.pdf"
+            exporter = PdfExporter(solution, school_data)
+            jobs.append((
+                pool.submit(exporter.export_class_schedules, pdf_classes),
+                f"[green]✓[/green] Klassen-PDF: {pdf_classes}",
+            ))
+            jobs.append((
+                pool.submit(exporter.export_teacher_schedules, pdf_teachers),
+                f"[green]✓[/green] Lehrer-PDF:  {pdf_teachers}",
+            ))
+
+        for future, message in jobs:
+            future.result()
+            yield message
+
+
+@click.command("export")
+@click.option(
+    "--format", "fmt", default="both",
+    type=click.Choice(["excel", "pdf", "both"]),
+    help="Ausgabeformat: excel, pdf oder both.",
+)
+@click.option("--solution-path", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              help="Pfad zur solution.json.")
+@click.option("--data-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad zur school_data.json.")
+@click.option("--output-dir", default=DEFAULT_EXPORT_DIR, type=PATH_TYPE,
+              help="Ausgabeverzeichnis für Export-Dateien.")
+def cmd_export(fmt: str, solution_path: Path, data_path: Path, output_dir: Path):
+    """[bold]Exportiert den Stundenplan[/bold] als Excel-Arbeitsmappe und/oder PDF.
+
+    Die Ausgabe enthält je ein Blatt pro [cyan]Klasse[/cyan],
+    [cyan]Lehrer[/cyan] und [cyan]Fachraum[/cyan] sowie eine
+    Übersichtsseite mit Deputat-Statistiken.
+    """
+    from models.school_data import SchoolData
+    from solver.scheduler import ScheduleSolution
+
+    console.print(f"[bold]Lade Daten...[/bold]")
+    tip = "Tipp: [bold]python main.py solve --small[/bold] erzeugt eine Beispiel-Lösung."
+    solution    = _load_or_abort(ScheduleSolution.load_json, solution_path, "Lösung nicht gefunden", tip)
+    school_data = _load_or_abort(SchoolData.load_json, data_path, "Schuldaten nicht gefunden", tip)
+
+    with _maybe_status("[green]Export-Dateien werden erstellt...[/green]"):
+        for message in _export_files(solution, school_data, fmt, output_dir):
+            console.print(message)
+
+    console.print(f"\n[bold green]Export abgeschlossen.[/bold green] → {output_dir}/")
@@ -0,0 +1,59 @@
+"""Befehl ``generate``: Fake-Daten erzeugen."""
+
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, DEFAULT_DATA_JSON, _load_config_or_abort
+
+
+def _write_summary_txt(data) -> Path:
+    """Schreibt die Text-Zusammenfassung (rückwärtskompatibel) und gibt den Pfad zurück."""
+    txt_path = Path("output/fake_data_summary.txt")
+    txt_path.parent.mkdir(parents=True, exist_ok=True)
+    parts = [data.summary(), "\n\n=== Lehrkräfte ===\n"]
+    parts.extend(
+        f"  {t.id:4s} {t.name:35s} {t.deputat_min}-{t.deputat_max}h  {t.subjects}\n"
+        for t in data.teachers
+    )
+    parts.append("\n=== Klassen ===\n")
+    parts.extend(
+        f"  {c.id:4s}  {c.total_weekly_hours}h/Woche\n"
+        for c in data.classes
+    )
+    txt_path.write_text("".join(parts), encoding="utf-8")
+    return txt_path
+
+
+@click.command("generate")
+@click.option("--seed", default=42, help="Zufalls-Seed für reproduzierbare Daten.")
+@click.option("--export-json", is_flag=True, default=False,
+              help="Datensatz als JSON speichern.")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad für JSON-Export.")
+@click.option("--validate", "run_validate", is_flag=True, default=True,
+              help="Machbarkeits-Check nach Generierung.")
+def cmd_generate(seed: int, export_json: bool, json_path: Path, run_validate: bool):
+    """[bold]Erzeugt realistische Testdaten[/bold] (Lehrkräfte, Klassen, Räume, Kopplungen).
+
+    Enthält absichtliche Engpässe (Chemie-Mangel, Freitag-Cluster,
+    Fachraum-Limits) für einen realistischen Solver-Test.
+    """
+    mgr, config = _load_config_or_abort()
+    from data.fake_data import FakeDataGenerator
+
+    console.print("[bold]Testdaten werden generiert...[/bold]")
+    gen = FakeDataGenerator(config, seed=seed)
+    data = gen.generate()
+    gen.print_summary(data)
+
+    console.print(f"\n[dim]{data.summary()}[/dim]")
+
+    if run_validate:
+        report = data.validate_feasibility()
+        report.print_rich()
+
+    if export_json:
+        data.save_json(json_path)
+        console.print(f"[green]✓[/green] JSON gespeichert: {json_path}")
+
+    txt_path = _write_summary_txt(data)
+    console.print(f"[green]✓[/green] Zusammenfassung gespeichert: {txt_path}")
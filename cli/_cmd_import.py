@@ -0,0 +1,33 @@
+"""Befehl ``import``: Schuldaten aus Excel importieren."""
+
+import sys
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, DEFAULT_DATA_JSON, _load_config_or_abort
+
+
+@click.command("import")
+@click.argument("datei", type=click.Path(exists=True, path_type=Path))
+@click.option("--save-json", is_flag=True, default=False,
+              help="Importierte Daten als JSON speichern.")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad für JSON-Export.")
+def cmd_import(datei: Path, save_json: bool, json_path: Path):
+    """Importiert Schuldaten aus einer Excel-Datei."""
+    mgr, config = _load_config_or_abort()
+    from data.excel_import import import_from_excel, ExcelImportError
+
+    console.print(f"[bold]Importiere:[/bold] {datei}")
+    try:
+        school_data, report = import_from_excel(datei, config)
+    except ExcelImportError as e:
+        console.print(f"[red bold]Import fehlgeschlagen:[/red bold]\n{e}")
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] Import erfolgreich!")
+    console.print(f"\n{school_data.summary()}")
+    report.print_rich()
+
+    if save_json:
+        school_data.save_json(json_path)
+        console.print(f"[green]✓[/green] Daten gespeichert: {json_path}")
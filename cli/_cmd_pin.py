@@ -0,0 +1,96 @@
+"""Befehlsgruppe ``pin``: Stunden fixieren, entfernen, auflisten."""
+
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, _load_pins, DEFAULT_PINS_JSON
+
+_DAY_NAMES = ("Mo", "Di", "Mi", "Do", "Fr")
+
+
+@click.group("pin")
+def cmd_pin():
+    """Gepinnte Stunden verwalten (fixierte Unterrichtsstunden)."""
+
+
+@cmd_pin.command("add")
+@click.argument("lehrer_id")
+@click.argument("klasse")
+@click.argument("fach")
+@click.argument("tag", type=int)
+@click.argument("slot", type=int)
+@click.option("--pins-path", default=DEFAULT_PINS_JSON, type=PATH_TYPE,
+              help="Pfad zur Pins-JSON-Datei.")
+def pin_add(lehrer_id: str, klasse: str, fach: str, tag: int, slot: int, pins_path: Path):
+    """Setzt einen Pin: Lehrer-ID Klasse Fach Tag(0-4) Slot(1-7).
+
+    Beispiel: python main.py pin add MUE 5a Mathematik 0 1
+    """
+    from solver.pinning import PinManager, PinnedLesson
+
+    pm = _load_pins(pins_path) or PinManager()
+
+    pin = PinnedLesson(
+        teacher_id=lehrer_id,
+        class_id=klasse,
+        subject=fach,
+        day=tag,
+        slot_number=slot,
+    )
+    pm.add_pin(pin)
+    pm.save_json(pins_path)
+
+    day_str = _DAY_NAMES[tag] if 0 <= tag < 5 else str(tag)
+    console.print(
+        f"[green]✓[/green] Pin gesetzt: "
+        f"[bold]{lehrer_id.upper()}[/bold] unterrichtet "
+        f"[bold]{klasse}[/bold] ({fach}) am [bold]{day_str} Std.{slot}[/bold]"
+    )
+
+
+@cmd_pin.command("remove")
+@click.argument("lehrer_id")
+@click.argument("tag", type=int)
+@click.argument("slot", type=int)
+@click.option("--pins-path", default=DEFAULT_PINS_JSON, type=PATH_TYPE,
+              help="Pfad zur Pins-JSON-Datei.")
+def pin_remove(lehrer_id: str, tag: int, slot: int, pins_path: Path):
+    """Entfernt einen Pin: Lehrer-ID Tag(0-4) Slot(1-7)."""
+    pm = _load_pins(pins_path)
+    if pm is None:
+        console.print("[yellow]Keine Pins-Datei gefunden.[/yellow]")
+        return
+
+    removed = pm.remove_pin(lehrer_id, tag, slot)
+    if removed:
+        pm.save_json(pins_path)
+        console.print(f"[green]✓[/green] Pin entfernt: {lehrer_id.upper()} Tag={tag} Slot={slot}")
+    else:
+        console.print(f"[yellow]Kein passender Pin gefunden für {lehrer_id.upper()} Tag={tag} Slot={slot}[/yellow]")
+
+
+@cmd_pin.command("list")
+@click.option("--pins-path", default=DEFAULT_PINS_JSON, type=PATH_TYPE,
+              help="Pfad zur Pins-JSON-Datei.")
+def pin_list(pins_path: Path):
+    """Zeigt alle gesetzten Pins an."""
+    from rich.table import Table
+    from rich import box
+
+    pm = _load_pins(pins_path)
+    pins = pm.get_pins() if pm is not None else []
+    if not pins:
+        console.print("[dim]Keine Pins vorhanden.[/dim]")
+        return
+
+    table = Table(title=f"Gepinnte Stunden ({len(pins)})", box=box.ROUNDED)
+    table.add_column("Lehrer")
+    table.add_column("Klasse")
+    table.add_column("Fach")
+    table.add_column("Tag")
+    table.add_column("Slot", justify="right")
+
+    for pin in pins:
+        day_str = _DAY_NAMES[pin.day] if 0 <= pin.day < 5 else str(pin.day)
+        table.add_row(pin.teacher_id, pin.class_id, pin.subject, day_str, str(pin.slot_number))
+
+    console.print(table)
@@ -0,0 +1,58 @@
+"""Befehl ``quality``: Qualitätsbericht."""
+
+import sys
+from pathlib import Path
+
+from cli._common import (
+    click,
+    console,
+    _maybe_status,
+    PATH_TYPE,
+    DEFAULT_DATA_JSON,
+    DEFAULT_SOLUTION_JSON,
+    DEFAULT_EXPORT_DIR,
+)
+
+
+@click.command("quality")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad zur school_data.json.")
+@click.option("--solution-path", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              help="Pfad zur solution.json.")
+@click.option(
+    "--format", "fmt", default="console",
+    type=click.Choice(["console", "excel", "both"]),
+    help="Ausgabeformat: console, excel oder both.",
+)
+@click.option("--output-dir", default=DEFAULT_EXPORT_DIR, type=PATH_TYPE,
+              help="Ausgabeverzeichnis für Excel-Export.")
+def cmd_quality(json_path: Path, solution_path: Path, fmt: str, output_dir: Path):
+    """Erstellt einen Qualitätsbericht (Lehrer-Auslastung, Klassen-Qualität, KPIs)."""
+    from models.school_data import SchoolData
+    from solver.scheduler import ScheduleSolution
+    from analysis.quality_report import QualityAnalyzer
+
+    for p, label in [(solution_path, "Lösung"), (json_path, "Schuldaten")]:
+        if not p.exists():
+            console.print(f"[red]{label} nicht gefunden: {p}[/red]")
+            sys.exit(1)
+
+    console.print("[bold]Lade Daten...[/bold]")
+    solution    = ScheduleSolution.load_json(solution_path)
+    school_data = SchoolData.load_json(json_path)
+
+    analyzer = QualityAnalyzer()
+    with _maybe_status("[green]Analysiere Lösung...[/green]"):
+        report = analyzer.analyze(solution, school_data)
+
+    if fmt in ("console", "both"):
+        analyzer.print_rich(report, school_data.config)
+
+    if fmt in ("excel", "both"):
+        from export.excel_export import ExcelExporter
+        output_dir.mkdir(parents=True, exist_ok=True)
+        xlsx_path = output_dir / "stundenplan.xlsx"
+        console.print(f"[bold]Excel-Export mit Qualitätsblatt:[/bold] {xlsx_path}")
+        with _maybe_status("[green]Excel wird erstellt...[/green]"):
+            ExcelExporter(solution, school_data).export(xlsx_path, quality_report=report)
+        console.print(f"[green]✓[/green] Excel gespeichert: {xlsx_path}")
@@ -0,0 +1,93 @@
+"""Befehl ``run``: Pipeline generate → solve → export."""
+
+import sys
+from pathlib import Path
+
+from cli._common import (
+    click,
+    console,
+    PATH_TYPE,
+    _maybe_status,
+    _setup_logging,
+    _load_config_or_abort,
+    _load_pins,
+    DEFAULT_DATA_JSON,
+    DEFAULT_SOLUTION_JSON,
+    DEFAULT_PINS_JSON,
+    DEFAULT_EXPORT_DIR,
+)
+
+
+@click.command("run")
+@click.option("--seed", default=42, help="Zufalls-Seed.")
+@click.option("--no-soft", is_flag=True, default=False,
+              help="Nur harte Constraints (schneller).")
+@click.option(
+    "--format", "fmt", default="both",
+    type=click.Choice(["excel", "pdf", "both"]),
+    help="Ausgabeformat für den Export.",
+)
+@click.option("--output-dir", default=DEFAULT_EXPORT_DIR, type=PATH_TYPE,
+              help="Ausgabeverzeichnis für Export-Dateien.")
+def cmd_run(seed: int, no_soft: bool, fmt: str, output_dir: Path):
+    """[bold]Komplette Pipeline:[/bold] [cyan]generate → solve → export[/cyan].
+
+    Erzeugt Testdaten, berechnet den Stundenplan und exportiert das
+    Ergebnis in einem einzigen Schritt.
+    """
+    from rich.panel import Panel
+    from data.fake_data import FakeDataGenerator
+    from solver.scheduler import ScheduleSolver
+    from solver.pinning import PinManager
+    from cli._cmd_generate import _write_summary_txt
+    from cli._cmd_export import _export_files
+
+    # Alle Schritte laufen im selben Prozess: SchoolData und Lösung werden im
+    # Speicher weitergereicht; die JSON-Dateien werden nur für spätere
+    # Einzelbefehle (show, export, ...) geschrieben.
+
+    # Aufeinanderfolgende Meldungen ohne Arbeit dazwischen werden jeweils
+    # in einem console.print ausgegeben.
+
+    # 1. generate
+    console.print(
+        Panel("[bold]Pipeline: generate → solve → export[/bold]", border_style="cyan"),
+        "\n[bold cyan]Schritt 1:[/bold cyan] Testdaten generieren...",
+    )
+    mgr, config = _load_config_or_abort()
+    data = FakeDataGenerator(config, seed=seed).generate()
+    data.save_json(DEFAULT_DATA_JSON)
+    _write_summary_txt(data)
+
+    # 2. solve
+    console.print(
+        "[green]✓[/green] Testdaten erstellt.\n"
+        "\n[bold cyan]Schritt 2:[/bold cyan] Solver starten..."
+    )
+    _setup_logging()
+    report = data.validate_feasibility()
+    if not report.is_feasible:
+        report.print_rich()
+        console.print("[red]solve fehlgeschlagen:[/red] Machbarkeits-Check nicht bestanden.")
+        sys.exit(1)
+    pin_manager = _load_pins(DEFAULT_PINS_JSON) or PinManager()
+    with _maybe_status("[bold green]Solver läuft...[/bold green]"):
+        solution = ScheduleSolver(data).solve(
+            pins=pin_manager.get_pins(), use_soft=not no_soft,
+        )
+    if solution.solver_status not in ("OPTIMAL", "FEASIBLE"):
+        console.print(f"[red]solve fehlgeschlagen:[/red] Status {solution.solver_status}")
+        sys.exit(1)
+    solution.save_json(DEFAULT_SOLUTION_JSON)
+
+    # 3. export
+    console.print(
+        "[green]✓[/green] Lösung berechnet.\n"
+        "\n[bold cyan]Schritt 3:[/bold cyan] Export..."
+    )
+    for _ in _export_files(solution, data, fmt, output_dir):
+        pass
+    console.print(
+        "[green]✓[/green] Export abgeschlossen.\n"
+        f"\n[bold green]Pipeline erfolgreich![/bold green] → {output_dir}/"
+    )
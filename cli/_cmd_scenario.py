@@ -0,0 +1,107 @@
+"""Befehlsgruppe ``scenario``: Szenarien speichern, laden, auflisten, prüfen."""
+
+import os
+
+from cli._common import click, console, _load_config_or_abort
+
+
+def _check_scenario(name: str, seed: int = 42) -> tuple[str, bool, int, int]:
+    """Generiert Testdaten für ein Szenario und führt den Machbarkeits-Check aus.
+
+    Modul-Ebene, damit die Funktion im Prozess-Pool gepickelt werden kann.
+    """
+    from config.manager import ConfigManager
+    from data.fake_data import FakeDataGenerator
+
+    config = ConfigManager().load_scenario(name)
+    data = FakeDataGenerator(config, seed=seed).generate()
+    report = data.validate_feasibility()
+    return name, report.is_feasible, len(report.errors), len(report.warnings)
+
+
+@click.group("scenario")
+def cmd_scenario():
+    """Szenarien verwalten (speichern, laden, auflisten)."""
+
+
+@cmd_scenario.command("save")
+@click.argument("name")
+@click.option("--description", "-d", default="", help="Beschreibung des Szenarios.")
+def scenario_save(name: str, description: str):
+    """Speichert die aktuelle Konfiguration als Szenario."""
+    mgr, config = _load_config_or_abort()
+    mgr.save_scenario(config, name, description)
+
+
+@cmd_scenario.command("load")
+@click.argument("name")
+def scenario_load(name: str):
+    """Lädt ein gespeichertes Szenario als aktive Konfiguration."""
+    from config.manager import ConfigManager
+    mgr = ConfigManager()
+    config = mgr.load_scenario(name)
+    mgr.save(config)
+    console.print(f"[green]✓[/green] Szenario '{name}' als aktive Config gesetzt.")
+
+
+@cmd_scenario.command("list")
+def scenario_list():
+    """Listet alle gespeicherten Szenarien auf."""
+    from rich.table import Table
+    from rich import box
+    from config.manager import ConfigManager
+    mgr = ConfigManager()
+    scenarios = mgr.list_scenarios()
+
+    if not scenarios:
+        console.print("[dim]Keine Szenarien vorhanden.[/dim]")
+        return
+
+    table = Table(title="Gespeicherte Szenarien", box=box.ROUNDED)
+    table.add_column("Name", style="bold")
+    table.add_column("Erstellt")
+    table.add_column("Beschreibung")
+    for s in scenarios:
+        table.add_row(s["name"], s.get("created", ""), s.get("description", ""))
+    console.print(table)
+
+
+@cmd_scenario.command("check")
+@click.option("--seed", default=42, show_default=True, help="Zufalls-Seed für die Testdaten.")
+def scenario_check(seed: int):
+    """Prüft alle Szenarien auf Machbarkeit (Testdaten je Szenario)."""
+    from functools import partial
+    from rich.table import Table
+    from rich import box
+    from config.manager import ConfigManager
+
+    names = [s["name"] for s in ConfigManager().list_scenarios()]
+    if not names:
+        console.print("[dim]Keine Szenarien vorhanden.[/dim]")
+        return
+
+    worker = partial(_check_scenario, seed=seed)
+    workers = min(len(names), os.cpu_count() or 1)
+    if workers > 1:
+        # Szenarien sind unabhängig und rein CPU-gebunden → eigene Prozesse.
+        # "spawn" statt fork, damit keine Threads des Elternprozesses (Rich)
+        # mitkopiert werden; jede Aufgabe ist grob genug für chunksize=1.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            results = list(executor.map(worker, names))
+    else:
+        results = list(map(worker, names))
+
+    table = Table(title="Machbarkeit der Szenarien", box=box.ROUNDED)
+    table.add_column("Name", style="bold")
+    table.add_column("Status")
+    table.add_column("Fehler", justify="right")
+    table.add_column("Warnungen", justify="right")
+    for name, feasible, n_err, n_warn in results:
+        status = "[green]✓ lösbar[/green]" if feasible else "[red]✗ nicht lösbar[/red]"
+        table.add_row(name, status, str(n_err), str(n_warn))
+    console.print(table)
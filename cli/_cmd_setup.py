@@ -0,0 +1,31 @@
+"""Befehl ``setup``: Ersteinrichtung per Wizard."""
+
+import sys
+
+from cli._common import click, console
+
+
+@click.command("setup")
+def cmd_setup():
+    """Ersteinrichtung: Schulkonfiguration mit dem Setup-Wizard anlegen."""
+    from config.wizard import run_wizard
+    from config.manager import ConfigManager
+
+    mgr = ConfigManager()
+    if not mgr.first_run_check():
+        console.print(
+            "[yellow]Eine Konfiguration existiert bereits.[/yellow]\n"
+            "Verwenden Sie [bold]python main.py config edit[/bold] zum Bearbeiten."
+        )
+        # Ohne Terminal (CI/cron) keine Rückfrage – vorhandene Konfiguration bleibt
+        if not sys.stdin.isatty():
+            console.print("[yellow]Nicht-interaktiv, abgebrochen.[/yellow]")
+            return
+        if not click.confirm("Trotzdem neu einrichten?", default=False):
+            return
+
+    config = run_wizard()
+    if config is not None:
+        mgr.save(config)
+        console.print("[bold green]Einrichtung abgeschlossen![/bold green]")
+        console.print("Führen Sie jetzt [bold]python main.py generate[/bold] aus.")
@@ -0,0 +1,286 @@
+"""Befehl ``show``: Stundenplan einer Klasse oder Lehrkraft im Terminal."""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, DEFAULT_DATA_JSON, DEFAULT_SOLUTION_JSON
+
+
+# Rich-Stile für Fachkategorien (statt Hex: Näherungswerte als rich-Farbnamen)
+_CATEGORY_STYLE: dict[str, str] = {
+    "hauptfach":    "bold blue",
+    "sprache":      "bold yellow",
+    "nw":           "bold green",
+    "musisch":      "bold magenta",
+    "sport":        "bold red",
+    "gesellschaft": "bold cyan",
+    "wpf":          "dim white",
+    "sonstig":      "dim white",
+}
+
+
+def _subject_style(subject_name: str, subjects) -> str:
+    """Gibt einen rich-Stil für ein Fach zurück."""
+    for s in subjects:
+        if s.name == subject_name:
+            return _CATEGORY_STYLE.get(s.category, "dim white")
+    return "dim white"
+
+
+@lru_cache(maxsize=4096)
+def _schedule_cell(subject: str, style: str, detail: str, room: str | None):
+    """Baut eine Stundenplan-Zelle als rich-Text (ohne Markup-Parsing).
+
+    Gleiche (Fach, Stil, Detail, Raum)-Kombinationen wiederholen sich im Raster
+    und werden daher nur einmal erzeugt.
+    """
+    from rich.text import Text
+
+    cell = Text.assemble((subject, style), "\n", (detail, "dim"))
+    if room:
+        cell.append("\n")
+        cell.append(room, style="dim")
+    return cell
+
+
+@click.command("show")
+@click.argument("kennung")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              show_default=True, help="Pfad zur SchoolData-JSON.")
+@click.option("--solution-path", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              show_default=True, help="Pfad zur Lösungs-JSON.")
+def cmd_show(kennung: str, json_path: Path, solution_path: Path):
+    """[bold]Zeigt einen Stundenplan im Terminal an.[/bold]
+
+    [bold magenta]KENNUNG[/bold magenta] ist entweder eine
+    [cyan]Klassen-ID[/cyan] (z.B. [bold]5a[/bold], [bold]10c[/bold])
+    oder ein [cyan]Lehrer-Kürzel[/cyan] (z.B. [bold]MÜL[/bold]).
+    Springstunden werden [red]rot[/red] hinterlegt.
+    """
+    from models.school_data import SchoolData
+    from solver.scheduler import ScheduleSolution
+    from export.helpers import (
+        build_time_grid_rows, get_coupling_label, count_gaps,
+        count_teacher_actual_hours,
+    )
+    from config.schema import LessonSlot, PauseSlot
+
+    if not json_path.exists() or not solution_path.exists():
+        console.print(
+            "[red]Keine gespeicherte Lösung gefunden.[/red]\n"
+            "Führen Sie zuerst [bold]python main.py solve[/bold] aus."
+        )
+        sys.exit(1)
+
+    school_data = SchoolData.load_json(json_path)
+    solution = ScheduleSolution.load_json(solution_path)
+    config = solution.config_snapshot
+
+    # ── Identifiziere Modus: Klasse oder Lehrer? ─────────────────────────────
+    class_ids = {c.id for c in school_data.classes}
+    teacher_ids = {t.id for t in school_data.teachers}
+
+    # Suche case-insensitive
+    kennung_lower = kennung.lower()
+    matched_class = next(
+        (cid for cid in class_ids if cid.lower() == kennung_lower), None
+    )
+    matched_teacher = next(
+        (tid for tid in teacher_ids if tid.lower() == kennung_lower), None
+    )
+
+    if matched_class:
+        _show_class_schedule(
+            matched_class, solution, school_data, config,
+            build_time_grid_rows, get_coupling_label, LessonSlot, PauseSlot,
+        )
+    elif matched_teacher:
+        _show_teacher_schedule(
+            matched_teacher, solution, school_data, config,
+            build_time_grid_rows, count_gaps,
+            count_teacher_actual_hours, LessonSlot, PauseSlot,
+        )
+    else:
+        console.print(
+            f"[red]Kennung '[bold]{kennung}[/bold]' nicht gefunden.[/red]\n"
+            f"Gültige Klassen: {', '.join(sorted(class_ids)[:10])} ...\n"
+            f"Gültige Lehrer:  {', '.join(sorted(teacher_ids)[:10])} ..."
+        )
+        sys.exit(1)
+
+
+def _show_class_schedule(
+    class_id, solution, school_data, config,
+    build_time_grid_rows, get_coupling_label, LessonSlot, PauseSlot,
+) -> None:
+    """Zeigt den Stundenplan einer Klasse als rich-Tabelle."""
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    empty_cell = Text("—", style="dim")
+    cls = next(c for c in school_data.classes if c.id == class_id)
+    entries = solution.get_class_schedule(class_id)
+
+    # Index: (day, slot_number) → entry
+    slot_map: dict[tuple[int, int], object] = {}
+    for e in entries:
+        slot_map[(e.day, e.slot_number)] = e
+
+    day_names = config.time_grid.day_names
+    time_rows = build_time_grid_rows(config, max_slot=cls.max_slot)
+
+    table = Table(
+        title=f"Stundenplan Klasse [bold]{class_id}[/bold]",
+        box=box.ROUNDED,
+        show_lines=True,
+        header_style="bold white on blue",
+    )
+    table.add_column("Std.", width=5, justify="center")
+    table.add_column("Zeit", width=13, justify="center")
+    for d in day_names:
+        table.add_column(d, width=18, justify="center")
+
+    for row in time_rows:
+        if isinstance(row, PauseSlot):
+            table.add_row(
+                "—", row.label,
+                *["─" * 10] * len(day_names),
+                style="dim",
+            )
+            continue
+
+        slot = row  # LessonSlot
+        cells = []
+        for day_idx in range(len(day_names)):
+            entry = slot_map.get((day_idx, slot.slot_number))
+            if entry is None:
+                cells.append(empty_cell)
+            else:
+                label = get_coupling_label(entry, school_data)
+                subj = entry.subject
+                if label:
+                    abbrev = label[:3].lower() + "."
+                    subj = f"{subj} ({abbrev})"
+                style = _subject_style(entry.subject, school_data.subjects)
+                cells.append(
+                    _schedule_cell(subj, style, entry.teacher_id, entry.room)
+                )
+
+        table.add_row(
+            str(slot.slot_number),
+            f"{slot.start_time}–{slot.end_time}",
+            *cells,
+        )
+
+    console.print(table)
+    console.print(
+        f"[dim]Klasse {class_id} | Jahrgang {cls.grade} | "
+        f"Soll: {cls.total_weekly_hours}h/Woche[/dim]"
+    )
+
+
+def _show_teacher_schedule(
+    teacher_id, solution, school_data, config,
+    build_time_grid_rows, count_gaps, count_teacher_actual_hours,
+    LessonSlot, PauseSlot,
+) -> None:
+    """Zeigt den Stundenplan eines Lehrers als rich-Tabelle."""
+    from rich.table import Table
+    from rich.text import Text
+    from rich import box
+
+    empty_cell = Text("—", style="dim")
+    gap_cell = Text("↕ Springstunde", style="bold red")
+    teacher = next(t for t in school_data.teachers if t.id == teacher_id)
+    entries = solution.get_teacher_schedule(teacher_id)
+
+    # Bestimme max genutzten Slot
+    used_slots = [e.slot_number for e in entries]
+    max_slot = max(used_slots) if used_slots else config.time_grid.sek1_max_slot
+    time_rows = build_time_grid_rows(config, max_slot=max_slot)
+
+    # Index: (day, slot_number) → entry
+    # Kopplungen können mehrere Entries pro Slot haben → nimm ersten
+    slot_map: dict[tuple[int, int], object] = {}
+    for e in entries:
+        key = (e.day, e.slot_number)
+        if key not in slot_map:
+            slot_map[key] = e
+
+    day_names = config.time_grid.day_names
+
+    # Ermittle Springstunden pro Tag für Farbmarkierung
+    from collections import defaultdict
+    by_day: dict[int, list[int]] = defaultdict(list)
+    for e in entries:
+        by_day[e.day].append(e.slot_number)
+    gap_slots: set[tuple[int, int]] = set()
+    for day_idx, slots in by_day.items():
+        unique = sorted(set(slots))
+        if len(unique) > 1:
+            first, last = unique[0], unique[-1]
+            for h in range(first + 1, last):
+                if h not in unique:
+                    gap_slots.add((day_idx, h))
+
+    ist_hours = count_teacher_actual_hours(entries, teacher_id)
+    gaps_total = count_gaps(entries)
+
+    table = Table(
+        title=(
+            f"Stundenplan [bold]{teacher_id}[/bold] — "
+            f"{teacher.name} | "
+            f"Deputat: {teacher.deputat_min}–{teacher.deputat_max}h | "
+            f"Ist: {ist_hours}h | Springstd: {gaps_total}"
+        ),
+        box=box.ROUNDED,
+        show_lines=True,
+        header_style="bold white on blue",
+    )
+    table.add_column("Std.", width=5, justify="center")
+    table.add_column("Zeit", width=13, justify="center")
+    for d in day_names:
+        table.add_column(d, width=18, justify="center")
+
+    for row in time_rows:
+        if isinstance(row, PauseSlot):
+            table.add_row(
+                "—", row.label,
+                *["─" * 10] * len(day_names),
+                style="dim",
+            )
+            continue
+
+        slot = row
+        cells = []
+        row_style = None
+        for day_idx in range(len(day_names)):
+            key = (day_idx, slot.slot_number)
+            entry = slot_map.get(key)
+            if entry is None:
+                if key in gap_slots:
+                    cells.append(gap_cell)
+                    row_style = "on dark_red"
+                else:
+                    cells.append(empty_cell)
+            else:
+                style = _subject_style(entry.subject, school_data.subjects)
+                cells.append(
+                    _schedule_cell(entry.subject, style, entry.class_id, entry.room)
+                )
+
+        table.add_row(
+            str(slot.slot_number),
+            f"{slot.start_time}–{slot.end_time}",
+            *cells,
+            style=row_style,
+        )
+
+    console.print(table)
+    subjects_str = ", ".join(sorted(set(teacher.subjects)))
+    console.print(
+        f"[dim]Fächer: {subjects_str} | "
+        f"{'Teilzeit' if teacher.is_teilzeit else 'Vollzeit'}[/dim]"
+    )
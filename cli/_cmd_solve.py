@@ -0,0 +1,346 @@
+"""Befehl ``solve``: Stundenplan berechnen (inkl. Mini-Datensatz für --small)."""
+
+import sys
+import re
+
+from cli._common import (
+    click,
+    console,
+    _maybe_status,
+    PATH_TYPE,
+    _setup_logging,
+    _load_pins,
+    DEFAULT_DATA_JSON,
+    DEFAULT_SOLUTION_JSON,
+    DEFAULT_PINS_JSON,
+    _load_or_abort,
+)
+
+
+def _build_mini_school_data():
+    """Erzeugt minimalen Datensatz (2 Klassen 5a+7a, 10 Lehrer) für schnelle Tests."""
+    from operator import itemgetter
+    from config.schema import (
+        SchoolConfig, GradeConfig, GradeDefinition, SchoolType,
+        TeacherConfig, SolverConfig,
+    )
+    from config.defaults import (
+        default_time_grid, default_rooms,
+        SUBJECT_METADATA, STUNDENTAFEL_GYMNASIUM_SEK1,
+    )
+    from models.school_data import SchoolData
+    from models.subject import Subject
+    from models.room import Room
+    from models.teacher import Teacher
+    from models.school_class import SchoolClass
+    from models.coupling import Coupling, CouplingGroup
+
+    config = SchoolConfig(
+        school_name="Mini-Test",
+        school_type=SchoolType.GYMNASIUM,
+        bundesland="NRW",
+        time_grid=default_time_grid(),
+        grades=GradeConfig(grades=[
+            GradeDefinition(grade=5, num_classes=1, weekly_hours_target=30),
+            GradeDefinition(grade=7, num_classes=1, weekly_hours_target=32),
+        ]),
+        rooms=default_rooms(),
+        teachers=TeacherConfig(
+            total_count=10,
+            vollzeit_deputat=26,
+            teilzeit_percentage=0.0,
+            deputat_min_fraction=0.80,
+        ),
+        solver=SolverConfig(time_limit_seconds=60, num_workers=4),
+    )
+    sek1_max = config.time_grid.sek1_max_slot
+
+    subject_fields = itemgetter(
+        "short", "category", "is_hauptfach", "room", "double_required", "double_preferred",
+    )
+    subjects = []
+    for n, m in SUBJECT_METADATA.items():
+        short, category, hauptfach, room, dbl_req, dbl_pref = subject_fields(m)
+        subjects.append(Subject(
+            name=n, short_name=short, category=category,
+            is_hauptfach=hauptfach, requires_special_room=room,
+            double_lesson_required=dbl_req, double_lesson_preferred=dbl_pref,
+        ))
+    rooms = []
+    for rd in config.rooms.special_rooms:
+        pfx = rd.room_type[:2].upper()
+        for i in range(1, rd.count + 1):
+            rooms.append(Room(id=f"{pfx}{i}", room_type=rd.room_type,
+                              name=f"{rd.display_name} {i}"))
+    classes = [
+        SchoolClass(id="5a", grade=5, label="a",
+                    curriculum={s: h for s, h in STUNDENTAFEL_GYMNASIUM_SEK1[5].items() if h > 0},
+                    max_slot=sek1_max),
+        SchoolClass(id="7a", grade=7, label="a",
+                    curriculum={s: h for s, h in STUNDENTAFEL_GYMNASIUM_SEK1[7].items() if h > 0},
+                    max_slot=sek1_max),
+    ]
+    dep_max = 9  # 10 × 9h = 90h >> Gesamtbedarf (62h inkl. Kopplung) → Solver-Spielraum
+    dep_min = 4  # T08/T09 (Kopplung-only) bekommen max 4h Kopplungsstunden → dep_min ≤ 4
+    teachers = [
+        Teacher(id="T01", name="Müller, Anna",   subjects=["Deutsch", "Geschichte"],  deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T02", name="Schmidt, Hans",  subjects=["Mathematik", "Physik"],   deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T03", name="Weber, Eva",     subjects=["Englisch", "Politik"],    deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T04", name="Becker, Klaus",  subjects=["Biologie", "Erdkunde"],   deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T05", name="Koch, Lisa",     subjects=["Kunst", "Musik"],         deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T06", name="Wagner, Tom",    subjects=["Sport", "Chemie"],        deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T07", name="Braun, Sara",    subjects=["Latein", "Deutsch"],      deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T08", name="Wolf, Peter",    subjects=["Religion", "Ethik"],      deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T09", name="Neumann, Maria", subjects=["Religion", "Ethik"],      deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+        Teacher(id="T10", name="Schulz, Ralf",   subjects=["Mathematik", "Deutsch"],  deputat_max=dep_max, deputat_min=dep_min, max_hours_per_day=6, max_gaps_per_day=2),
+    ]
+    couplings = [
+        Coupling(id="reli_5", coupling_type="reli_ethik", involved_class_ids=["5a"],
+                 groups=[CouplingGroup(group_name="evangelisch", subject="Religion", hours_per_week=2),
+                         CouplingGroup(group_name="ethik", subject="Ethik", hours_per_week=2)],
+                 hours_per_week=2, cross_class=True),
+        Coupling(id="reli_7", coupling_type="reli_ethik", involved_class_ids=["7a"],
+                 groups=[CouplingGroup(group_name="evangelisch", subject="Religion", hours_per_week=2),
+                         CouplingGroup(group_name="ethik", subject="Ethik", hours_per_week=2)],
+                 hours_per_week=2, cross_class=True),
+    ]
+    return SchoolData(subjects=subjects, rooms=rooms, classes=classes,
+                      teachers=teachers, couplings=couplings, config=config)
+
+
+_WEIGHT_RE = re.compile(r"\s*([A-Za-z_]\w*)\s*=\s*([+-]?\d+)\s*")
+
+
+def _parse_weights(s: str) -> dict:
+    """Parst Gewichte aus einem String wie 'gaps=200,compact=50'."""
+    result = {}
+    for part in s.split(","):
+        if not part.strip():
+            continue
+        m = _WEIGHT_RE.fullmatch(part)
+        if m is None:
+            k, sep, v = part.partition("=")
+            if not sep or not k.strip().isidentifier():
+                raise click.BadParameter(
+                    f"Ungültiges Format: '{part.strip()}'. Erwartet: 'schlüssel=wert'"
+                )
+            raise click.BadParameter(
+                f"Ungültiger Wert für '{k.strip()}': '{v.strip()}' – muss eine ganze Zahl sein."
+            )
+        result[m.group(1)] = int(m.group(2))
+    return result
+
+
+# Rahmen-/Statusfarbe je Solver-Status (unbekannt → weiß)
+_STATUS_COLORS = {
+    "OPTIMAL": "green",
+    "FEASIBLE": "yellow",
+    "INFEASIBLE": "red",
+    "UNKNOWN": "red",
+    "MODEL_INVALID": "red",
+}
+
+_RESULT_PANEL_TMPL = (
+    "Status: [{c}]{s}[/{c}]\n"
+    "Zeit: {t:.1f}s\n"
+    "Einträge: {e}\n"
+    "Zuweisungen: {a}\n"
+    "Variablen: {v} | Constraints: {n}"
+)
+
+
+@click.command("solve")
+@click.option("--time-limit", default=None, type=int,
+              help="Zeitlimit in Sekunden (überschreibt Config).")
+@click.option("--small", is_flag=True, default=False,
+              help="Mini-Datensatz (2 Klassen, 8 Lehrer) für schnelle Tests.")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad zur SchoolData-JSON (wenn nicht --small).")
+@click.option("--output", "-o", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              help="Ausgabepfad für die Lösung (JSON).")
+@click.option("--pins-path", default=DEFAULT_PINS_JSON, type=PATH_TYPE,
+              help="Pfad zur Pins-JSON-Datei (optional).")
+@click.option("--diagnose", is_flag=True, default=False,
+              help="Erweiterte Diagnose bei INFEASIBLE: ConstraintRelaxer starten.")
+@click.option("--thorough", is_flag=True, default=False,
+              help="Mit --diagnose: alle Relaxierungen testen (kein vorzeitiger Abbruch).")
+@click.option("--verbose", "-v", is_flag=True, default=False,
+              help="Solver-Log aktivieren.")
+@click.option("--no-soft", is_flag=True, default=False,
+              help="Nur harte Constraints (keine Soft-Optimierung).")
+@click.option("--weights", default=None,
+              help="Gewichte überschreiben, z.B. 'gaps=200,double_lessons=50'.")
+def cmd_solve(time_limit, small, json_path, output, pins_path, diagnose, thorough,
+              verbose, no_soft, weights):
+    """[bold]Berechnet den Stundenplan[/bold] mit Google OR-Tools CP-SAT.
+
+    Standardmäßig werden harte Constraints gelöst und anschließend
+    [cyan]Soft-Constraints optimiert[/cyan] (Springstunden, Deputat,
+    Doppelstunden, Fächerverteilung). Mit [yellow]--no-soft[/yellow] nur
+    harte Constraints — deutlich schneller.
+    """
+    import heapq
+    from collections import defaultdict
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich import box
+    from models.school_data import SchoolData
+    from solver.scheduler import ScheduleSolver
+    from solver.pinning import PinManager
+
+    _setup_logging(verbose=verbose)
+
+    # ── Daten laden ──────────────────────────────────────────────────────────
+    if small:
+        console.print("[bold]Mini-Modus:[/bold] Erzeuge 2-Klassen-Testdaten...")
+        data = _build_mini_school_data()
+    else:
+        console.print(f"[bold]Lade Datensatz:[/bold] {json_path}")
+        data = _load_or_abort(
+            SchoolData.load_json, json_path, "Keine Datendatei gefunden",
+            "Verwenden Sie [bold]python main.py generate --export-json[/bold] "
+            "oder das [bold]--small[/bold] Flag.",
+        )
+
+    console.print(f"[dim]{data.summary()}[/dim]\n")
+
+    # ── Machbarkeits-Check ───────────────────────────────────────────────────
+    report = data.validate_feasibility()
+    if not report.is_feasible:
+        report.print_rich()
+        console.print("[red bold]Machbarkeits-Check fehlgeschlagen – Solver wird nicht gestartet.[/red bold]")
+        sys.exit(1)
+    if report.warnings:
+        report.print_rich()
+
+    # ── Zeitlimit anpassen ───────────────────────────────────────────────────
+    if time_limit is not None:
+        data.config.solver.time_limit_seconds = time_limit
+
+    # ── Pins laden ───────────────────────────────────────────────────────────
+    pin_manager = _load_pins(pins_path) or PinManager()
+    if len(pin_manager) > 0:
+        console.print(f"[cyan]{len(pin_manager)} Pins geladen aus {pins_path}[/cyan]")
+
+    # ── Gewichte parsen ──────────────────────────────────────────────────────
+    parsed_weights = None
+    if weights:
+        try:
+            parsed_weights = _parse_weights(weights)
+        except click.BadParameter as e:
+            console.print(f"[red bold]Ungültige Gewichte:[/red bold] {e}")
+            sys.exit(1)
+
+    # ── Solver starten ───────────────────────────────────────────────────────
+    use_soft = not no_soft
+    soft_label = "mit Soft-Constraints" if use_soft else "nur harte Constraints"
+    console.print(
+        f"[bold]Starte Solver...[/bold] "
+        f"({soft_label}, "
+        f"Zeitlimit: {data.config.solver.time_limit_seconds}s, "
+        f"Worker: {data.config.solver.num_workers or 'auto'})"
+    )
+
+    solver = ScheduleSolver(data)
+    with _maybe_status("[bold green]Solver läuft...[/bold green]"):
+        solution = solver.solve(
+            pins=pin_manager.get_pins(),
+            use_soft=use_soft,
+            weights=parsed_weights,
+        )
+
+    # ── Ergebnis anzeigen ────────────────────────────────────────────────────
+    status_color = _STATUS_COLORS.get(solution.solver_status, "white")
+
+    console.print(Panel(
+        _RESULT_PANEL_TMPL.format(
+            c=status_color,
+            s=solution.solver_status,
+            t=solution.solve_time_seconds,
+            e=len(solution.entries),
+            a=len(solution.assignments),
+            v=solution.num_variables,
+            n=solution.num_constraints,
+        ),
+        title="Solver-Ergebnis",
+        border_style=status_color,
+    ))
+
+    if solution.solver_status not in ("OPTIMAL", "FEASIBLE"):
+        if diagnose:
+            from solver.constraint_relaxer import ConstraintRelaxer
+            console.print("\n[bold yellow]Starte ConstraintRelaxer-Diagnose...[/bold yellow]")
+            relaxer = ConstraintRelaxer(data)
+            with _maybe_status("[yellow]Relaxierungen werden getestet...[/yellow]"):
+                report = relaxer.diagnose(
+                    pins=pin_manager.get_pins(),
+                    time_limit=min(30, data.config.solver.time_limit_seconds),
+                    thorough=thorough,
+                )
+            rtable = Table(title="Constraint-Relaxierungen", box=box.ROUNDED)
+            rtable.add_column("Relaxierung")
+            rtable.add_column("Beschreibung")
+            rtable.add_column("Status")
+            rtable.add_column("Zeit", justify="right")
+            for r in report.relaxations:
+                color = "green" if r.status in ("OPTIMAL", "FEASIBLE") else (
+                    "yellow" if r.status == "UNKNOWN" else
+                    "dim" if r.status in ("SKIPPED", "N/A") else "red"
+                )
+                rtable.add_row(
+                    r.name, r.description,
+                    f"[{color}]{r.status}[/{color}]",
+                    f"{r.solve_time:.1f}s",
+                )
+            console.print(rtable)
+            console.print(f"\n[bold]Empfehlung:[/bold] {report.recommendation}")
+        sys.exit(1)
+
+    # ── Lösung speichern ─────────────────────────────────────────────────────
+    solution.save_json(output)
+    console.print(f"[green]✓[/green] Lösung gespeichert: {output}")
+
+    # ── Zusammenfassung: Lehrer-Auslastung ───────────────────────────────────
+    # Ein Durchlauf: reguläre Stunden zählen je Entry, Kopplungs-Einträge
+    # (einer pro beteiligter Klasse) je (Lehrer, Kopplung, Tag, Slot) nur einmal.
+    teacher_hours: dict[str, int] = defaultdict(int)
+    coupling_entries_seen: set[tuple] = set()
+    for entry in solution.entries:
+        if entry.is_coupling:
+            if not entry.coupling_id:
+                continue
+            key = (entry.teacher_id, entry.coupling_id, entry.day, entry.slot_number)
+            if key in coupling_entries_seen:
+                continue
+            coupling_entries_seen.add(key)
+        teacher_hours[entry.teacher_id] += 1
+
+    teacher_map = data.teachers_by_id
+    rows = [
+        (t_id, f"{teacher.deputat_min}-{teacher.deputat_max}",
+         actual, actual - teacher.deputat_max, teacher)
+        for t_id, actual in teacher_hours.items()
+        if (teacher := teacher_map.get(t_id)) is not None
+    ]
+
+    if not rows:
+        return
+
+    # Nur die Top 10 werden angezeigt → Teilsortierung statt kompletter Sortierung
+    top = heapq.nlargest(10, rows, key=lambda r: abs(r[3]))
+
+    table = Table(title="Lehrer-Auslastung (Top 10)", box=box.ROUNDED)
+    table.add_column("Kürzel")
+    table.add_column("Min-Max", justify="right")
+    table.add_column("Ist", justify="right")
+    table.add_column("Δ", justify="right")
+    for t_id, minmax, ist, delta, teacher in top:
+        if teacher.deputat_min <= ist <= teacher.deputat_max:
+            color = "green"
+        elif ist < teacher.deputat_min:
+            color = "red"
+        else:
+            color = "yellow"
+        table.add_row(t_id, minmax, f"[{color}]{ist}[/{color}]", f"[{color}]{delta:+d}[/{color}]")
+
+    console.print(table)
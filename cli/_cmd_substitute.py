@@ -0,0 +1,137 @@
+"""Befehl ``substitute``: Vertretungsoptionen für eine Lehrkraft."""
+
+import sys
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, DEFAULT_DATA_JSON, DEFAULT_SOLUTION_JSON
+
+
+@click.command("substitute")
+@click.option("--teacher", "-t", required=True,
+              help="Lehrer-ID des abwesenden Lehrers (z.B. T01).")
+@click.option("--day", "-d", default=None,
+              help="Wochentag (z.B. 'montag', 'mo', '0'). Optional: alle Tage.")
+@click.option("--slot", "-s", default=None, type=int,
+              help="Slot-Nummer (1-basiert). Optional: alle Slots.")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad zur school_data.json.")
+@click.option("--solution-path", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              help="Pfad zur solution.json.")
+@click.option("--top", default=5, show_default=True,
+              help="Maximal so viele Kandidaten pro Slot anzeigen.")
+def cmd_substitute(teacher: str, day, slot, json_path: Path,
+                   solution_path: Path, top: int):
+    """Findet geeignete Vertreter für einen abwesenden Lehrer.
+
+    Ohne --day/--slot werden Kandidaten für alle Slots des Lehrers angezeigt.
+
+    Beispiele:
+
+      python main.py substitute --teacher T01
+
+      python main.py substitute --teacher T01 --day montag --slot 3
+    """
+    from models.school_data import SchoolData
+    from solver.scheduler import ScheduleSolution
+    from analysis.substitution_helper import SubstitutionFinder
+
+    for p, label in [(solution_path, "Lösung"), (json_path, "Schuldaten")]:
+        if not p.exists():
+            console.print(f"[red]{label} nicht gefunden: {p}[/red]")
+            sys.exit(1)
+
+    solution    = ScheduleSolution.load_json(solution_path)
+    school_data = SchoolData.load_json(json_path)
+    day_names   = school_data.config.time_grid.day_names
+
+    teacher_id = teacher.upper()
+    finder = SubstitutionFinder()
+
+    # Lehrer prüfen
+    teacher_obj = next(
+        (t for t in school_data.teachers if t.id == teacher_id), None
+    )
+    if teacher_obj is None:
+        console.print(f"[red]Lehrer '{teacher_id}' nicht gefunden.[/red]")
+        sys.exit(1)
+
+    def _resolve_day(day_str: str) -> int | None:
+        """Wandelt Tages-String in Index um (0=Mo..4=Fr)."""
+        day_lower = day_str.lower().strip()
+        aliases = {
+            "mo": 0, "montag": 0, "0": 0,
+            "di": 1, "dienstag": 1, "1": 1,
+            "mi": 2, "mittwoch": 2, "2": 2,
+            "do": 3, "donnerstag": 3, "3": 3,
+            "fr": 4, "freitag": 4, "4": 4,
+        }
+        return aliases.get(day_lower)
+
+    console.print(
+        f"\n[bold]Vertretungssuche für:[/bold] "
+        f"{teacher_id} – {teacher_obj.name}\n"
+        f"Fächer: {', '.join(teacher_obj.subjects)}\n"
+    )
+
+    if day is not None and slot is not None:
+        # Einzelner Slot
+        day_idx = _resolve_day(str(day))
+        if day_idx is None:
+            console.print(f"[red]Unbekannter Tag: '{day}'[/red]")
+            sys.exit(1)
+        day_name = day_names[day_idx] if day_idx < len(day_names) else str(day_idx)
+        candidates = finder.find_substitutes(
+            teacher_id, day_idx, slot, solution, school_data
+        )
+        _print_substitute_table(
+            console, candidates[:top],
+            title=f"Vertreter für {teacher_id} am {day_name}, Slot {slot}",
+        )
+    else:
+        # Alle Slots des Lehrers
+        all_candidates = finder.find_all_for_teacher(teacher_id, solution, school_data)
+        if not all_candidates:
+            console.print(
+                f"[yellow]Lehrer {teacher_id} hat keine Stunden in der Lösung.[/yellow]"
+            )
+            return
+        for slot_key, candidates in sorted(all_candidates.items()):
+            _print_substitute_table(
+                console, candidates[:top],
+                title=f"Vertreter für {teacher_id} – {slot_key}",
+            )
+
+
+def _print_substitute_table(console, candidates, title: str) -> None:
+    """Gibt eine Kandidaten-Tabelle aus."""
+    from rich.table import Table
+    from rich import box
+
+    if not candidates:
+        console.print(f"[dim]{title}: Keine Kandidaten gefunden.[/dim]")
+        return
+
+    table = Table(title=title, box=box.ROUNDED, show_lines=False)
+    table.add_column("ID", width=8)
+    table.add_column("Name", width=25)
+    table.add_column("Gemeinsame Fächer", width=30)
+    table.add_column("Verfügbar", width=10, justify="center")
+    table.add_column("Ist/Max", justify="right", width=8)
+    table.add_column("Score", justify="right", width=8)
+
+    for c in candidates:
+        avail_str = "[green]Ja[/green]" if c.is_available_at_slot else "[red]Nein[/red]"
+        score_color = (
+            "green" if c.score >= 70
+            else "yellow" if c.score >= 40
+            else "red"
+        )
+        table.add_row(
+            c.teacher_id,
+            c.name,
+            ", ".join(c.subjects_match),
+            avail_str,
+            f"{c.current_load_hours}/{int(c.load_ratio * 100)}%",
+            f"[{score_color}]{c.score:.0f}[/{score_color}]",
+        )
+    console.print(table)
@@ -0,0 +1,27 @@
+"""Befehl ``template``: Excel-Import-Vorlage erzeugen."""
+
+from pathlib import Path
+
+from cli._common import click, console, PATH_TYPE, _load_config_or_abort
+
+
+@click.command("template")
+@click.option("--output", "-o", default=Path("output/import_vorlage.xlsx"), type=PATH_TYPE,
+              help="Ausgabepfad für die Excel-Vorlage.")
+def cmd_template(output: Path):
+    """Erzeugt eine leere Excel-Import-Vorlage."""
+    mgr, config = _load_config_or_abort()
+    from data.excel_import import generate_template
+
+    console.print(f"[bold]Excel-Vorlage wird erzeugt...[/bold]")
+    generate_template(config, output)
+    console.print(f"[green]✓[/green] Vorlage gespeichert: {output}")
+    console.print(
+        "\nBlätter in der Vorlage:\n"
+        "  [cyan]Zeitraster[/cyan]    – Stundenraster (vorausgefüllt aus Config)\n"
+        "  [cyan]Jahrgänge[/cyan]     – Jahrgangsdefinition (vorausgefüllt)\n"
+        "  [cyan]Stundentafel[/cyan]  – Fach × Jahrgang Matrix (vorausgefüllt)\n"
+        "  [cyan]Lehrkräfte[/cyan]    – Eingabe: Name, Kürzel, Fächer, Deputat, ...\n"
+        "  [cyan]Fachräume[/cyan]     – Fachraum-Typen und Anzahl\n"
+        "  [cyan]Kopplungen[/cyan]    – Reli/Ethik + WPF Kopplungen"
+    )
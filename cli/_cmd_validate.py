@@ -0,0 +1,69 @@
+"""Befehl ``validate``: Machbarkeits-Check für Daten und Lösung."""
+
+import sys
+from pathlib import Path
+
+from cli._common import (
+    click,
+    console,
+    _maybe_status,
+    PATH_TYPE,
+    DEFAULT_DATA_JSON,
+    DEFAULT_SOLUTION_JSON,
+    _load_config_or_abort,
+    _load_or_abort,
+)
+
+
+@click.command("validate")
+@click.option("--json-path", default=DEFAULT_DATA_JSON, type=PATH_TYPE,
+              help="Pfad zur gespeicherten JSON-Datei.")
+@click.option("--generate", "gen_first", is_flag=True, default=False,
+              help="Testdaten zunächst generieren (Seed 42).")
+@click.option("--solution-path", default=DEFAULT_SOLUTION_JSON, type=PATH_TYPE,
+              help="Pfad zur solution.json für Post-Solve-Validierung.")
+@click.option("--solution", "validate_solution", is_flag=True, default=False,
+              help="Post-Solve-Validierung der fertigen Lösung ausführen.")
+def cmd_validate(json_path: Path, gen_first: bool,
+                 solution_path: Path, validate_solution: bool):
+    """Führt einen Machbarkeits-Check auf dem aktuellen Datensatz durch.
+
+    Mit --solution wird zusätzlich die fertige Lösung auf Constraint-Verletzungen geprüft.
+    """
+    from models.school_data import SchoolData
+
+    if gen_first:
+        mgr, config = _load_config_or_abort()
+        from data.fake_data import FakeDataGenerator
+        gen = FakeDataGenerator(config, seed=42)
+        data = gen.generate()
+    else:
+        console.print(f"[bold]Lade Datensatz:[/bold] {json_path}")
+        data = _load_or_abort(
+            SchoolData.load_json, json_path, "Keine Datendatei gefunden",
+            "Verwenden Sie [bold]python main.py generate --export-json[/bold] "
+            "oder [bold]--generate[/bold] Flag.",
+        )
+
+    console.print(f"\n{data.summary()}\n")
+    report = data.validate_feasibility()
+    report.print_rich()
+
+    # Post-Solve Validierung
+    if validate_solution:
+        from solver.scheduler import ScheduleSolution
+        from analysis.solution_validator import SolutionValidator
+
+        console.print(f"\n[bold]Lade Lösung:[/bold] {solution_path}")
+        solution = _load_or_abort(
+            ScheduleSolution.load_json, solution_path, "Lösung nicht gefunden",
+            "Führen Sie zunächst [bold]python main.py solve[/bold] aus.",
+        )
+        validator = SolutionValidator()
+        with _maybe_status("[green]Validiere Lösung...[/green]"):
+            val_report = validator.validate(solution, data)
+        val_report.print_rich()
+        if not val_report.is_valid:
+            sys.exit(1)
+
+    sys.exit(0 if report.is_feasible else 1)
@@ -0,0 +1,134 @@
+"""Gemeinsame Bausteine der CLI-Befehle: Console, Logging, Standard-Pfade."""
+
+import sys
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import rich_click as click
+except ImportError:
+    import click
+
+# rich wird erst bei der ersten Ausgabe importiert; Table/Panel/box/Text
+# importieren die Befehle selbst, die sie tatsächlich benötigen.
+
+@lru_cache(maxsize=None)
+def _console():
+    """Gibt die (einmalig erzeugte) rich-Console zurück."""
+    from rich.console import Console
+    return Console()
+
+
+class _LazyConsole:
+    """Platzhalter, der alle Zugriffe an die erst bei Bedarf erzeugte Console weiterreicht."""
+
+    def __getattr__(self, name):
+        return getattr(_console(), name)
+
+
+console = _LazyConsole()
+
+
+@contextmanager
+def _maybe_status(msg: str):
+    """Spinner via console.status nur auf einem Terminal, sonst eine einfache Zeile.
+
+    Bei umgeleiteter Ausgabe (z. B. "> log.txt") entfallen so der
+    Live-Refresh-Thread und die ANSI-Sequenzen im Log.
+    """
+    if sys.stdout.isatty():
+        with console.status(msg):
+            yield
+    else:
+        console.print(msg)
+        yield
+
+# ─── LOGGING ──────────────────────────────────────────────────────────────────
+
+_LOG_FILE = Path("output/stundenplan.log")
+
+
+def _setup_logging(verbose: bool = False) -> None:
+    """Richtet Logging mit RichHandler (Konsole) + FileHandler (Log-Datei) ein."""
+    from rich.logging import RichHandler
+
+    level = logging.DEBUG if verbose else logging.INFO
+    _LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    handlers: list[logging.Handler] = [
+        RichHandler(
+            console=_console(),
+            rich_tracebacks=True,
+            show_path=False,
+            markup=True,
+        ),
+        logging.FileHandler(_LOG_FILE, encoding="utf-8"),
+    ]
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)-8s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=handlers,
+        force=True,
+    )
+    # Unterdrücke OR-Tools-Rauschen auf Konsole (landet trotzdem im Log)
+    logging.getLogger("ortools").setLevel(logging.WARNING)
+
+# Standard-Pfad für gespeicherte SchoolData
+DEFAULT_DATA_JSON = Path("output/school_data.json")
+DEFAULT_SOLUTION_JSON = Path("output/solution.json")
+DEFAULT_PINS_JSON = Path("output/pins.json")
+DEFAULT_EXPORT_DIR = Path("output/export")
+
+# Pfad-Optionen kommen als Path statt str im Befehl an
+PATH_TYPE = click.Path(path_type=Path)
+
+
+def _load_config_or_abort():
+    """Lädt die Konfiguration oder bricht mit Fehlermeldung ab."""
+    from config.manager import ConfigManager
+    mgr = ConfigManager()
+    if mgr.first_run_check():
+        console.print(
+            "[red]Keine Konfiguration gefunden.[/red]\n"
+            "Führen Sie zunächst [bold]python main.py setup[/bold] aus."
+        )
+        sys.exit(1)
+    return mgr, mgr.load()
+
+
+def _load_or_abort(loader, path: Path, missing: str, hint: str):
+    """Lädt path über loader; fehlt die Datei, Meldung ausgeben und abbrechen.
+
+    EAFP statt vorgelagertem exists(): die Datei wird nur einmal angefasst.
+    """
+    try:
+        return loader(path)
+    except FileNotFoundError:
+        console.print(f"[red]{missing}: {path}[/red]\n{hint}")
+        sys.exit(1)
+
+
+@lru_cache(maxsize=4)
+def _load_pins_cached(path_str: str, mtime_ns: int, size: int) -> tuple:
+    """Parst die Pins-Datei; (mtime_ns, size) im Schlüssel erkennt Änderungen."""
+    from solver.pinning import PinManager
+    pm = PinManager()
+    pm.load_json(Path(path_str))
+    return tuple(pm.get_pins())
+
+
+def _load_pins(path: Path):
+    """Gibt einen PinManager mit den Pins aus path zurück, None falls die Datei fehlt.
+
+    Ein stat() ersetzt exists() + Lesen; wiederholte Aufrufe im selben Prozess
+    (z. B. in der run-Pipeline) parsen eine unveränderte Datei nicht erneut.
+    """
+    from solver.pinning import PinManager
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return PinManager(_load_pins_cached(str(path), st.st_mtime_ns, st.st_size))
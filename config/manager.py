@@ -3,7 +3,6 @@
 Nutzt ruamel.yaml für YAML-Serialisierung mit Kommentaren.
 """
 
-import json
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -119,7 +118,7 @@ class ConfigManager:
 
     def _build_commented_yaml(self, config: SchoolConfig) -> CommentedMap:
         """Baut die YAML-Struktur mit Kommentaren auf."""
-        raw = json.loads(config.model_dump_json())
+        raw = config.model_dump(mode="json")
         cm = CommentedMap(raw)
 
         for field, (label, comment) in _SECTION_COMMENTS.items():
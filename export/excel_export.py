@@ -55,11 +55,14 @@ class ExcelExporter:
         if quality_report is not None:
             self._sheet_qualitaet(wb, quality_report)
 
+        # Einträge einmal gruppieren statt je Klasse/Lehrer alle zu durchsuchen
+        by_class = self.solution.entries_by_class()
         for cls in sorted(self.data.classes, key=lambda c: c.id):
-            self._sheet_klasse(wb, cls.id)
+            self._sheet_klasse(wb, cls.id, by_class.get(cls.id, []))
 
+        by_teacher = self.solution.entries_by_teacher()
         for teacher in sorted(self.data.teachers, key=lambda t: t.id):
-            self._sheet_lehrer(wb, teacher)
+            self._sheet_lehrer(wb, teacher, by_teacher.get(teacher.id, []))
 
         used_rooms = {e.room for e in self.solution.entries if e.room}
         for room in sorted(self.data.rooms, key=lambda r: r.id):
@@ -265,9 +268,10 @@ class ExcelExporter:
             c.border = border
         row += 1
 
+        by_teacher = self.solution.entries_by_teacher()
         for teacher in sorted(self.data.teachers, key=lambda t: t.id):
             actual = count_teacher_actual_hours(self.solution.entries, teacher.id)
-            t_entries = self.solution.get_teacher_schedule(teacher.id)
+            t_entries = by_teacher.get(teacher.id, [])
             gaps = count_gaps(t_entries)
 
             ws.cell(row=row, column=1, value=teacher.id).border = border
@@ -329,23 +333,21 @@ class ExcelExporter:
 
     # ─── Sheet: Klasse ────────────────────────────────────────────────────────
 
-    def _sheet_klasse(self, wb, class_id: str) -> None:
+    def _sheet_klasse(self, wb, class_id: str, entries: list[ScheduleEntry]) -> None:
         title = f"Klasse {class_id}"[:31]
         ws = wb.create_sheet(title=title)
         self._setup_sheet(ws)
         self._write_header_row(ws)
-        entries = self.solution.get_class_schedule(class_id)
         cls = next(c for c in self.data.classes if c.id == class_id)
         self._write_schedule_table(ws, entries, mode="class", max_slot=cls.max_slot)
 
     # ─── Sheet: Lehrer ────────────────────────────────────────────────────────
 
-    def _sheet_lehrer(self, wb, teacher: Teacher) -> None:
+    def _sheet_lehrer(self, wb, teacher: Teacher, entries: list[ScheduleEntry]) -> None:
         title = f"Lehrer {teacher.id}"[:31]
         ws = wb.create_sheet(title=title)
         self._setup_sheet(ws)
         self._write_header_row(ws)
-        entries = self.solution.get_teacher_schedule(teacher.id)
         max_slot = max(
             (e.slot_number for e in entries), default=self.tg.sek1_max_slot
         )
@@ -1,5 +1,8 @@
 """PDF-Export für den Stundenplan (fpdf2)."""
 
+from collections.abc import Iterator
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
 from config.schema import LessonSlot, PauseSlot
@@ -217,8 +220,9 @@ class PdfExporter:
     def export_class_schedules(self, output_path: Path) -> None:
         """Erzeugt eine PDF mit je einer Seite pro Klasse."""
         pdf = _SchedulePdf(self.config.school_name)
-        for cls in sorted(self.data.classes, key=lambda c: c.id):
-            entries = self.solution.get_class_schedule(cls.id)
+        classes = sorted(self.data.classes, key=lambda c: c.id)
+        grouped = self._iter_grouped_entries([c.id for c in classes], "class_id")
+        for cls, (_, entries) in zip(classes, grouped):
             # Gesamtstunden = eindeutige (day, slot)-Paare der Klasse
             total_h = len({(e.day, e.slot_number) for e in entries})
             pdf.set_entity(f"Klasse {cls.id} - Stundenplan | {total_h} Std./Woche")
@@ -229,9 +233,10 @@ class PdfExporter:
     def export_teacher_schedules(self, output_path: Path) -> None:
         """Erzeugt eine PDF mit je einer Seite pro Lehrer."""
         pdf = _SchedulePdf(self.config.school_name)
-        for teacher in sorted(self.data.teachers, key=lambda t: t.id):
-            entries = self.solution.get_teacher_schedule(teacher.id)
-            actual = count_teacher_actual_hours(self.solution.entries, teacher.id)
+        teachers = sorted(self.data.teachers, key=lambda t: t.id)
+        grouped = self._iter_grouped_entries([t.id for t in teachers], "teacher_id")
+        for teacher, (_, entries) in zip(teachers, grouped):
+            actual = count_teacher_actual_hours(entries, teacher.id)
             entity = (
                 f"{teacher.id} - {teacher.name} "
                 f"| Min: {teacher.deputat_min}h-Max: {teacher.deputat_max}h | Ist: {actual}h"
@@ -245,6 +250,27 @@ class PdfExporter:
             self._draw_teacher_footer(pdf, teacher, entries, actual)
         pdf.save(output_path)
 
+    def _iter_grouped_entries(
+        self, ids: list[str], attr: str
+    ) -> Iterator[tuple[str, list[ScheduleEntry]]]:
+        """Liefert (id, entries) für jede ID aus der sortierten Liste ids.
+
+        Die Einträge werden einmalig nach attr sortiert und per groupby
+        gruppenweise abgegeben – statt pro Klasse/Lehrer alle Einträge zu
+        durchsuchen. IDs ohne Einträge erhalten eine leere Liste.
+        """
+        key = attrgetter(attr)
+        groups = groupby(sorted(self.solution.entries, key=key), key=key)
+        current = next(groups, None)
+        for entity_id in ids:
+            while current is not None and current[0] < entity_id:
+                current = next(groups, None)
+            if current is not None and current[0] == entity_id:
+                yield entity_id, list(current[1])
+                current = next(groups, None)
+            else:
+                yield entity_id, []
+
     # ─── Tabellenzeichnung ────────────────────────────────────────────────────
 
     def _build_grid(
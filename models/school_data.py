@@ -1,9 +1,11 @@
 """SchoolData: Vollständiger Schuldatensatz + Machbarkeits-Check (Pydantic v2)."""
 
 import json
+from collections import Counter, defaultdict
 from pathlib import Path
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from models.subject import Subject
 from models.teacher import Teacher
@@ -13,6 +15,32 @@ from models.coupling import Coupling
 from config.schema import SchoolConfig
 
 
+def _build_subject_tables(
+    classes: list[SchoolClass], teachers: list[Teacher]
+) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+    """Fach-Tabellen für den Machbarkeits-Check in je einem Durchlauf.
+
+    Gibt (Stundenbedarf, Doppelstunden-Events, Lehrerkapazität) pro Fach
+    zurück. Doppelstunden-Events = Summe floor(Stunden/2) über alle Klassen,
+    Kapazität = Summe deputat_max der Lehrkräfte mit diesem Fach. Als
+    defaultdict(int) liefern fehlende Fächer 0.
+    """
+    need: defaultdict[str, int] = defaultdict(int)
+    double_events: defaultdict[str, int] = defaultdict(int)
+    for cls in classes:
+        for subj, hours in cls.curriculum.items():
+            if hours > 0:
+                need[subj] += hours
+                double_events[subj] += hours // 2
+
+    capacity: defaultdict[str, int] = defaultdict(int)
+    for teacher in teachers:
+        deputat_max = teacher.deputat_max
+        for subj in teacher.subjects:
+            capacity[subj] += deputat_max
+    return need, double_events, capacity
+
+
 class FeasibilityReport(BaseModel):
     """Ergebnis des Machbarkeits-Checks."""
 
@@ -24,27 +52,29 @@ class FeasibilityReport(BaseModel):
         """Gibt den Report formatiert über Rich aus."""
         from rich.console import Console
         from rich.panel import Panel
-        from rich import box
+        from rich.text import Text
 
         console = Console()
+        # Ein Text-Objekt mit Stil-Spans statt Markup-String: die Meldungen
+        # werden nicht als Markup geparst (eckige Klammern bleiben erhalten).
+        text = Text()
         if self.is_feasible:
-            status = "[bold green]✓ LÖSBAR[/bold green]"
+            text.append("✓ LÖSBAR", style="bold green")
         else:
-            status = "[bold red]✗ NICHT LÖSBAR[/bold red]"
+            text.append("✗ NICHT LÖSBAR", style="bold red")
 
-        lines = [status]
         if self.errors:
-            lines.append("\n[red bold]Fehler (kritisch):[/red bold]")
+            text.append("\n\nFehler (kritisch):", style="red bold")
             for e in self.errors:
-                lines.append(f"  [red]• {e}[/red]")
+                text.append(f"\n  • {e}", style="red")
         if self.warnings:
-            lines.append("\n[yellow bold]Warnungen:[/yellow bold]")
+            text.append("\n\nWarnungen:", style="yellow bold")
             for w in self.warnings:
-                lines.append(f"  [yellow]• {w}[/yellow]")
+                text.append(f"\n  • {w}", style="yellow")
         if not self.errors and not self.warnings:
-            lines.append("[dim]Keine Probleme gefunden.[/dim]")
+            text.append("\nKeine Probleme gefunden.", style="dim")
 
-        console.print(Panel("\n".join(lines), title="Machbarkeits-Check", border_style="cyan"))
+        console.print(Panel(text, title="Machbarkeits-Check", border_style="cyan"))
 
 
 class SchoolData(BaseModel):
@@ -57,17 +87,47 @@ class SchoolData(BaseModel):
     couplings: list[Coupling]
     config: SchoolConfig
 
+    @property
+    def teachers_by_id(self) -> dict[str, Teacher]:
+        """Lehrkräfte nach Kürzel.
+
+        Bei jedem Zugriff neu aufgebaut, damit geänderte oder ersetzte
+        Lehrkräfte sofort sichtbar sind; Aufrufer halten sich das Dict für
+        ihren Durchlauf selbst.
+        """
+        return {t.id: t for t in self.teachers}
+
+    @property
+    def teachers_by_subject(self) -> dict[str, tuple[Teacher, ...]]:
+        """Lehrkräfte je Fach (Reihenfolge wie in ``teachers``).
+
+        Wie teachers_by_id bei jedem Zugriff neu aufgebaut; Tupel statt
+        Listen, damit Aufrufer den Index nicht verändern können.
+        """
+        index: dict[str, list[Teacher]] = {}
+        for teacher in self.teachers:
+            for subj in teacher.subjects:
+                index.setdefault(subj, []).append(teacher)
+        return {subj: tuple(ts) for subj, ts in index.items()}
+
     # ─── Übersicht ───
 
     def summary(self) -> str:
         """Kurze Übersicht über den Datensatz."""
-        total_need = sum(sum(c.curriculum.values()) for c in self.classes)
-        total_dep = sum(t.deputat_max for t in self.teachers)
-        num_teilzeit = sum(1 for t in self.teachers if t.is_teilzeit)
+        # Je ein Durchlauf über Klassen und Lehrkräfte
+        total_need = 0
+        grades: set[int] = set()
+        for c in self.classes:
+            total_need += c.total_weekly_hours
+            grades.add(c.grade)
+        total_dep = num_teilzeit = 0
+        for t in self.teachers:
+            total_dep += t.deputat_max
+            if t.is_teilzeit:
+                num_teilzeit += 1
         lines = [
             f"Schule: {self.config.school_name}",
-            f"Klassen: {len(self.classes)} "
-            f"({len(set(c.grade for c in self.classes))} Jahrgänge)",
+            f"Klassen: {len(self.classes)} ({len(grades)} Jahrgänge)",
             f"Fächer: {len(self.subjects)}",
             f"Lehrkräfte: {len(self.teachers)} "
             f"({num_teilzeit} Teilzeit, {len(self.teachers)-num_teilzeit} Vollzeit)",
@@ -105,13 +165,23 @@ class SchoolData(BaseModel):
 
         subject_map = {s.name: s for s in self.subjects}
 
+        # Fach-Tabellen einmal aufbauen; der Gesamtbedarf ergibt sich daraus
+        # ohne weiteren Durchlauf über alle Klassen-Curricula.
+        subject_need, subject_double_events, subject_capacity = _build_subject_tables(
+            self.classes, self.teachers
+        )
+
         # ── 5. Gesamtbilanz ──────────────────────────────────────────────
-        total_deputat_max = sum(t.deputat_max for t in self.teachers)
-        total_deputat_min = sum(t.deputat_min for t in self.teachers)
-        total_need = sum(sum(c.curriculum.values()) for c in self.classes)
+        total_deputat_max = total_deputat_min = 0
+        for teacher in self.teachers:
+            total_deputat_max += teacher.deputat_max
+            total_deputat_min += teacher.deputat_min
+        total_need = sum(subject_need.values())
 
         if total_need == 0:
+            # Ohne Curriculum sind alle weiteren Prüfungen gegenstandslos
             warnings.append("Kein Curriculum definiert – Machbarkeit kann nicht geprüft werden.")
+            return FeasibilityReport(is_feasible=True, errors=errors, warnings=warnings)
         elif total_deputat_max < total_need:
             errors.append(
                 f"Gesamtbilanz: Lehrerkapazität ({total_deputat_max}h) < Gesamtbedarf ({total_need}h). "
@@ -135,8 +205,12 @@ class SchoolData(BaseModel):
 
         # ── 3. Jeder Lehrer: verfügbare Slots ≥ deputat_min ─────────────────
         # dep_max ist Obergrenze; Fehler nur wenn Minimum nicht erreichbar ist.
+        # Im selben Durchlauf werden die Freitag-Wünsche gesammelt.
+        freitag_wunsch = []
         for teacher in self.teachers:
-            available = total_slots_per_week - len(teacher.unavailable_slots)
+            if 4 in teacher.preferred_free_days:
+                freitag_wunsch.append(teacher)
+            available = teacher.available_slots_count(total_slots_per_week)
             if available < teacher.deputat_min:
                 errors.append(
                     f"Lehrkraft {teacher.id} ({teacher.name}): Nur {available} verfügbare Slots "
@@ -149,7 +223,6 @@ class SchoolData(BaseModel):
                 )
 
         # Freitag-Cluster-Warnung
-        freitag_wunsch = [t for t in self.teachers if 4 in t.preferred_free_days]
         if len(freitag_wunsch) >= 4:
             warnings.append(
                 f"Freitag-Cluster: {len(freitag_wunsch)} Lehrkräfte wünschen Freitag frei "
@@ -159,11 +232,6 @@ class SchoolData(BaseModel):
             )
 
         # ── 1. Pro Fach: Gesamtbedarf ≤ Fachlehrer-Kapazität ────────────
-        subject_need: dict[str, int] = {}
-        for cls in self.classes:
-            for subj, hours in cls.curriculum.items():
-                if hours > 0:
-                    subject_need[subj] = subject_need.get(subj, 0) + hours
 
         # Fächer, die über Kopplungen abgedeckt werden → kein direkter Kapazitäts-Check.
         # Für WPF: Curriculum-Eintrag "WPF" wird via Kopplung besetzt.
@@ -180,16 +248,12 @@ class SchoolData(BaseModel):
                 for group in coupling.groups:
                     coupling_covered.add(group.subject)
 
-        # Lehrer-Kapazität pro Fach (Summe aller Deputate der Lehrkräfte dieses Fachs)
-        subject_capacity: dict[str, int] = {}
-        for teacher in self.teachers:
-            for subj in teacher.subjects:
-                subject_capacity[subj] = subject_capacity.get(subj, 0) + teacher.deputat_max
-
         for subj_name, need in subject_need.items():
             if subj_name in coupling_covered:
                 continue  # Wird via Kopplung abgedeckt, kein direkter Lehrer-Check
-            cap = subject_capacity.get(subj_name, 0)
+            cap = subject_capacity[subj_name]
+            if cap >= need * 1.10:
+                continue  # Normalfall: ausreichend Puffer, keine Meldung
             if cap == 0:
                 errors.append(
                     f"Fach '{subj_name}': Kein Lehrer verfügbar! "
@@ -203,12 +267,11 @@ class SchoolData(BaseModel):
                 )
             elif cap < need:
                 # Geringfügiger Mangel: Rough-Approximation, oft durch Fächeraufteilung lösbar
-                util = need / cap * 100
                 warnings.append(
                     f"Fach '{subj_name}': Kapazität ({cap}h) knapp unter Bedarf ({need}h) – "
                     f"Fächeraufteilung der Mehrtach-Lehrer beachten."
                 )
-            elif cap < need * 1.10:
+            else:
                 util = need / cap * 100
                 warnings.append(
                     f"Fach '{subj_name}': Auslastung sehr hoch – "
@@ -216,9 +279,7 @@ class SchoolData(BaseModel):
                 )
 
         # ── 2. Fachräume: Bedarf ≤ verfügbare Raumslots ─────────────────
-        room_counts: dict[str, int] = {}
-        for room in self.rooms:
-            room_counts[room.room_type] = room_counts.get(room.room_type, 0) + 1
+        room_counts = Counter(room.room_type for room in self.rooms)
 
         for subj_name, need_hours in subject_need.items():
             subj = subject_map.get(subj_name)
@@ -226,7 +287,7 @@ class SchoolData(BaseModel):
                 continue
 
             room_type = subj.requires_special_room
-            room_count = room_counts.get(room_type, 0)
+            room_count = room_counts[room_type]
 
             if room_count == 0:
                 errors.append(
@@ -237,10 +298,7 @@ class SchoolData(BaseModel):
 
             if subj.double_lesson_required:
                 # Pro Klasse: floor(hours/2) Doppelstunden-Events (z.B. 2h→1, 3h→1, 4h→2)
-                events_needed = sum(
-                    cls.curriculum.get(subj_name, 0) // 2
-                    for cls in self.classes
-                )
+                events_needed = subject_double_events[subj_name]
                 max_events = room_count * double_blocks_per_day * days
                 util = events_needed / max_events if max_events > 0 else float("inf")
                 if util > 1.0:
@@ -267,8 +325,7 @@ class SchoolData(BaseModel):
         # ── 4. Kopplungen: qualifizierte Lehrer vorhanden ────────────────
         for coupling in self.couplings:
             for group in coupling.groups:
-                cap = subject_capacity.get(group.subject, 0)
-                if cap == 0:
+                if subject_capacity[group.subject] == 0:
                     errors.append(
                         f"Kopplung '{coupling.id}', Gruppe '{group.group_name}': "
                         f"Kein Lehrer für Fach '{group.subject}' vorhanden!"
@@ -286,14 +343,16 @@ class SchoolData(BaseModel):
         """Speichert den kompletten Datensatz als JSON-Datei."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.model_dump_json(indent=2))
+        # to_json liefert direkt UTF-8-Bytes (kein str-Umweg über model_dump_json)
+        path.write_bytes(to_json(self, indent=2))
 
     @classmethod
     def load_json(cls, path: Path) -> "SchoolData":
         """Lädt einen Datensatz aus einer JSON-Datei."""
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"JSON-Datei nicht gefunden: {path}")
-        with open(path, "r", encoding="utf-8") as f:
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON-Datei nicht gefunden: {path}") from None
+        with f:
             return cls.model_validate_json(f.read())
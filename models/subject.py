@@ -1,12 +1,15 @@
 """Datenmodell für ein Unterrichtsfach (Pydantic v2)."""
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Subject(BaseModel):
     """Repräsentiert ein Unterrichtsfach."""
 
+    # Nach dem Laden unveränderlich (Änderungen nur über model_copy)
+    model_config = ConfigDict(frozen=True)
+
     name: str
     short_name: str
     category: str       # hauptfach/sprache/nw/musisch/sport/gesellschaft/wpf
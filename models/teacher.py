@@ -1,11 +1,14 @@
 """Datenmodell für eine Lehrkraft (Pydantic v2)."""
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 
 class Teacher(BaseModel):
     """Repräsentiert eine einzelne Lehrkraft."""
 
+    # Nach dem Laden unveränderlich (Änderungen nur über model_copy)
+    model_config = ConfigDict(frozen=True)
+
     id: str                                       # Kürzel ("MÜL")
     name: str                                     # "Müller, Hans"
     subjects: list[str]                           # Unterrichtbare Fächer
@@ -25,7 +28,8 @@ class Teacher(BaseModel):
     @field_validator("id")
     @classmethod
     def normalize_id(cls, v: str) -> str:
-        return v.upper()
+        # Kürzel sind meist schon großgeschrieben → keinen neuen String erzeugen
+        return v if v.isupper() else v.upper()
 
     @model_validator(mode='after')
     def _check_deputat_bounds(self):
@@ -37,8 +41,6 @@ class Teacher(BaseModel):
             )
         return self
 
-    @property
-    def available_slot_count(self) -> int:
-        """Anzahl verfügbarer Sek-I-Slots (5 Tage × sek1_max_slot − Sperren)."""
-        # Dieser Wert ist konfigurationsabhängig; Standardwert für 5×7
-        return 35 - len(self.unavailable_slots)
+    def available_slots_count(self, total_slots: int) -> int:
+        """Anzahl verfügbarer Sek-I-Slots (total_slots = Tage × sek1_max_slot − Sperren)."""
+        return total_slots - len(self.unavailable_slots)
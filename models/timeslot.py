@@ -1,31 +1,34 @@
 """Datenmodell für einen Zeitslot im Wochenraster."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+_DAY_NAMES = ("Mo", "Di", "Mi", "Do", "Fr", "Sa")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
     """Repräsentiert einen einzelnen Unterrichtszeitslot im Wochenraster.
 
     Kombination aus Wochentag und Stundenslot.
     Immutable (frozen=True) damit es als Dict-Key / Set-Element nutzbar ist.
+    slot_id und day_name werden einmalig in __post_init__ berechnet.
     """
 
     # Wochentag (0=Montag, 1=Dienstag, ..., 4=Freitag)
     day: int
     # Stunden-Slot (1-basiert, z.B. 1 = 1. Stunde)
     slot: int
-
-    @property
-    def slot_id(self) -> str:
-        """Eindeutiger String-Bezeichner (z.B. "0_1" für Mo 1. Stunde)."""
-        return f"{self.day}_{self.slot}"
-
-    @property
-    def day_name(self) -> str:
-        """Abgekürzter Tagesname."""
-        names = ["Mo", "Di", "Mi", "Do", "Fr", "Sa"]
-        return names[self.day] if self.day < len(names) else str(self.day)
+    # Eindeutiger String-Bezeichner (z.B. "0_1" für Mo 1. Stunde)
+    slot_id: str = field(init=False, repr=False, compare=False)
+    # Abgekürzter Tagesname
+    day_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "slot_id", f"{self.day}_{self.slot}")
+        object.__setattr__(
+            self, "day_name",
+            _DAY_NAMES[self.day] if self.day < len(_DAY_NAMES) else str(self.day),
+        )
 
     def __repr__(self) -> str:
         return f"TimeSlot({self.day_name}, Std.{self.slot})"
@@ -1,13 +1,24 @@
 """Solver-Modul (CP-SAT via Google OR-Tools)."""
 
-from .scheduler import ScheduleSolver, ScheduleSolution, ScheduleEntry, TeacherAssignment
-from .pinning import PinManager, PinnedLesson
-
-__all__ = [
-    "ScheduleSolver",
-    "ScheduleSolution",
-    "ScheduleEntry",
-    "TeacherAssignment",
-    "PinManager",
-    "PinnedLesson",
-]
+import importlib
+
+# Die Re-Exporte werden erst beim Zugriff geladen (PEP 562): ein Import von
+# solver.pinning zieht so nicht solver.scheduler samt OR-Tools nach.
+_EXPORTS = {
+    "ScheduleSolver":    ".scheduler",
+    "ScheduleSolution":  ".scheduler",
+    "ScheduleEntry":     ".scheduler",
+    "TeacherAssignment": ".scheduler",
+    "PinManager":        ".pinning",
+    "PinnedLesson":      ".pinning",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module, __name__), name)
@@ -1,14 +1,20 @@
 """Systematische INFEASIBLE-Diagnose durch schrittweise Constraint-Lockerung."""
 
-import copy
+import hashlib
+import os
 import time
 import logging
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 
 from pydantic import BaseModel
 
+from config.defaults import SUBJECT_METADATA
+from config.schema import RoomConfig, SchoolConfig, SpecialRoomDef
 from models.school_data import SchoolData
+from models.teacher import Teacher
 from solver.pinning import PinnedLesson
+from solver.scheduler import ScheduleSolver
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +25,7 @@ class RelaxResult(BaseModel):
     """Ergebnis einer einzelnen Constraint-Lockerung."""
     name: str
     description: str
-    status: str        # "FEASIBLE" / "INFEASIBLE" / "UNKNOWN"
+    status: str        # "FEASIBLE" / "INFEASIBLE" / "UNKNOWN" / "SKIPPED" / "N/A"
     solve_time: float
 
 
@@ -30,8 +36,97 @@ class RelaxReport(BaseModel):
     recommendation: str
 
 
+# ─── Ergebnis-Cache ───────────────────────────────────────────────────────────
+
+# Inhalts-Hash → Solver-Status. Nur eindeutige Ergebnisse werden gemerkt;
+# UNKNOWN hängt vom Zeitlimit ab und wird beim nächsten Mal neu gerechnet.
+_STATUS_CACHE: dict[str, str] = {}
+_STATUS_CACHE_SIZE = 128
+_CACHEABLE_STATUSES = ("OPTIMAL", "FEASIBLE", "INFEASIBLE")
+_FEASIBLE_STATUSES = frozenset({"OPTIMAL", "FEASIBLE"})
+
+
+def _problem_key(
+    data: SchoolData, pins: list[PinnedLesson], no_double_required: bool = False
+) -> str:
+    """BLAKE2b-Hash über Datensatz (ohne Zeitlimit/Worker), Pins und Modus."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(data.model_dump_json(
+        exclude={"config": {"solver": {"time_limit_seconds", "num_workers"}}}
+    ).encode())
+    h.update(repr(sorted(
+        (p.teacher_id, p.class_id, p.subject, p.day, p.slot_number) for p in pins
+    )).encode())
+    h.update(b"\x01" if no_double_required else b"\x00")
+    return h.hexdigest()
+
+
+def _remember_status(key: str, status: str) -> None:
+    """Speichert ein eindeutiges Ergebnis; verdrängt bei Bedarf den ältesten Eintrag."""
+    if status not in _CACHEABLE_STATUSES:
+        return
+    if key not in _STATUS_CACHE and len(_STATUS_CACHE) >= _STATUS_CACHE_SIZE:
+        del _STATUS_CACHE[next(iter(_STATUS_CACHE))]
+    _STATUS_CACHE[key] = status
+
+
+# ─── Config-Overlays ──────────────────────────────────────────────────────────
+# Flache Kopien: nur der geänderte Teilbaum wird neu erzeugt, Klassen, Lehrer,
+# Fächer usw. werden per Referenz geteilt (kein deep copy pro Relaxierung).
+
+def _overlay_solver(config: SchoolConfig, **changes) -> SchoolConfig:
+    """Kopie der Config mit geänderten Solver-Feldern (Original bleibt unberührt)."""
+    return config.model_copy(update={"solver": config.solver.model_copy(update=changes)})
+
+
+def _unlimited_rooms(config: SchoolConfig) -> RoomConfig:
+    """RoomConfig mit denselben Fachraum-Typen, aber unbegrenzter Kapazität."""
+    return RoomConfig(
+        special_rooms=[
+            SpecialRoomDef(
+                room_type=r.room_type,
+                display_name=r.display_name,
+                count=999,
+            )
+            for r in config.rooms.special_rooms
+        ]
+    )
+
+
+def _with_solver_limits(
+    data: SchoolData, time_limit: int, num_workers: Optional[int] = None
+) -> SchoolData:
+    """Begrenzt Zeitlimit (und ggf. CP-SAT-Worker) für einen Diagnose-Lauf."""
+    solver_cfg = data.config.solver
+    if solver_cfg.time_limit_seconds <= time_limit and not num_workers:
+        return data
+    new_config = _overlay_solver(
+        data.config,
+        time_limit_seconds=min(solver_cfg.time_limit_seconds, time_limit),
+        num_workers=num_workers or 2,
+    )
+    return data.model_copy(update={"config": new_config})
+
+
 # ─── ConstraintRelaxer ────────────────────────────────────────────────────────
 
+def _run_relaxation_job(
+    job: tuple[str, SchoolData],
+    pins: list[PinnedLesson],
+    time_limit: int,
+    num_workers: int,
+) -> tuple[str, tuple[str, float]]:
+    """Einzelne Relaxierung im Worker-Prozess (Modul-Ebene, damit picklebar).
+
+    Gibt den Namen mit zurück, da die Ergebnisse ungeordnet eintreffen.
+    """
+    name, data = job
+    relaxer = ConstraintRelaxer(data)
+    if name == "no_double_required":
+        return name, relaxer._run_no_double_required(data, pins, time_limit, num_workers)
+    return name, relaxer._run_solver_timed(data, pins, time_limit, num_workers)
+
+
 class ConstraintRelaxer:
     """Systematische Diagnose bei INFEASIBLE durch schrittweise Lockerung.
 
@@ -42,80 +137,71 @@ class ConstraintRelaxer:
       4. Erweiterte Deputat-Grenzen (deputat_min auf 25% gesenkt)
       5. Ohne Springstunden-Limit (max_gaps_per_week=0)
       6. Alle obigen kombiniert
+
+    Relaxierungen, die am Datensatz nichts ändern würden (z.B. keine
+    Kopplungen vorhanden), werden nicht gerechnet und erscheinen als "N/A".
     """
 
     def __init__(self, school_data: SchoolData) -> None:
         self.data = school_data
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Verwirft alle gemerkten Solver-Ergebnisse."""
+        _STATUS_CACHE.clear()
+
     def diagnose(
         self,
-        pins: list[PinnedLesson] = [],
+        pins: Optional[list[PinnedLesson]] = None,
         time_limit: int = 30,
+        thorough: bool = False,
     ) -> RelaxReport:
-        """Führt alle Relaxierungen durch und erstellt einen Bericht.
+        """Führt die Relaxierungen durch und erstellt einen Bericht.
+
+        Ohne thorough wird abgebrochen, sobald eine Einzel-Relaxierung das
+        Problem lösbar macht – die Ursache ist dann eingegrenzt; die übrigen
+        erscheinen als SKIPPED. "all_combined" läuft so nur, wenn keine
+        Einzel-Relaxierung hilft. Parallel werden dazu auch bereits laufende
+        Jobs abgebrochen.
 
         Args:
             pins: Optionale Pins (werden an alle Relaxierungs-Solver weitergegeben)
             time_limit: Zeitlimit pro Relaxierung in Sekunden
+            thorough: Alle Relaxierungen ausführen (vollständige Matrix)
         """
+        pins = pins or []
+
+        # Zeitlimit einmal für alle Läufe setzen; die Relaxierungen bauen darauf auf
+        base = _with_solver_limits(self.data, time_limit)
+
         # Erst originales Problem prüfen
-        original_status = self._run_solver(self.data, pins, time_limit)
-
-        results: list[RelaxResult] = []
-
-        # 1. Ohne Doppelstunden-Pflicht
-        results.append(self._test_relaxation(
-            name="no_double_required",
-            description="Alle double_required=False (Doppelstunden optional)",
-            data=self._relax_no_double_required(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
-
-        # 2. Ohne Fachraum-Limits
-        results.append(self._test_relaxation(
-            name="no_room_limits",
-            description="Alle Fachraum-Kapazitäten unbegrenzt",
-            data=self._relax_no_room_limits(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
-
-        # 3. Ohne Kopplungen
-        results.append(self._test_relaxation(
-            name="no_couplings",
-            description="Alle Kopplungen entfernt",
-            data=self._relax_no_couplings(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
-
-        # 4. Erweiterte Deputat-Grenzen
-        results.append(self._test_relaxation(
-            name="wider_deputat_bounds",
-            description="deputat_min auf 50% von deputat_max gesenkt",
-            data=self._relax_wider_deputat_bounds(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
-
-        # 5. Ohne Springstunden-Limit
-        results.append(self._test_relaxation(
-            name="no_gap_limit",
-            description="Springstunden-Limit deaktiviert (max_gaps_per_week=0)",
-            data=self._relax_no_gap_limit(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
-
-        # 6. Alle kombiniert
-        results.append(self._test_relaxation(
-            name="all_combined",
-            description="Alle Relaxierungen kombiniert",
-            data=self._relax_all_combined(),
-            pins=pins,
-            time_limit=time_limit,
-        ))
+        original_status = self._run_solver(base, pins, time_limit)
+
+        # (Name, Beschreibung, Datensatz-Builder) je Relaxierung – voneinander unabhängig
+        jobs = [
+            (name, description, partial(build, self, base))
+            for name, description, build in self.RELAXATIONS
+        ]
+
+        cpu_count = os.cpu_count() or 1
+        if cpu_count > 1:
+            results = self._run_parallel(jobs, pins, time_limit, cpu_count, thorough)
+        else:
+            results = []
+            for name, description, build in jobs:
+                if not thorough and any(r.status in _FEASIBLE_STATUSES for r in results):
+                    results.append(RelaxResult(
+                        name=name, description=description,
+                        status="SKIPPED", solve_time=0.0,
+                    ))
+                    continue
+                data = build()
+                if data is None:
+                    results.append(self._not_applicable(name, description))
+                    continue
+                results.append(
+                    self._test_relaxation(name, description, data, pins, time_limit)
+                )
 
         recommendation = self._build_recommendation(results)
         logger.info(f"ConstraintRelaxer: {recommendation}")
@@ -127,131 +213,203 @@ class ConstraintRelaxer:
         )
 
     # ─── Einzel-Relaxierungen ─────────────────────────────────────────────────
+    # Jeder Builder gibt None zurück, wenn die Lockerung am Datensatz nichts
+    # ändern würde – der Solver-Lauf wäre dann eine Wiederholung des Originals.
 
-    def _relax_no_double_required(self) -> SchoolData:
-        """Erstellt Datensatz ohne double_required-Constraints (nur Config-Ebene).
-
-        Da double_required im SUBJECT_METADATA steckt (nicht im SchoolData),
-        wird stattdessen ein überschriebener Solver verwendet. Wir modifizieren
-        die config so, dass double_required ignoriert wird.
+    def _relax_no_double_required(self, base: SchoolData) -> Optional[SchoolData]:
+        """Datensatz für die Relaxierung ohne double_required-Constraints.
 
-        Trick: Wir geben die identischen Daten zurück, aber mit einem Marker
-        im config-Snapshot. Der Solver wird mit einem modifizierten Context aufgerufen.
-        Da wir ScheduleSolver nicht direkt patchbar ist ohne Subclassing, erstellen
-        wir eine Hilfsdaten-Kopie und setzen alle Klassen-Curricula auf 0 für
-        double_required-Fächer → nein, das wäre zu destruktiv.
-
-        Stattdessen: Wir überschreiben SUBJECT_METADATA temporär.
-        Da das ein globales Dict ist, clonen wir den Solver-Lauf in einem
-        Subprocess-ähnlichen Kontext. Für Einfachheit: wir patchen lokal.
+        double_required steckt in SUBJECT_METADATA (nicht im SchoolData): die
+        Daten bleiben unverändert, _run_no_double_required übergibt dem Solver
+        stattdessen angepasste Fach-Metadaten.
         """
-        return self.data  # Wird speziell behandelt in _run_no_double_required
-
-    def _relax_no_room_limits(self) -> SchoolData:
+        used_subjects = {s for c in base.classes for s in c.curriculum}
+        if not any(
+            SUBJECT_METADATA.get(s, {}).get("double_required") for s in used_subjects
+        ):
+            return None
+        return base  # Wird speziell behandelt in _run_no_double_required
+
+    def _relax_no_room_limits(self, base: SchoolData) -> Optional[SchoolData]:
         """Erstellt Datensatz mit unbegrenzten Fachraum-Kapazitäten."""
-        from config.schema import RoomConfig, SpecialRoomDef
-
-        new_config = self.data.config.model_copy(deep=True)
-        new_rooms = RoomConfig(
-            special_rooms=[
-                SpecialRoomDef(
-                    room_type=r.room_type,
-                    display_name=r.display_name,
-                    count=999,
-                )
-                for r in new_config.rooms.special_rooms
-            ]
-        )
-        new_config.rooms = new_rooms
-        return SchoolData(
-            subjects=self.data.subjects,
-            rooms=self.data.rooms,
-            classes=self.data.classes,
-            teachers=self.data.teachers,
-            couplings=self.data.couplings,
-            config=new_config,
-        )
+        config = base.config
+        if not config.rooms.special_rooms:
+            return None
+        new_config = config.model_copy(update={"rooms": _unlimited_rooms(config)})
+        return base.model_copy(update={"config": new_config})
 
-    def _relax_no_couplings(self) -> SchoolData:
+    def _relax_no_couplings(self, base: SchoolData) -> Optional[SchoolData]:
         """Erstellt Datensatz ohne Kopplungen."""
-        return SchoolData(
-            subjects=self.data.subjects,
-            rooms=self.data.rooms,
-            classes=self.data.classes,
-            teachers=self.data.teachers,
-            couplings=[],
-            config=self.data.config,
-        )
+        if not base.couplings:
+            return None
+        return base.model_copy(update={"couplings": []})
 
-    def _relax_no_gap_limit(self) -> SchoolData:
+    def _relax_no_gap_limit(self, base: SchoolData) -> Optional[SchoolData]:
         """Deaktiviert das harte Springstunden-Limit (max_gaps_per_week=0)."""
-        new_config = self.data.config.model_copy(deep=True)
-        new_config.solver.max_gaps_per_week = 0
-        return SchoolData(
-            subjects=self.data.subjects,
-            rooms=self.data.rooms,
-            classes=self.data.classes,
-            teachers=self.data.teachers,
-            couplings=self.data.couplings,
-            config=new_config,
-        )
+        if base.config.solver.max_gaps_per_week == 0:
+            return None
+        new_config = _overlay_solver(base.config, max_gaps_per_week=0)
+        return base.model_copy(update={"config": new_config})
 
-    def _relax_wider_deputat_bounds(self) -> SchoolData:
+    def _relax_wider_deputat_bounds(self, base: SchoolData) -> Optional[SchoolData]:
         """Senkt deputat_min auf 25% von deputat_max für maximale Solver-Flexibilität.
 
         25% statt 50%: wirkt auch wenn deputat_min_fraction bereits 0.5 ist (kein No-Op).
         """
-        new_teachers = [
-            t.model_copy(update={"deputat_min": max(1, round(t.deputat_max * 0.25))})
-            for t in self.data.teachers
-        ]
-        return SchoolData(
-            subjects=self.data.subjects,
-            rooms=self.data.rooms,
-            classes=self.data.classes,
-            teachers=new_teachers,
-            couplings=self.data.couplings,
-            config=self.data.config,
-        )
+        teachers = self._lowered_deputat_teachers(base)
+        if teachers is None:
+            return None
+        return base.model_copy(update={"teachers": teachers})
 
-    def _relax_all_combined(self) -> SchoolData:
+    def _relax_all_combined(self, base: SchoolData) -> Optional[SchoolData]:
         """Alle Relaxierungen kombiniert."""
-        from config.schema import RoomConfig, SpecialRoomDef
-
-        new_config = self.data.config.model_copy(deep=True)
-
-        # Fachraum-Kapazitäten unbegrenzt
-        new_config.rooms = RoomConfig(
-            special_rooms=[
-                SpecialRoomDef(
-                    room_type=r.room_type,
-                    display_name=r.display_name,
-                    count=999,
-                )
-                for r in new_config.rooms.special_rooms
-            ]
-        )
-
+        config = base.config
+        update: dict = {}
+        # Fachraum-Kapazitäten unbegrenzt, Springstunden-Limit aufheben
+        if config.solver.max_gaps_per_week != 0:
+            config = _overlay_solver(config, max_gaps_per_week=0)
+        if config.rooms.special_rooms:
+            config = config.model_copy(update={"rooms": _unlimited_rooms(config)})
+        if config is not base.config:
+            update["config"] = config
         # deputat_min auf 25% senken (konsistent mit _relax_wider_deputat_bounds)
-        new_teachers = [
-            t.model_copy(update={"deputat_min": max(1, round(t.deputat_max * 0.25))})
-            for t in self.data.teachers
+        teachers = self._lowered_deputat_teachers(base)
+        if teachers is not None:
+            update["teachers"] = teachers
+        if base.couplings:
+            update["couplings"] = []  # Kopplungen entfernen
+        if not update:
+            return None
+        return base.model_copy(update=update)
+
+    def _lowered_deputat_teachers(self, base: SchoolData) -> Optional[list[Teacher]]:
+        """Lehrkräfte mit deputat_min = 25% von deputat_max (mind. 1).
+
+        None, wenn keine Untergrenze dadurch sinken würde.
+        """
+        lowered = [max(1, round(t.deputat_max * 0.25)) for t in base.teachers]
+        if all(t.deputat_min <= low for t, low in zip(base.teachers, lowered)):
+            return None
+        return [
+            t.model_copy(update={"deputat_min": low})
+            for t, low in zip(base.teachers, lowered)
         ]
 
-        # Springstunden-Limit aufheben
-        new_config.solver.max_gaps_per_week = 0
-
-        return SchoolData(
-            subjects=self.data.subjects,
-            rooms=self.data.rooms,
-            classes=self.data.classes,
-            teachers=new_teachers,
-            couplings=[],  # Kopplungen entfernen
-            config=new_config,
-        )
+    # (Name, Beschreibung, Builder(self, base) → SchoolData | None) je Relaxierung.
+    # Reihenfolge = Reihenfolge im Bericht; "all_combined" bleibt zuletzt
+    # (läuft ohne thorough nur, wenn keine Einzel-Relaxierung hilft).
+    RELAXATIONS = (
+        ("no_double_required",
+         "Alle double_required=False (Doppelstunden optional)",
+         _relax_no_double_required),
+        ("no_room_limits",
+         "Alle Fachraum-Kapazitäten unbegrenzt",
+         _relax_no_room_limits),
+        ("no_couplings",
+         "Alle Kopplungen entfernt",
+         _relax_no_couplings),
+        ("wider_deputat_bounds",
+         "deputat_min auf 50% von deputat_max gesenkt",
+         _relax_wider_deputat_bounds),
+        ("no_gap_limit",
+         "Springstunden-Limit deaktiviert (max_gaps_per_week=0)",
+         _relax_no_gap_limit),
+        ("all_combined",
+         "Alle Relaxierungen kombiniert",
+         _relax_all_combined),
+    )
 
     # ─── Solver-Ausführung ────────────────────────────────────────────────────
 
+    def _run_parallel(
+        self,
+        jobs: list[tuple[str, str, Callable[[], SchoolData]]],
+        pins: list[PinnedLesson],
+        time_limit: int,
+        cpu_count: int,
+        thorough: bool = False,
+    ) -> list[RelaxResult]:
+        """Führt die Relaxierungen in eigenen Prozessen parallel aus.
+
+        Ohne thorough wie sequenziell: ab der ersten lösbaren Einzel-Relaxierung
+        wird der Pool beendet – auch noch laufende Jobs werden abgebrochen und
+        erscheinen wie die wartenden als SKIPPED.
+
+        Die CP-SAT-Worker werden auf die Jobs aufgeteilt, damit die Kerne nicht
+        überbucht werden. Worker-Prozesse starten per "spawn": der Elternprozess
+        hat bereits CP-SAT laufen lassen und ggf. Threads (Rich-Spinner) aktiv,
+        ein fork würde deren Zustand mitkopieren.
+        """
+        import multiprocessing
+
+        # Wirkungslose Relaxierungen und bereits bekannte Ergebnisse nicht rechnen
+        outcomes: dict[str, tuple[str, float]] = {}
+        pending: list[tuple[str, str, SchoolData]] = []
+        for name, _, build in jobs:
+            data = build()
+            if data is None:
+                outcomes[name] = ("N/A", 0.0)
+                continue
+            key = _problem_key(data, pins, name == "no_double_required")
+            cached = _STATUS_CACHE.get(key)
+            if cached is not None:
+                outcomes[name] = (cached, 0.0)
+            else:
+                pending.append((name, key, data))
+
+        def _cause_found() -> bool:
+            return any(
+                status in _FEASIBLE_STATUSES
+                for name, (status, _) in outcomes.items()
+                if name != "all_combined"
+            )
+
+        keys = {name: key for name, key, _ in pending}
+        context = multiprocessing.get_context("spawn")
+
+        def _collect(batch, stop_at_cause: bool) -> None:
+            job = partial(
+                _run_relaxation_job, pins=pins, time_limit=time_limit,
+                num_workers=max(1, cpu_count // len(batch)),
+            )
+            # Verlassen des with-Blocks ruft terminate(): nach der ersten
+            # Ursache werden auch laufende Jobs abgebrochen statt abgewartet
+            with context.Pool(processes=min(len(batch), cpu_count)) as pool:
+                for name, outcome in pool.imap_unordered(job, [(n, d) for n, _, d in batch]):
+                    outcomes[name] = outcome
+                    _remember_status(keys[name], outcome[0])
+                    if stop_at_cause and outcome[0] in _FEASIBLE_STATUSES:
+                        break
+
+        if pending and (thorough or not _cause_found()):
+            if thorough:
+                _collect(pending, stop_at_cause=False)
+            else:
+                # Erst die Einzel-Ursachen; "all_combined" nur, wenn keine hilft
+                singles = [p for p in pending if p[0] != "all_combined"]
+                if singles:
+                    _collect(singles, stop_at_cause=True)
+                if not _cause_found():
+                    combined = [p for p in pending if p[0] == "all_combined"]
+                    if combined:
+                        _collect(combined, stop_at_cause=False)
+
+        # Ergebnisse in Job-Reihenfolge (für _build_recommendation und Bericht);
+        # ohne Ergebnis = verworfen bzw. nicht mehr nötig → SKIPPED
+        results = []
+        for name, description, _ in jobs:
+            status, elapsed = outcomes.get(name, ("SKIPPED", 0.0))
+            if status == "N/A":
+                results.append(self._not_applicable(name, description))
+            elif status == "SKIPPED":
+                results.append(RelaxResult(
+                    name=name, description=description,
+                    status="SKIPPED", solve_time=0.0,
+                ))
+            else:
+                results.append(self._make_result(name, description, status, elapsed))
+        return results
+
     def _test_relaxation(
         self,
         name: str,
@@ -260,12 +418,21 @@ class ConstraintRelaxer:
         pins: list[PinnedLesson],
         time_limit: int,
     ) -> RelaxResult:
-        """Testet eine einzelne Relaxierung."""
+        """Testet eine einzelne Relaxierung (Ergebnis wird gemerkt)."""
+        key = _problem_key(data, pins, name == "no_double_required")
+        cached = _STATUS_CACHE.get(key)
+        if cached is not None:
+            return self._make_result(name, description, cached, 0.0)
         if name == "no_double_required":
-            status, elapsed = self._run_no_double_required(pins, time_limit)
+            status, elapsed = self._run_no_double_required(data, pins, time_limit)
         else:
             status, elapsed = self._run_solver_timed(data, pins, time_limit)
+        _remember_status(key, status)
+        return self._make_result(name, description, status, elapsed)
 
+    @staticmethod
+    def _make_result(name: str, description: str, status: str, elapsed: float) -> RelaxResult:
+        """Protokolliert und verpackt das Ergebnis einer Relaxierung."""
         logger.info(f"  Relaxierung '{name}': {status} ({elapsed:.1f}s)")
         return RelaxResult(
             name=name,
@@ -274,14 +441,30 @@ class ConstraintRelaxer:
             solve_time=elapsed,
         )
 
+    @staticmethod
+    def _not_applicable(name: str, description: str) -> RelaxResult:
+        """Ergebnis für eine Relaxierung ohne Wirkung auf den Datensatz."""
+        logger.info(f"  Relaxierung '{name}': N/A (keine Änderung)")
+        return RelaxResult(
+            name=name,
+            description=f"{description} (keine Änderung anwendbar)",
+            status="N/A",
+            solve_time=0.0,
+        )
+
     def _run_solver(
         self,
         data: SchoolData,
         pins: list[PinnedLesson],
         time_limit: int,
     ) -> str:
-        """Führt den Solver aus und gibt den Status zurück."""
+        """Führt den Solver aus und gibt den Status zurück (Ergebnis wird gemerkt)."""
+        key = _problem_key(data, pins)
+        cached = _STATUS_CACHE.get(key)
+        if cached is not None:
+            return cached
         status, _ = self._run_solver_timed(data, pins, time_limit)
+        _remember_status(key, status)
         return status
 
     def _run_solver_timed(
@@ -289,26 +472,17 @@ class ConstraintRelaxer:
         data: SchoolData,
         pins: list[PinnedLesson],
         time_limit: int,
+        num_workers: Optional[int] = None,
     ) -> tuple[str, float]:
-        """Führt den Solver aus und gibt (Status, Zeit) zurück."""
-        from solver.scheduler import ScheduleSolver
+        """Führt den Solver aus und gibt (Status, Zeit) zurück.
+
+        num_workers: CP-SAT-Worker (bei parallelen Relaxierungen je Prozess gesetzt)
+        """
 
         t0 = time.time()
         try:
-            # Zeitlimit setzen
-            modified_data = data
-            if data.config.solver.time_limit_seconds > time_limit:
-                new_config = data.config.model_copy(deep=True)
-                new_config.solver.time_limit_seconds = time_limit
-                new_config.solver.num_workers = 2
-                modified_data = SchoolData(
-                    subjects=data.subjects,
-                    rooms=data.rooms,
-                    classes=data.classes,
-                    teachers=data.teachers,
-                    couplings=data.couplings,
-                    config=new_config,
-                )
+            # Zeitlimit (und ggf. Worker-Zahl) setzen
+            modified_data = _with_solver_limits(data, time_limit, num_workers)
 
             solver = ScheduleSolver(modified_data)
             solution = solver.solve(pins=pins, use_soft=False)
@@ -321,39 +495,25 @@ class ConstraintRelaxer:
 
     def _run_no_double_required(
         self,
+        data: SchoolData,
         pins: list[PinnedLesson],
         time_limit: int,
+        num_workers: Optional[int] = None,
     ) -> tuple[str, float]:
         """Führt den Solver ohne double_required-Constraints aus.
 
-        Patcht SUBJECT_METADATA temporär, um alle double_required=False zu setzen.
-        Thread-safe ist dies nicht; für Diagnose-Zwecke (single-threaded) ausreichend.
+        Die Fach-Metadaten werden als Kopie mit double_required=False an den
+        Solver übergeben – SUBJECT_METADATA selbst bleibt unverändert.
         """
-        from config.defaults import SUBJECT_METADATA
-        from solver.scheduler import ScheduleSolver
-
-        # Temporär patchen
-        originals = {}
-        for name, meta in SUBJECT_METADATA.items():
-            if meta.get("double_required"):
-                originals[name] = meta["double_required"]
-                meta["double_required"] = False
 
+        metadata = {
+            name: {**meta, "double_required": False}
+            for name, meta in SUBJECT_METADATA.items()
+        }
+        t0 = time.time()
         try:
-            t0 = time.time()
-            new_config = self.data.config.model_copy(deep=True)
-            if new_config.solver.time_limit_seconds > time_limit:
-                new_config.solver.time_limit_seconds = time_limit
-                new_config.solver.num_workers = 2
-            modified_data = SchoolData(
-                subjects=self.data.subjects,
-                rooms=self.data.rooms,
-                classes=self.data.classes,
-                teachers=self.data.teachers,
-                couplings=self.data.couplings,
-                config=new_config,
-            )
-            solver = ScheduleSolver(modified_data)
+            modified_data = _with_solver_limits(data, time_limit, num_workers)
+            solver = ScheduleSolver(modified_data, subject_metadata=metadata)
             solution = solver.solve(pins=pins, use_soft=False)
             elapsed = time.time() - t0
             return solution.solver_status, elapsed
@@ -361,20 +521,57 @@ class ConstraintRelaxer:
             elapsed = time.time() - t0
             logger.warning(f"Solver-Ausnahme (no_double_required): {e}")
             return "UNKNOWN", elapsed
-        finally:
-            # Patch zurücksetzen
-            for name, orig_val in originals.items():
-                SUBJECT_METADATA[name]["double_required"] = orig_val
 
     # ─── Empfehlung ───────────────────────────────────────────────────────────
 
+    # Relaxierung → Ursache, wenn sie das Problem lösbar macht.
+    # "all_combined" fehlt bewusst: es grenzt keine einzelne Ursache ein.
+    FIXES = {
+        "no_double_required": (
+            "Doppelstunden-Pflicht: Einige double_required-Fächer haben "
+            "zu wenig Stunden oder zu wenig Slot-Kombinationen verfügbar."
+        ),
+        "no_room_limits": (
+            "Fachraum-Kapazität: Zu viele Klassen brauchen gleichzeitig "
+            "denselben Fachraum. Mehr Räume hinzufügen oder Stunden spreizen."
+        ),
+        "no_couplings": (
+            "Kopplungen: Die Kopplungs-Constraints verursachen Konflikte. "
+            "Prüfen Sie Überschneidungen zwischen Kopplungs- und regulären Stunden."
+        ),
+        "wider_deputat_bounds": (
+            "Deputat-Grenzen: Die Deputat-Untergrenzen sind zu eng. "
+            "Senken Sie deputat_min_fraction in der Konfiguration."
+        ),
+        "no_gap_limit": (
+            "Springstunden-Limit: max_gaps_per_week ist zu eng für die aktuelle "
+            "Lehrer-/Klassen-Konfiguration. Erhöhen Sie den Wert oder setzen Sie "
+            "ihn auf 0 (nur Soft-Minimierung)."
+        ),
+    }
+
     def _build_recommendation(self, results: list[RelaxResult]) -> str:
         """Erstellt eine menschenlesbare Empfehlung basierend auf den Ergebnissen."""
-        feasible = [r for r in results if r.status in ("OPTIMAL", "FEASIBLE")]
-        infeasible = [r for r in results if r.status == "INFEASIBLE"]
-
-        if not feasible:
-            if all(r.status == "UNKNOWN" for r in results):
+        # Ein Durchlauf: Ursachen (in Bericht-Reihenfolge) und Status-Übersicht
+        fixes = []
+        combined_feasible = False
+        any_feasible = False
+        all_unknown = True
+        any_ran = False
+        for r in results:
+            if r.status in _FEASIBLE_STATUSES:
+                any_feasible = True
+                if r.name in self.FIXES:
+                    fixes.append(self.FIXES[r.name])
+                elif r.name == "all_combined":
+                    combined_feasible = True
+            if r.status != "N/A":
+                # N/A-Relaxierungen liefen nicht und sagen nichts über die Ursache aus
+                any_ran = True
+                all_unknown = all_unknown and r.status == "UNKNOWN"
+
+        if not any_feasible:
+            if any_ran and all_unknown:
                 return (
                     "Alle Relaxierungen endeten mit UNKNOWN (Zeitlimit?). "
                     "Erhöhen Sie time_limit oder vereinfachen Sie das Problem."
@@ -385,41 +582,10 @@ class ConstraintRelaxer:
                 "Prüfen Sie die Kapazitätsdiagnose."
             )
 
-        # Spezifische Empfehlungen basierend auf welche Relaxierung hilft
-        fixes = []
-        by_name = {r.name: r.status for r in results}
-
-        if by_name.get("no_double_required") in ("OPTIMAL", "FEASIBLE"):
-            fixes.append(
-                "Doppelstunden-Pflicht: Einige double_required-Fächer haben "
-                "zu wenig Stunden oder zu wenig Slot-Kombinationen verfügbar."
-            )
-        if by_name.get("no_room_limits") in ("OPTIMAL", "FEASIBLE"):
-            fixes.append(
-                "Fachraum-Kapazität: Zu viele Klassen brauchen gleichzeitig "
-                "denselben Fachraum. Mehr Räume hinzufügen oder Stunden spreizen."
-            )
-        if by_name.get("no_couplings") in ("OPTIMAL", "FEASIBLE"):
-            fixes.append(
-                "Kopplungen: Die Kopplungs-Constraints verursachen Konflikte. "
-                "Prüfen Sie Überschneidungen zwischen Kopplungs- und regulären Stunden."
-            )
-        if by_name.get("wider_deputat_bounds") in ("OPTIMAL", "FEASIBLE"):
-            fixes.append(
-                "Deputat-Grenzen: Die Deputat-Untergrenzen sind zu eng. "
-                "Senken Sie deputat_min_fraction in der Konfiguration."
-            )
-        if by_name.get("no_gap_limit") in ("OPTIMAL", "FEASIBLE"):
-            fixes.append(
-                "Springstunden-Limit: max_gaps_per_week ist zu eng für die aktuelle "
-                "Lehrer-/Klassen-Konfiguration. Erhöhen Sie den Wert oder setzen Sie "
-                "ihn auf 0 (nur Soft-Minimierung)."
-            )
-
         if fixes:
             return "Mögliche Ursachen:\n" + "\n".join(f"  • {f}" for f in fixes)
 
-        if by_name.get("all_combined") in ("OPTIMAL", "FEASIBLE"):
+        if combined_feasible:
             return (
                 "Erst alle Relaxierungen kombiniert helfen. "
                 "Das Problem hat mehrere gleichzeitige Constraints-Konflikte."
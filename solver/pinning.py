@@ -4,11 +4,11 @@ Eine gepinnte Stunde ist eine harte Constraint: Der Solver MUSS genau diesen
 Lehrer an genau diesem Tag/Slot für genau diese Klasse einplanen.
 """
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+from pydantic_core import to_json
 
 if TYPE_CHECKING:
     from solver.scheduler import ScheduleSolver
@@ -17,70 +17,85 @@ if TYPE_CHECKING:
 class PinnedLesson(BaseModel):
     """Eine fixierte Unterrichtsstunde."""
 
+    # Unveränderlich und damit hashbar (Änderungen nur über model_copy)
+    model_config = ConfigDict(frozen=True)
+
     teacher_id: str   # Lehrer-Kürzel (wird normalisiert zu UPPERCASE)
     class_id: str     # Klassen-ID (z.B. "5a")
     subject: str      # Fach
     day: int          # 0-basiert (0=Mo, 4=Fr)
     slot_number: int  # 1-basiert (wie Zeitraster)
 
-    def model_post_init(self, __context) -> None:
-        # teacher_id normalisieren
-        object.__setattr__(self, "teacher_id", self.teacher_id.upper())
+    @field_validator("teacher_id")
+    @classmethod
+    def normalize_teacher_id(cls, v: str) -> str:
+        # Kürzel sind meist schon großgeschrieben → keinen neuen String erzeugen
+        return v if v.isupper() else v.upper()
+
+
+# Validiert die Pin-Liste direkt aus den JSON-Bytes (ohne json.load-Zwischenschritt)
+_PIN_LIST_ADAPTER = TypeAdapter(list[PinnedLesson])
 
 
 class PinManager:
     """Verwaltet gepinnte Stunden und wendet sie auf den Solver an."""
 
-    def __init__(self) -> None:
-        self._pins: list[PinnedLesson] = []
+    def __init__(self, pins=()) -> None:
+        # (class_id, day, slot_number) → Pin; pro Klasse und Slot höchstens ein Pin
+        self._pins: dict[tuple[str, int, int], PinnedLesson] = {}
+        # (teacher_id, day, slot_number) → Schlüssel in _pins (für remove_pin)
+        self._by_teacher: dict[tuple[str, int, int], set[tuple[str, int, int]]] = {}
+        for pin in pins:
+            self.add_pin(pin)
 
     def add_pin(self, pin: PinnedLesson) -> None:
         """Fügt einen Pin hinzu. Ersetzt bestehenden Pin am selben Tag/Slot/Klasse."""
-        # Bestehenden Pin an gleicher Position entfernen
-        self._pins = [
-            p for p in self._pins
-            if not (p.class_id == pin.class_id and p.day == pin.day
-                    and p.slot_number == pin.slot_number)
-        ]
-        self._pins.append(pin)
+        key = (pin.class_id, pin.day, pin.slot_number)
+        # Bestehenden Pin an gleicher Position entfernen (neuer Pin kommt ans Ende)
+        old = self._pins.pop(key, None)
+        if old is not None:
+            self._by_teacher[(old.teacher_id, old.day, old.slot_number)].discard(key)
+        self._pins[key] = pin
+        self._by_teacher.setdefault((pin.teacher_id, pin.day, pin.slot_number), set()).add(key)
 
     def remove_pin(self, teacher_id: str, day: int, slot: int) -> bool:
         """Entfernt einen Pin. Gibt True zurück wenn ein Pin entfernt wurde."""
-        teacher_id = teacher_id.upper()
-        before = len(self._pins)
-        self._pins = [
-            p for p in self._pins
-            if not (p.teacher_id == teacher_id and p.day == day
-                    and p.slot_number == slot)
-        ]
-        return len(self._pins) < before
+        keys = self._by_teacher.pop((teacher_id.upper(), day, slot), None)
+        if not keys:
+            return False
+        for key in keys:
+            del self._pins[key]
+        return True
 
     def get_pins(self) -> list[PinnedLesson]:
         """Gibt alle gepinnten Stunden zurück."""
-        return list(self._pins)
+        return list(self._pins.values())
 
     def apply_to_solver(self, solver: "ScheduleSolver") -> None:
         """Übergibt alle Pins an den Solver (wird intern von solve() genutzt)."""
         # Der Solver erhält die Pins direkt über solve(pins=...).
         # Diese Methode existiert als alternativer Einstiegspunkt.
-        solver._pinned_lessons = list(self._pins)
+        solver._pinned_lessons = self.get_pins()
 
     def save_json(self, path: Path) -> None:
         """Speichert alle Pins als JSON."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = [p.model_dump() for p in self._pins]
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        path.write_bytes(to_json(self.get_pins(), indent=2))
 
     def load_json(self, path: Path) -> None:
         """Lädt Pins aus einer JSON-Datei (überschreibt aktuelle Pins)."""
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Pin-Datei nicht gefunden: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self._pins = [PinnedLesson(**item) for item in data]
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Pin-Datei nicht gefunden: {path}") from None
+        with f:
+            pins = _PIN_LIST_ADAPTER.validate_json(f.read())
+        self._pins = {}
+        self._by_teacher = {}
+        for pin in pins:
+            self.add_pin(pin)
 
     def __len__(self) -> int:
         return len(self._pins)
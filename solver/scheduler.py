@@ -16,12 +16,12 @@ from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 from ortools.sat.python import cp_model
 
 from config.schema import SchoolConfig
 from config.defaults import SUBJECT_METADATA
-from models.school_data import SchoolData
-from models.teacher import Teacher
+from models.school_data import SchoolData, _build_subject_tables
 from models.school_class import SchoolClass
 from models.coupling import Coupling
 from solver.pinning import PinnedLesson
@@ -74,20 +74,38 @@ class ScheduleSolution(BaseModel):
         """Alle Einträge für einen bestimmten Lehrer."""
         return [e for e in self.entries if e.teacher_id == teacher_id]
 
+    def entries_by_class(self) -> dict[str, list[ScheduleEntry]]:
+        """Alle Einträge nach Klasse gruppiert (ein Durchlauf, nicht gemerkt).
+
+        Für Schleifen über alle Klassen: einmal aufrufen und das Dict halten.
+        """
+        by_class: dict[str, list[ScheduleEntry]] = {}
+        for e in self.entries:
+            by_class.setdefault(e.class_id, []).append(e)
+        return by_class
+
+    def entries_by_teacher(self) -> dict[str, list[ScheduleEntry]]:
+        """Alle Einträge nach Lehrer gruppiert (ein Durchlauf, nicht gemerkt)."""
+        by_teacher: dict[str, list[ScheduleEntry]] = {}
+        for e in self.entries:
+            by_teacher.setdefault(e.teacher_id, []).append(e)
+        return by_teacher
+
     def save_json(self, path: Path) -> None:
         """Speichert die Lösung als JSON-Datei."""
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.model_dump_json(indent=2))
+        path.write_bytes(to_json(self, indent=2))
 
     @classmethod
     def load_json(cls, path: Path) -> "ScheduleSolution":
         """Lädt eine gespeicherte Lösung aus JSON."""
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Lösung nicht gefunden: {path}")
-        with open(path, "r", encoding="utf-8") as f:
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Lösung nicht gefunden: {path}") from None
+        with f:
             return cls.model_validate_json(f.read())
 
 
@@ -126,7 +144,12 @@ class ScheduleSolver:
         solution = solver.solve(pins=[...])
     """
 
-    def __init__(self, school_data: SchoolData) -> None:
+    def __init__(
+        self,
+        school_data: SchoolData,
+        subject_metadata: Optional[dict[str, dict]] = None,
+    ) -> None:
+        """subject_metadata: ersetzt SUBJECT_METADATA für diesen Solver (z.B. Diagnose)."""
         self.data = school_data
         self.config = school_data.config
         self._model = cp_model.CpModel()
@@ -135,6 +158,7 @@ class ScheduleSolver:
         self.sek1_slots: list = []         # LessonSlot-Objekte für Sek I
         self.slot_index: dict = {}         # (day, slot_number) -> int-Index
         self.valid_double_starts: set = {} # slot_numbers die Doppelstunden starten dürfen
+        self.double_pairs: dict = {}       # slot_first -> slot_second (Sek-I-Doppelblöcke)
 
         # Entscheidungsvariablen
         self._assign: dict = {}   # (teacher_id, class_id, subject) -> BoolVar
@@ -143,38 +167,58 @@ class ScheduleSolver:
         # Kopplungsvariablen
         self._coupling_slot: dict = {}    # (coupling_id, day, slot_nr) -> BoolVar
         self._coupling_assign: dict = {}  # (coupling_id, group_idx, teacher_id) -> BoolVar
+        self._cidx_teacher: dict = {}     # teacher_id -> [(coupling_id, group_idx)]
+        self._cidx_cds: dict = {}         # (class_id, day, slot_nr) -> [coupling_slot BoolVar]
+        # coupling_assign AND coupling_slot; einmal je (k, g, t, day, h), geteilt von C4/C11/Lücken
+        self._coupling_busy: dict = {}    # (coupling_id, group_idx, teacher_id, day, slot_nr) -> BoolVar
 
         # Doppelstunden-Variablen (Phase 3)
         self._double: dict = {}  # (teacher_id, class_id, subject, day, block_start) -> BoolVar
 
-        # Schnell-Indizes für Soft-Constraints (vermeiden O(|slots|)-Scans)
+        # Schnell-Indizes auf _slot (vermeiden O(|slots|)-Scans in Constraints/Soft)
         self._sidx_teacher_day_slot: dict = {}  # (teacher_id, day, slot_nr) → [BoolVar]
         self._sidx_tcsd: dict = {}              # (teacher_id, class_id, subj, day) → [BoolVar]
-
-        # Subject-Metadaten-Cache
-        self._subject_meta: dict = {}
-        for name, meta in SUBJECT_METADATA.items():
-            self._subject_meta[name] = meta
+        self._sidx_cds: dict = {}               # (class_id, day, slot_nr) → [BoolVar]
+        self._sidx_cs: dict = {}                # (class_id, subject) → [BoolVar]
+        self._sidx_t: dict = {}                 # teacher_id → [BoolVar]
+        self._sidx_td: dict = {}                # (teacher_id, day) → [BoolVar]
+        self._sidx_rds: dict = {}               # (room_type, day, slot_nr) → [BoolVar]
+
+        # Fach-Metadaten (double_required, room, ...) – global oder überschrieben
+        self._subject_meta: dict[str, dict] = (
+            SUBJECT_METADATA if subject_metadata is None else subject_metadata
+        )
 
         # Kopplungs-bedeckte Fächer pro Klasse
         self._coupling_covered: dict[str, set[str]] = {}  # class_id -> set of subjects
 
+        # Stundentafel aller Klassen: (class_id, subject) -> Wochenstunden (nur > 0)
+        self._curriculum: dict[tuple[str, str], int] = {
+            (cls.id, subj): hrs
+            for cls in school_data.classes
+            for subj, hrs in cls.curriculum.items()
+            if hrs > 0
+        }
+
         # Springstunden-BoolVars (werden von _build_gap_vars befüllt, einmalig)
         self._gap_vars: dict[tuple, list] = {}  # (teacher_id, day) → [is_gap BoolVar, ...]
 
         # Pins (werden von solve() gesetzt)
         self._pinned_lessons: list[PinnedLesson] = []
 
+        # Variablennamen nur bei DEBUG-Logging (CP-SAT braucht sie nicht)
+        self._debug_names = logger.isEnabledFor(logging.DEBUG)
+
     # ─── Öffentliche API ──────────────────────────────────────────────────────
 
     def solve(
         self,
-        pins: list[PinnedLesson] = [],
+        pins: Optional[list[PinnedLesson]] = None,
         use_soft: bool = True,
         weights: Optional[dict] = None,
     ) -> ScheduleSolution:
         """Löst das Stundenplan-Problem und gibt eine Lösung zurück."""
-        self._pinned_lessons = list(pins)
+        self._pinned_lessons = list(pins or [])
 
         t0 = time.time()
 
@@ -200,26 +244,30 @@ class ScheduleSolver:
             pre_solver.parameters.max_time_in_seconds = pre_limit
             pre_solver.parameters.num_workers = num_workers
             pre_solver.parameters.log_search_progress = False
+            # Für den Hint genügt eine zulässige Lösung
+            pre_solver.parameters.stop_after_first_solution = True
+            # Symmetrie-Erkennung und Probing lohnen sich erst beim Optimieren
+            pre_solver.parameters.symmetry_level = 0
+            pre_solver.parameters.cp_model_probing_level = 0
             pre_status = pre_solver.solve(self._model)
             if pre_status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
                 logger.info(f"Warm-Start: feasible Lösung in {pre_solver.wall_time:.1f}s gefunden – setze Hints")
-                for var in self._slot.values():
-                    self._model.add_hint(var, pre_solver.value(var))
-                for var in self._assign.values():
-                    self._model.add_hint(var, pre_solver.value(var))
-                for var in self._double.values():
-                    self._model.add_hint(var, pre_solver.value(var))
-                for var in self._coupling_slot.values():
-                    self._model.add_hint(var, pre_solver.value(var))
-                for var in self._coupling_assign.values():
-                    self._model.add_hint(var, pre_solver.value(var))
+                # Nur die Grundbelegung (Lehrer, Slots, Kopplungen) als Hint; double[]
+                # folgt daraus über C9b. In einem Schritt direkt ins Proto schreiben.
+                hint_vars = [
+                    *self._slot.values(), *self._assign.values(),
+                    *self._coupling_slot.values(), *self._coupling_assign.values(),
+                ]
+                hint = self._model.proto.solution_hint
+                hint.vars.extend(var.index for var in hint_vars)
+                hint.values.extend(pre_solver.value(var) for var in hint_vars)
             else:
                 logger.warning("Warm-Start: keine feasible Lösung gefunden – Solve ohne Hints")
 
         if use_soft:
             self._add_soft_objective(weights, extra_terms=core_dep_terms)
         elif core_dep_terms:
-            self._model.minimize(sum(core_dep_terms))
+            self._model.minimize(cp_model.LinearExpr.sum(core_dep_terms))
 
         # Solver konfigurieren
         cp_solver = cp_model.CpSolver()
@@ -255,6 +303,10 @@ class ScheduleSolver:
                 config_snapshot=self.config,
             )
 
+    def _new_bool_var(self, fmt: str, *args) -> cp_model.IntVar:
+        """Neue BoolVar; der Name (fmt % args) wird nur bei DEBUG formatiert."""
+        return self._model.new_bool_var(fmt % args if self._debug_names else "")
+
     # ─── Slot-Index-Aufbau ────────────────────────────────────────────────────
 
     def _build_slot_index(self) -> None:
@@ -272,11 +324,13 @@ class ScheduleSolver:
                 key = (day, slot.slot_number)
                 self.slot_index[key] = len(self.slot_index)
 
-        # Welche slot_numbers dürfen Doppelstunden starten?
-        self.valid_double_starts = set()
-        for db in tg.double_blocks:
-            if db.slot_second <= tg.sek1_max_slot:
-                self.valid_double_starts.add(db.slot_first)
+        # Welche slot_numbers dürfen Doppelstunden starten (und welcher Slot folgt)?
+        self.double_pairs = {
+            db.slot_first: db.slot_second
+            for db in tg.double_blocks
+            if db.slot_second <= tg.sek1_max_slot
+        }
+        self.valid_double_starts = set(self.double_pairs)
 
     def _build_coupling_coverage(self) -> None:
         """Bestimmt welche Fächer pro Klasse über Kopplungen abgedeckt werden."""
@@ -305,10 +359,12 @@ class ScheduleSolver:
         tg = self.config.time_grid
 
         # Lehrer-Lookup: Fach -> Liste von Lehrern
-        teachers_by_subject: dict[str, list[Teacher]] = {}
-        for teacher in self.data.teachers:
-            for subj in teacher.subjects:
-                teachers_by_subject.setdefault(subj, []).append(teacher)
+        teachers_by_subject = self.data.teachers_by_subject
+        # Gesperrte (day, slot_nr) je Lehrer: dort wird keine Slot-Variable angelegt
+        unavailable = {
+            t.id: frozenset(t.unavailable_slots)
+            for t in self.data.teachers if t.unavailable_slots
+        }
 
         for cls in self.data.classes:
             coupled_subjects = self._coupling_covered.get(cls.id, set())
@@ -319,22 +375,29 @@ class ScheduleSolver:
                 if subject in coupled_subjects:
                     continue  # Wird über Kopplung abgedeckt
 
-                qualified = teachers_by_subject.get(subject, [])
+                qualified = teachers_by_subject.get(subject, ())
                 if not qualified:
                     continue
 
+                rtype = self._subject_meta.get(subject, {}).get("room")
+                cs_vars = self._sidx_cs.setdefault((cls.id, subject), [])
+
                 for teacher in qualified:
                     # assign[t, c, s]
                     key = (teacher.id, cls.id, subject)
-                    var = self._model.new_bool_var(f"assign_{teacher.id}_{cls.id}_{subject}")
+                    var = self._new_bool_var("assign_%s_%s_%s", teacher.id, cls.id, subject)
                     self._assign[key] = var
 
-                    # slot[t, c, s, day, slot_nr]
+                    # slot[t, c, s, day, slot_nr] (nicht für gesperrte Slots des Lehrers)
+                    blocked = unavailable.get(teacher.id, frozenset())
                     for day in range(tg.days_per_week):
                         for slot in self.sek1_slots:
+                            if (day, slot.slot_number) in blocked:
+                                continue
                             skey = (teacher.id, cls.id, subject, day, slot.slot_number)
-                            svar = self._model.new_bool_var(
-                                f"slot_{teacher.id}_{cls.id}_{subject}_{day}_{slot.slot_number}"
+                            svar = self._new_bool_var(
+                                "slot_%s_%s_%s_%s_%s",
+                                teacher.id, cls.id, subject, day, slot.slot_number,
                             )
                             self._slot[skey] = svar
                             # Schnell-Indizes befüllen
@@ -342,36 +405,64 @@ class ScheduleSolver:
                             self._sidx_teacher_day_slot.setdefault(tds_key, []).append(svar)
                             tcsd_key = (teacher.id, cls.id, subject, day)
                             self._sidx_tcsd.setdefault(tcsd_key, []).append(svar)
+                            cds_key = (cls.id, day, slot.slot_number)
+                            self._sidx_cds.setdefault(cds_key, []).append(svar)
+                            cs_vars.append(svar)
+                            self._sidx_t.setdefault(teacher.id, []).append(svar)
+                            self._sidx_td.setdefault((teacher.id, day), []).append(svar)
+                            if rtype:
+                                rds_key = (rtype, day, slot.slot_number)
+                                self._sidx_rds.setdefault(rds_key, []).append(svar)
 
     def _create_coupling_vars(self) -> None:
         """Variablen für Kopplungen."""
         tg = self.config.time_grid
 
         # Lehrer-Lookup für Kopplungs-Fächer
-        teachers_by_subject: dict[str, list[Teacher]] = {}
-        for teacher in self.data.teachers:
-            for subj in teacher.subjects:
-                teachers_by_subject.setdefault(subj, []).append(teacher)
+        teachers_by_subject = self.data.teachers_by_subject
 
         for coupling in self.data.couplings:
             # coupling_slot[k_id, day, slot_nr] – wann findet die Kopplung statt
             for day in range(tg.days_per_week):
                 for slot in self.sek1_slots:
                     key = (coupling.id, day, slot.slot_number)
-                    var = self._model.new_bool_var(
-                        f"cslot_{coupling.id}_{day}_{slot.slot_number}"
+                    var = self._new_bool_var(
+                        "cslot_%s_%s_%s", coupling.id, day, slot.slot_number
                     )
                     self._coupling_slot[key] = var
+                    for class_id in coupling.involved_class_ids:
+                        cds_key = (class_id, day, slot.slot_number)
+                        self._cidx_cds.setdefault(cds_key, []).append(var)
 
             # coupling_assign[k_id, group_idx, teacher_id] – wer unterrichtet die Gruppe
             for g_idx, group in enumerate(coupling.groups):
-                qualified = teachers_by_subject.get(group.subject, [])
+                qualified = teachers_by_subject.get(group.subject, ())
                 for teacher in qualified:
                     key = (coupling.id, g_idx, teacher.id)
-                    var = self._model.new_bool_var(
-                        f"cassign_{coupling.id}_{g_idx}_{teacher.id}"
+                    var = self._new_bool_var(
+                        "cassign_%s_%s_%s", coupling.id, g_idx, teacher.id
                     )
                     self._coupling_assign[key] = var
+                    self._cidx_teacher.setdefault(teacher.id, []).append((coupling.id, g_idx))
+
+    def _coupling_busy_var(self, k_id: str, g_idx: int, t: str, day: int, h: int):
+        """busy = coupling_assign[k,g,t] AND coupling_slot[k,day,h] (None wenn nicht möglich).
+
+        Wird pro Schlüssel nur einmal angelegt und von allen Constraints geteilt.
+        """
+        key = (k_id, g_idx, t, day, h)
+        busy = self._coupling_busy.get(key)
+        if busy is not None:
+            return busy
+        ca = self._coupling_assign.get((k_id, g_idx, t))
+        cs = self._coupling_slot.get((k_id, day, h))
+        if ca is None or cs is None:
+            return None
+        busy = self._new_bool_var("busy_%s_%s_%s_%s_%s", t, k_id, g_idx, day, h)
+        self._model.add_bool_and([ca, cs]).only_enforce_if(busy)
+        self._model.add_bool_or([ca.negated(), cs.negated()]).only_enforce_if(busy.negated())
+        self._coupling_busy[key] = busy
+        return busy
 
     def _create_double_vars(self) -> None:
         """Erzeugt double[t,c,s,day,bs]-Variablen für alle Doppelstunden-Fächer.
@@ -381,15 +472,11 @@ class ScheduleSolver:
         """
         tg = self.config.time_grid
         double_subjects = {
-            n for n, m in SUBJECT_METADATA.items()
+            n for n, m in self._subject_meta.items()
             if m.get("double_required") or m.get("double_preferred")
         }
 
-        # double_pairs: slot_first -> slot_second
-        double_pairs: dict[int, int] = {}
-        for db in tg.double_blocks:
-            if db.slot_second <= tg.sek1_max_slot:
-                double_pairs[db.slot_first] = db.slot_second
+        double_pairs = self.double_pairs
 
         for (t, c, s) in self._assign:
             if s not in double_subjects:
@@ -400,8 +487,8 @@ class ScheduleSolver:
                     if h_next is None:
                         continue
                     if (t, c, s, day, bs) in self._slot and (t, c, s, day, h_next) in self._slot:
-                        self._double[(t, c, s, day, bs)] = self._model.new_bool_var(
-                            f"double_{t}_{c}_{s}_{day}_{bs}"
+                        self._double[(t, c, s, day, bs)] = self._new_bool_var(
+                            "double_%s_%s_%s_%s_%s", t, c, s, day, bs
                         )
 
     # ─── Constraints ──────────────────────────────────────────────────────────
@@ -413,7 +500,8 @@ class ScheduleSolver:
         self._c3_curriculum_satisfied()
         self._c4_no_teacher_conflict()
         self._c5_no_class_conflict()
-        self._c6_teacher_unavailability()
+        # C6 (Sperrzeiten): gesperrte reguläre Slots bekommen gar keine Variable
+        # (_create_assign_and_slot_vars), Kopplungen an Sperrzeiten verhindert C12
         self._c7_deputat_bounds()
         self._c8_special_room_capacity()
         self._c9_double_lesson_required()
@@ -444,24 +532,16 @@ class ScheduleSolver:
 
     def _c3_curriculum_satisfied(self) -> None:
         """Summe der Slot-Variablen == Curriculum-Stunden pro (Klasse, Fach)."""
-        tg = self.config.time_grid
         coupled_by_class: dict[str, set[str]] = self._coupling_covered
 
-        for cls in self.data.classes:
-            for subject, hours in cls.curriculum.items():
-                if hours == 0:
-                    continue
-                if subject in coupled_by_class.get(cls.id, set()):
-                    continue
+        for (class_id, subject), hours in self._curriculum.items():
+            if subject in coupled_by_class.get(class_id, ()):
+                continue
 
-                # Alle slot-Variablen für diese Klasse+Fach
-                slot_vars = [
-                    self._slot[key]
-                    for key in self._slot
-                    if key[1] == cls.id and key[2] == subject
-                ]
-                if slot_vars:
-                    self._model.add(sum(slot_vars) == hours)
+            # Alle slot-Variablen für diese Klasse+Fach
+            slot_vars = self._sidx_cs.get((class_id, subject))
+            if slot_vars:
+                self._model.add(cp_model.LinearExpr.sum(slot_vars) == hours)
 
     def _c4_no_teacher_conflict(self) -> None:
         """Kein Lehrer doppelt belegt an einem Slot."""
@@ -472,43 +552,20 @@ class ScheduleSolver:
                 for slot in self.sek1_slots:
                     h = slot.slot_number
                     # Reguläre Slot-Variablen dieses Lehrers an (day, h)
-                    slot_vars = [
-                        self._slot[key]
-                        for key in self._slot
-                        if key[0] == teacher.id and key[3] == day and key[4] == h
-                    ]
-                    # Kopplungs-Slots wo dieser Lehrer beteiligt ist
-                    coupling_vars = [
-                        self._coupling_assign[(k_id, g_idx, teacher.id)]
-                        for (k_id, g_idx, t_id) in self._coupling_assign
-                        if t_id == teacher.id
-                        and (k_id, day, h) in self._coupling_slot
-                        for _ in [self._coupling_slot.get((k_id, day, h))]
-                        if _ is not None
-                    ]
+                    slot_vars = self._sidx_teacher_day_slot.get((teacher.id, day, h), [])
                     # Kombinierte Constraint: Lehrer kann nur an einem Ort sein
                     # Für Kopplungen: coupling_slot * coupling_assign
                     all_vars = slot_vars[:]
 
-                    # Für jede Kopplung: Lehrer ist bei Kopplungs-Slot belastet wenn
+                    # Für jede Kopplungsgruppe, für die der Lehrer infrage kommt: belastet wenn
                     # coupling_slot[k,d,h]=1 AND coupling_assign[k,g,t]=1
-                    for coupling in self.data.couplings:
-                        for g_idx, group in enumerate(coupling.groups):
-                            ca_key = (coupling.id, g_idx, teacher.id)
-                            cs_key = (coupling.id, day, h)
-                            if ca_key in self._coupling_assign and cs_key in self._coupling_slot:
-                                # auxiliary: coupling_busy = ca AND cs
-                                busy = self._model.new_bool_var(
-                                    f"busy_{teacher.id}_{coupling.id}_{g_idx}_{day}_{h}"
-                                )
-                                ca = self._coupling_assign[ca_key]
-                                cs = self._coupling_slot[cs_key]
-                                self._model.add_bool_and([ca, cs]).only_enforce_if(busy)
-                                self._model.add_bool_or([ca.negated(), cs.negated()]).only_enforce_if(busy.negated())
-                                all_vars.append(busy)
+                    for (k_id, g_idx) in self._cidx_teacher.get(teacher.id, ()):
+                        busy = self._coupling_busy_var(k_id, g_idx, teacher.id, day, h)
+                        if busy is not None:
+                            all_vars.append(busy)
 
                     if all_vars:
-                        self._model.add(sum(all_vars) <= 1)
+                        self._model.add_at_most_one(all_vars)
 
     def _c5_no_class_conflict(self) -> None:
         """Keine Klasse doppelt belegt an einem Slot."""
@@ -519,75 +576,43 @@ class ScheduleSolver:
                 for slot in self.sek1_slots:
                     h = slot.slot_number
                     # Reguläre Slots dieser Klasse
-                    slot_vars = [
-                        self._slot[key]
-                        for key in self._slot
-                        if key[1] == cls.id and key[3] == day and key[4] == h
-                    ]
+                    slot_vars = self._sidx_cds.get((cls.id, day, h), [])
                     # Kopplungs-Slots für diese Klasse
-                    coupling_slot_vars = [
-                        self._coupling_slot[(coupling.id, day, h)]
-                        for coupling in self.data.couplings
-                        if cls.id in coupling.involved_class_ids
-                        and (coupling.id, day, h) in self._coupling_slot
-                    ]
+                    coupling_slot_vars = self._cidx_cds.get((cls.id, day, h), [])
 
                     all_vars = slot_vars + coupling_slot_vars
                     if all_vars:
-                        self._model.add(sum(all_vars) <= 1)
-
-    def _c6_teacher_unavailability(self) -> None:
-        """Gesperrte Slots bleiben leer."""
-        for teacher in self.data.teachers:
-            for (day, slot_nr) in teacher.unavailable_slots:
-                # Reguläre Slots
-                for key, var in self._slot.items():
-                    if key[0] == teacher.id and key[3] == day and key[4] == slot_nr:
-                        self._model.add(var == 0)
-                # Kopplungs-Assign wenn Slot gesperrt
-                for coupling in self.data.couplings:
-                    cs_key = (coupling.id, day, slot_nr)
-                    if cs_key in self._coupling_slot:
-                        for g_idx in range(len(coupling.groups)):
-                            ca_key = (coupling.id, g_idx, teacher.id)
-                            if ca_key in self._coupling_assign:
-                                # Wenn Lehrer den Slot hat UND Kopplung an dem Slot stattfindet
-                                # → Lehrer kann nicht zugewiesen sein wenn Slot gesperrt
-                                # Einfacher: coupling_assign von gesperrten Slots entkoppeln
-                                # via: coupling_slot[k,d,h] AND coupling_assign[k,g,t] == 0
-                                # Da coupling_slot[k,d,h] == 1 möglich, coupling_assign == 0
-                                # Hier: wenn Slot für t gesperrt → coupling_assign[k,g,t] = 0
-                                # → Lehrer kann diese Gruppe nicht übernehmen wenn
-                                #   die Kopplung auf einen seiner gesperrten Slots fällt.
-                                # Wir können das nicht direkt erzwingen ohne zu wissen wann.
-                                # Stattdessen: separate Verknüpfung via auxiliary in _c4.
-                                pass
+                        self._model.add_at_most_one(all_vars)
 
     def _c7_deputat_bounds(self) -> None:
         """Per-Lehrer asymmetrische Deputat-Schranken (deputat_min ≤ actual ≤ deputat_max)."""
         for teacher in self.data.teachers:
-            # Alle Slot-Variablen dieses Lehrers
-            slot_vars = [
-                var for key, var in self._slot.items()
-                if key[0] == teacher.id
-            ]
-
-            coupling_terms = []
-            for coupling in self.data.couplings:
-                for g_idx, group in enumerate(coupling.groups):
-                    ca_key = (coupling.id, g_idx, teacher.id)
-                    if ca_key in self._coupling_assign:
-                        h = group.hours_per_week
-                        if h > 0:
-                            coupling_terms.append(
-                                self._coupling_assign[ca_key] * h
-                            )
-
-            if slot_vars or coupling_terms:
-                total = sum(slot_vars) + sum(coupling_terms)
+            total = self._teacher_load_expr(teacher.id)
+            if total is not None:
                 self._model.add(total >= teacher.deputat_min)
                 self._model.add(total <= teacher.deputat_max)
 
+    def _teacher_load_expr(self, teacher_id: str):
+        """Wochenstunden eines Lehrers als lineare Summe (None ohne Variablen).
+
+        Reguläre Slot-Variablen zählen je 1, Kopplungsgruppen mit ihren
+        Wochenstunden (coupling_assign * hours_per_week).
+        """
+        slot_vars = self._sidx_t.get(teacher_id, [])
+        ca_vars: list = []
+        ca_hours: list[int] = []
+        for coupling in self.data.couplings:
+            for g_idx, group in enumerate(coupling.groups):
+                ca = self._coupling_assign.get((coupling.id, g_idx, teacher_id))
+                if ca is not None and group.hours_per_week > 0:
+                    ca_vars.append(ca)
+                    ca_hours.append(group.hours_per_week)
+        if not (slot_vars or ca_vars):
+            return None
+        return cp_model.LinearExpr.sum(slot_vars) + cp_model.LinearExpr.weighted_sum(
+            ca_vars, ca_hours
+        )
+
     def _c8_special_room_capacity(self) -> None:
         """Fachraum-Kapazität: Nicht mehr Stunden als Räume vorhanden.
 
@@ -596,9 +621,9 @@ class ScheduleSolver:
         """
         tg = self.config.time_grid
 
-        # Für jede Raum-Typ und jeden Slot: max room_count simultane Nutzungen
+        # Für jeden Raumtyp und jeden Slot: max room_count simultane Nutzungen
         room_type_for_subject: dict[str, str] = {}
-        for name, meta in SUBJECT_METADATA.items():
+        for name, meta in self._subject_meta.items():
             if meta.get("room"):
                 room_type_for_subject[name] = meta["room"]
 
@@ -613,33 +638,40 @@ class ScheduleSolver:
             if rtypes:
                 coupling_room_types[coupling.id] = rtypes
 
-        for day in range(tg.days_per_week):
-            for slot in self.sek1_slots:
-                h = slot.slot_number
-                # Gruppiere nach Raumtyp
-                by_room_type: dict[str, list] = {}
-                for (t, c, s, d, sh), var in self._slot.items():
-                    if d == day and sh == h:
-                        rtype = room_type_for_subject.get(s)
-                        if rtype:
-                            by_room_type.setdefault(rtype, []).append(var)
-
-                # Kopplungs-Slots: eine coupling_slot-Variable belegt je eine Raumeinheit
-                for coupling in self.data.couplings:
-                    rtypes = coupling_room_types.get(coupling.id)
-                    if not rtypes:
-                        continue
-                    cs_key = (coupling.id, day, h)
-                    cs_var = self._coupling_slot.get(cs_key)
+        # Kapazität je Raumtyp einmal nachschlagen (get_capacity sucht linear);
+        # nur begrenzte Raumtypen (Kapazität < 999) brauchen einen Constraint
+        room_types = {rtype for rtype, _, _ in self._sidx_rds}
+        room_types.update(r for rs in coupling_room_types.values() for r in rs)
+        capacities = {
+            rtype: cap for rtype in room_types
+            if (cap := self.config.rooms.get_capacity(rtype)) < 999
+        }
+        if not capacities:
+            return
+
+        # (rtype, day, h) → [BoolVar]: Slot-Variablen aus dem Raum-Index ...
+        by_room_day_slot: dict[tuple, list] = {
+            key: list(vars_)
+            for key, vars_ in self._sidx_rds.items()
+            if key[0] in capacities
+        }
+        # ... plus Kopplungs-Slots: eine coupling_slot-Variable belegt je Gruppe eine Raumeinheit
+        for coupling in self.data.couplings:
+            rtypes = [r for r in coupling_room_types.get(coupling.id, ()) if r in capacities]
+            if not rtypes:
+                continue
+            for day in range(tg.days_per_week):
+                for slot in self.sek1_slots:
+                    cs_var = self._coupling_slot.get((coupling.id, day, slot.slot_number))
                     if cs_var is None:
                         continue
                     for rtype in rtypes:
-                        by_room_type.setdefault(rtype, []).append(cs_var)
+                        by_room_day_slot.setdefault(
+                            (rtype, day, slot.slot_number), []
+                        ).append(cs_var)
 
-                for rtype, vars_ in by_room_type.items():
-                    capacity = self.config.rooms.get_capacity(rtype)
-                    if capacity < 999:  # Begrenzte Kapazität
-                        self._model.add(sum(vars_) <= capacity)
+        for (rtype, _, _), vars_ in by_room_day_slot.items():
+            self._model.add(cp_model.LinearExpr.sum(vars_) <= capacities[rtype])
 
     def _c9_double_lesson_required(self) -> None:
         """Fächer mit double_required=True dürfen nur in gültigen Doppelstunden-Blöcken stattfinden.
@@ -653,68 +685,69 @@ class ScheduleSolver:
 
         Immer: Bidirektionale Implication für double-Paare (bs ↔ bs+1).
         """
-        tg = self.config.time_grid
-
         double_required_subjects = {
-            name for name, meta in SUBJECT_METADATA.items()
+            name for name, meta in self._subject_meta.items()
             if meta.get("double_required")
         }
 
         # Erste → zweite Slot-Nummer jedes Doppelstunden-Blocks
-        double_pairs: dict[int, int] = {}
-        double_seconds: set[int] = set()
-        for db in tg.double_blocks:
-            if db.slot_second <= tg.sek1_max_slot:
-                double_pairs[db.slot_first] = db.slot_second
-                double_seconds.add(db.slot_second)
+        double_pairs = self.double_pairs
+        double_seconds = set(double_pairs.values())
 
         # Slot-Nummern die weder double_start noch double_second sind (z.B. Slot 7)
-        all_slot_numbers = {s.slot_number for s in self.sek1_slots}
-        single_only_slots = all_slot_numbers - set(double_pairs.keys()) - double_seconds
-
-        # Curriculum-Lookup: (class_id, subject) -> hours
-        curriculum: dict[tuple, int] = {}
-        for cls in self.data.classes:
-            for subj, hrs in cls.curriculum.items():
-                curriculum[(cls.id, subj)] = hrs
+        slot_numbers = [s.slot_number for s in self.sek1_slots]
+        single_only_slots = [
+            h for h in slot_numbers if h not in double_pairs and h not in double_seconds
+        ]
 
-        for (t, c, s, day, h), var in self._slot.items():
+        # Je (Lehrer, Klasse, Fach, Tag) einmal: Slot-Variablen nach Slot-Nummer
+        for (t, c, s) in self._assign:
             if s not in double_required_subjects:
                 continue
-
-            n = curriculum.get((c, s), 0)
+            n = self._curriculum.get((c, s), 0)
             n_rest = n % 2  # 0 = gerade; 1 = ungerade
 
-            if h in self.valid_double_starts:
-                # Erste Hälfte: wenn aktiv, muss zweite Hälfte auch aktiv sein
-                h_next = double_pairs.get(h)
-                if h_next is not None:
-                    next_key = (t, c, s, day, h_next)
-                    if next_key in self._slot:
-                        # var=1 ↔ next_var=1 (Doppelstunden sind immer Paare)
-                        self._model.add_implication(var, self._slot[next_key])
-                        self._model.add_implication(self._slot[next_key], var)
+            for day in range(self.config.time_grid.days_per_week):
+                by_h = {
+                    h: var for h in slot_numbers
+                    if (var := self._slot.get((t, c, s, day, h))) is not None
+                }
+                if not by_h:
+                    continue
+
+                # Doppelstunden-Paare: beide Hälften gemeinsam oder gar nicht.
+                # Fehlt eine Hälfte (z.B. Sperrzeit), bleibt die andere leer.
+                for bs, h_next in double_pairs.items():
+                    first = by_h.get(bs)
+                    second = by_h.get(h_next)
+                    if first is not None and second is not None:
+                        # first=1 ↔ second=1 (Doppelstunden sind immer Paare)
+                        self._model.add_implication(first, second)
+                        self._model.add_implication(second, first)
+                    elif first is not None:
+                        first.proto.domain[1] = 0
+                    elif second is not None:
+                        second.proto.domain[1] = 0
+
+                # Single-only-Slots (z.B. Slot 7)
+                for h in single_only_slots:
+                    var = by_h.get(h)
+                    if var is None:
+                        continue
+                    if n_rest == 0:
+                        # Gerade Stundenzahl: kein Einzelslot benötigt
+                        var.proto.domain[1] = 0
+                    elif n <= 1:
+                        # N=1: nur Einzelstunde möglich, erlaubt
+                        pass
                     else:
-                        self._model.add(var == 0)
-            elif h in double_seconds:
-                # Zweite Hälfte: wird durch Implication von der ersten Hälfte gesteuert.
-                pass
-            else:
-                # Single-only-Slot (z.B. Slot 7)
-                if n_rest == 0:
-                    # Gerade Stundenzahl: kein Einzelslot benötigt
-                    self._model.add(var == 0)
-                elif n <= 1:
-                    # N=1: nur Einzelstunde möglich, erlaubt
-                    pass
-                else:
-                    # N_rest=1 und N>=3: Einzelstunde erlaubt, aber nicht am selben Tag
-                    # wie eine Doppelstunde dieses Fachs
-                    for bs in self.valid_double_starts:
-                        bs_key = (t, c, s, day, bs)
-                        if bs_key in self._slot:
-                            # slot[bs] + slot[h] <= 1 (am selben Tag)
-                            self._model.add(self._slot[bs_key] + var <= 1)
+                        # N_rest=1 und N>=3: Einzelstunde erlaubt, aber nicht am selben Tag
+                        # wie eine Doppelstunde dieses Fachs
+                        for bs in double_pairs:
+                            first = by_h.get(bs)
+                            if first is not None:
+                                # slot[bs] + slot[h] <= 1 (am selben Tag)
+                                self._model.add(first + var <= 1)
 
     def _c9b_double_linkage(self) -> None:
         """Verknüpft double[]-Variablen bidirektional mit den slot[]-Paaren.
@@ -727,12 +760,7 @@ class ScheduleSolver:
           2. double → slot_bs+1
           3. slot_bs + slot_bs+1 - 1 ≤ double
         """
-        tg = self.config.time_grid
-
-        double_pairs: dict[int, int] = {}
-        for db in tg.double_blocks:
-            if db.slot_second <= tg.sek1_max_slot:
-                double_pairs[db.slot_first] = db.slot_second
+        double_pairs = self.double_pairs
 
         for (t, c, s, day, bs), dvar in self._double.items():
             h_next = double_pairs.get(bs)
@@ -762,23 +790,14 @@ class ScheduleSolver:
                 # class_active[c, day, h] = 1 wenn Klasse in diesem Slot eine Stunde hat
                 active: dict[int, cp_model.IntVar] = {}
                 for h in slot_numbers:
-                    slot_vars = [
-                        self._slot[key]
-                        for key in self._slot
-                        if key[1] == cls.id and key[3] == day and key[4] == h
-                    ]
-                    coupling_vars = [
-                        self._coupling_slot[(coupling.id, day, h)]
-                        for coupling in self.data.couplings
-                        if cls.id in coupling.involved_class_ids
-                        and (coupling.id, day, h) in self._coupling_slot
-                    ]
+                    slot_vars = self._sidx_cds.get((cls.id, day, h), [])
+                    coupling_vars = self._cidx_cds.get((cls.id, day, h), [])
                     all_vars = slot_vars + coupling_vars
                     if all_vars:
-                        a = self._model.new_bool_var(f"active_{cls.id}_{day}_{h}")
+                        a = self._new_bool_var("active_%s_%s_%s", cls.id, day, h)
                         # a=1 iff any slot is active
                         self._model.add_bool_or(all_vars).only_enforce_if(a)
-                        self._model.add(sum(all_vars) == 0).only_enforce_if(a.negated())
+                        self._model.add(cp_model.LinearExpr.sum(all_vars) == 0).only_enforce_if(a.negated())
                         active[h] = a
                     else:
                         # Kein Unterricht möglich in diesem Slot
@@ -803,34 +822,18 @@ class ScheduleSolver:
 
         for teacher in self.data.teachers:
             for day in range(tg.days_per_week):
-                day_vars = [
-                    var for key, var in self._slot.items()
-                    if key[0] == teacher.id and key[3] == day
-                ]
-                # Kopplungsstunden am Tag zählen
-                for coupling in self.data.couplings:
-                    for g_idx, group in enumerate(coupling.groups):
-                        ca_key = (coupling.id, g_idx, teacher.id)
-                        if ca_key not in self._coupling_assign:
-                            continue
-                        # Stunden dieser Kopplung an diesem Tag
-                        for slot in self.sek1_slots:
-                            cs_key = (coupling.id, day, slot.slot_number)
-                            if cs_key in self._coupling_slot:
-                                # Auxiliary: busy an diesem Slot für diesen Lehrer
-                                busy = self._model.new_bool_var(
-                                    f"maxh_{teacher.id}_{coupling.id}_{g_idx}_{day}_{slot.slot_number}"
-                                )
-                                ca = self._coupling_assign[ca_key]
-                                cs = self._coupling_slot[cs_key]
-                                self._model.add_bool_and([ca, cs]).only_enforce_if(busy)
-                                self._model.add_bool_or(
-                                    [ca.negated(), cs.negated()]
-                                ).only_enforce_if(busy.negated())
-                                day_vars.append(busy)
+                day_vars = list(self._sidx_td.get((teacher.id, day), ()))
+                # Kopplungsstunden am Tag zählen (busy-Variablen aus C4 wiederverwenden)
+                for (k_id, g_idx) in self._cidx_teacher.get(teacher.id, ()):
+                    for slot in self.sek1_slots:
+                        busy = self._coupling_busy_var(
+                            k_id, g_idx, teacher.id, day, slot.slot_number
+                        )
+                        if busy is not None:
+                            day_vars.append(busy)
 
                 if day_vars:
-                    self._model.add(sum(day_vars) <= teacher.max_hours_per_day)
+                    self._model.add(cp_model.LinearExpr.sum(day_vars) <= teacher.max_hours_per_day)
 
     def _c12_coupling_constraints(self) -> None:
         """Constraints für Kopplungen."""
@@ -845,7 +848,7 @@ class ScheduleSolver:
                 if (coupling.id, day, slot.slot_number) in self._coupling_slot
             ]
             if cs_all:
-                self._model.add(sum(cs_all) == coupling.hours_per_week)
+                self._model.add(cp_model.LinearExpr.sum(cs_all) == coupling.hours_per_week)
 
             # 2. Genau ein Lehrer pro Gruppe
             for g_idx, group in enumerate(coupling.groups):
@@ -877,10 +880,20 @@ class ScheduleSolver:
 
     def _c13_pin_constraints(self) -> None:
         """Gepinnte Stunden werden als harte Constraints gesetzt."""
+        teachers_by_id = self.data.teachers_by_id
         for pin in self._pinned_lessons:
             key = (pin.teacher_id, pin.class_id, pin.subject, pin.day, pin.slot_number)
             if key in self._slot:
                 self._model.add(self._slot[key] == 1)
+                continue
+            teacher = teachers_by_id.get(pin.teacher_id)
+            if teacher is not None and (pin.day, pin.slot_number) in teacher.unavailable_slots:
+                # Pin in einer Sperrzeit widerspricht C6 → Modell unerfüllbar
+                logger.warning(
+                    f"Pin in Sperrzeit von {pin.teacher_id}: "
+                    f"{pin.class_id} {pin.subject} Tag={pin.day} Slot={pin.slot_number}"
+                )
+                self._model.add_bool_or([])
             else:
                 logger.warning(
                     f"Pin ignoriert (Variable nicht vorhanden): "
@@ -897,61 +910,55 @@ class ScheduleSolver:
         entries: list[ScheduleEntry] = []
         assignments: list[TeacherAssignment] = []
 
+        # Aktive Slots einmal gebündelt auslesen; Stunden je (t, c, s) zählen
+        active_slots = self._active_keys(cp_solver, self._slot)
+        hours_by_tcs: dict[tuple[str, str, str], int] = {}
+        for (t, c, s, _day, _h) in active_slots:
+            hours_by_tcs[(t, c, s)] = hours_by_tcs.get((t, c, s), 0) + 1
+
         # TeacherAssignments aus assign-Variablen
-        for (t, c, s), var in self._assign.items():
-            if cp_solver.value(var) == 1:
-                # Stunden zählen
-                hours = sum(
-                    cp_solver.value(self._slot[key])
-                    for key in self._slot
-                    if key[0] == t and key[1] == c and key[2] == s
-                )
-                assignments.append(TeacherAssignment(
-                    teacher_id=t,
-                    class_id=c,
-                    subject=s,
-                    hours_per_week=int(hours),
-                ))
+        for (t, c, s) in self._active_keys(cp_solver, self._assign):
+            assignments.append(TeacherAssignment(
+                teacher_id=t,
+                class_id=c,
+                subject=s,
+                hours_per_week=hours_by_tcs.get((t, c, s), 0),
+            ))
 
         # ScheduleEntries aus slot-Variablen
         room_type_for_subject: dict[str, Optional[str]] = {
-            name: meta.get("room") for name, meta in SUBJECT_METADATA.items()
+            name: meta.get("room") for name, meta in self._subject_meta.items()
         }
 
-        for (t, c, s, day, h), var in self._slot.items():
-            if cp_solver.value(var) == 1:
-                entries.append(ScheduleEntry(
-                    day=day,
-                    slot_number=h,
-                    teacher_id=t,
-                    class_id=c,
-                    subject=s,
-                    room=room_type_for_subject.get(s),
-                    is_coupling=False,
-                ))
+        for (t, c, s, day, h) in active_slots:
+            entries.append(ScheduleEntry(
+                day=day,
+                slot_number=h,
+                teacher_id=t,
+                class_id=c,
+                subject=s,
+                room=room_type_for_subject.get(s),
+                is_coupling=False,
+            ))
 
         # Kopplungs-Einträge
+        active_cslots = set(self._active_keys(cp_solver, self._coupling_slot))
+        # Welcher Lehrer hat welche Gruppe? (C12: genau einer je Gruppe)
+        teacher_of_group: dict[tuple[str, int], str] = {
+            (k_id, g_idx): t
+            for (k_id, g_idx, t) in self._active_keys(cp_solver, self._coupling_assign)
+        }
         for coupling in self.data.couplings:
             tg = self.config.time_grid
             for day in range(tg.days_per_week):
                 for slot in self.sek1_slots:
                     h = slot.slot_number
                     cs_key = (coupling.id, day, h)
-                    if cs_key not in self._coupling_slot:
-                        continue
-                    if cp_solver.value(self._coupling_slot[cs_key]) != 1:
+                    if cs_key not in active_cslots:
                         continue
 
-                    # Welcher Lehrer hat welche Gruppe?
                     for g_idx, group in enumerate(coupling.groups):
-                        assigned_teacher = None
-                        for teacher in self.data.teachers:
-                            ca_key = (coupling.id, g_idx, teacher.id)
-                            if ca_key in self._coupling_assign:
-                                if cp_solver.value(self._coupling_assign[ca_key]) == 1:
-                                    assigned_teacher = teacher.id
-                                    break
-
+                        assigned_teacher = teacher_of_group.get((coupling.id, g_idx))
                         if assigned_teacher is None:
                             continue
 
@@ -1002,6 +1009,14 @@ class ScheduleSolver:
             config_snapshot=self.config,
         )
 
+    @staticmethod
+    def _active_keys(cp_solver: cp_model.CpSolver, variables: dict) -> list:
+        """Schlüssel aller BoolVars mit Wert 1 – ein gebündelter Solver-Aufruf statt je Variable."""
+        if not variables:
+            return []
+        values = cp_solver.boolean_values(list(variables.values())).tolist()
+        return [key for key, on in zip(variables, values) if on]
+
     def _assign_rooms(self, entries: list[ScheduleEntry]) -> list[ScheduleEntry]:
         """Ersetzt room_type-Strings durch konkrete Raum-IDs (Post-Processing).
 
@@ -1059,7 +1074,7 @@ class ScheduleSolver:
         tg = self.config.time_grid
         total_slots = tg.sek1_max_slot * tg.days_per_week
 
-        total_need = sum(sum(c.curriculum.values()) for c in self.data.classes)
+        total_need = sum(c.total_weekly_hours for c in self.data.classes)
         total_dep = sum(t.deputat_max for t in self.data.teachers)
         delta = total_dep - total_need
 
@@ -1086,21 +1101,14 @@ class ScheduleSolver:
                     coupling_covered.add(group.subject)
 
         # Pro Fach: Lehrer-Kapazität vs. Bedarf (nur nicht-Kopplungs-Fächer)
-        subject_need: dict[str, int] = {}
-        for cls in self.data.classes:
-            for subj, hours in cls.curriculum.items():
-                if hours > 0:
-                    subject_need[subj] = subject_need.get(subj, 0) + hours
-
-        subject_cap: dict[str, int] = {}
-        for teacher in self.data.teachers:
-            for subj in teacher.subjects:
-                subject_cap[subj] = subject_cap.get(subj, 0) + teacher.deputat_max
+        subject_need, _, subject_cap = _build_subject_tables(
+            self.data.classes, self.data.teachers
+        )
 
         for subj, need in sorted(subject_need.items()):
             if subj in coupling_covered:
                 continue  # Wird via Kopplung abgedeckt, kein direkter Kapazitäts-Check
-            cap = subject_cap.get(subj, 0)
+            cap = subject_cap[subj]
             if cap < need:
                 logger.error(
                     f"  Fach '{subj}': Kapazität {cap}h < Bedarf {need}h "
@@ -1109,7 +1117,7 @@ class ScheduleSolver:
 
         # Fachraum-Kapazität
         room_type_for_subject: dict[str, str] = {}
-        for name, meta in SUBJECT_METADATA.items():
+        for name, meta in self._subject_meta.items():
             if meta.get("room"):
                 room_type_for_subject[name] = meta["room"]
 
@@ -1160,7 +1168,7 @@ class ScheduleSolver:
             terms.extend(self._soft_subject_spread_penalties(w["subject_spread"]))
 
         if terms:
-            self._model.minimize(sum(terms))
+            self._model.minimize(cp_model.LinearExpr.sum(terms))
 
     def _build_gap_vars(self) -> dict[tuple, list]:
         """Erstellt is_gap BoolVars für alle Lehrer-Tag-Slot-Kombinationen.
@@ -1175,16 +1183,11 @@ class ScheduleSolver:
         tg = self.config.time_grid
         slot_numbers = sorted({s.slot_number for s in self.sek1_slots})
 
-        # Vorberechnen: welche (coupling_id, g_idx) ist jeder Lehrer Kandidat für?
-        teacher_coupling_groups: dict[str, list[tuple]] = {}
-        for (cid, g_idx, tid) in self._coupling_assign:
-            teacher_coupling_groups.setdefault(tid, []).append((cid, g_idx))
-
         gap_vars: dict[tuple, list] = {}
 
         for teacher in self.data.teachers:
             t = teacher.id
-            cgroups = teacher_coupling_groups.get(t, [])
+            cgroups = self._cidx_teacher.get(t, [])
 
             for day in range(tg.days_per_week):
                 active: dict[int, object] = {}
@@ -1196,23 +1199,14 @@ class ScheduleSolver:
                     # Kopplungs-Slots: Lehrer t ist an (day, h) beschäftigt wenn
                     # coupling_assign[cid, g, t]=1 UND coupling_slot[cid, day, h]=1
                     for (cid, g_idx) in cgroups:
-                        ca_var = self._coupling_assign.get((cid, g_idx, t))
-                        cs_var = self._coupling_slot.get((cid, day, h))
-                        if ca_var is None or cs_var is None:
-                            continue
-                        aux = self._model.new_bool_var(
-                            f"cbact_{t}_{cid}_{g_idx}_{day}_{h}"
-                        )
-                        self._model.add_bool_and([ca_var, cs_var]).only_enforce_if(aux)
-                        self._model.add_bool_or(
-                            [ca_var.negated(), cs_var.negated()]
-                        ).only_enforce_if(aux.negated())
-                        busy_vars.append(aux)
+                        aux = self._coupling_busy_var(cid, g_idx, t, day, h)
+                        if aux is not None:
+                            busy_vars.append(aux)
 
                     if busy_vars:
-                        a = self._model.new_bool_var(f"tact_{t}_{day}_{h}")
+                        a = self._new_bool_var("tact_%s_%s_%s", t, day, h)
                         self._model.add_bool_or(busy_vars).only_enforce_if(a)
-                        self._model.add(sum(busy_vars) == 0).only_enforce_if(a.negated())
+                        self._model.add(cp_model.LinearExpr.sum(busy_vars) == 0).only_enforce_if(a.negated())
                         active[h] = a
 
                 active_hs = sorted(active.keys())
@@ -1226,9 +1220,9 @@ class ScheduleSolver:
                     if not before_vars or not after_vars:
                         continue
 
-                    before = self._model.new_bool_var(f"tbef_{t}_{day}_{h}")
-                    after_ = self._model.new_bool_var(f"taft_{t}_{day}_{h}")
-                    is_gap = self._model.new_bool_var(f"tgap_{t}_{day}_{h}")
+                    before = self._new_bool_var("tbef_%s_%s_%s", t, day, h)
+                    after_ = self._new_bool_var("taft_%s_%s_%s", t, day, h)
+                    is_gap = self._new_bool_var("tgap_%s_%s_%s", t, day, h)
 
                     self._model.add_bool_or(before_vars).only_enforce_if(before)
                     self._model.add_bool_and(
@@ -1272,7 +1266,7 @@ class ScheduleSolver:
             for day in range(tg.days_per_week):
                 teacher_gap_vars.extend(self._gap_vars.get((t, day), []))
             if teacher_gap_vars:
-                self._model.add(sum(teacher_gap_vars) <= max_gaps)
+                self._model.add(cp_model.LinearExpr.sum(teacher_gap_vars) <= max_gaps)
 
     def _soft_gap_penalties(self, weight: int) -> list:
         """Springstunden-Strafe: nutzt vorberechnete _gap_vars (inkl. Kopplungen).
@@ -1298,16 +1292,11 @@ class ScheduleSolver:
             for pref_day in teacher.preferred_free_days:
                 if pref_day < 0 or pref_day >= tg.days_per_week:
                     continue
-                day_vars = [
-                    self._slot[k] for k in self._slot
-                    if k[0] == t and k[3] == pref_day
-                ]
+                day_vars = self._sidx_td.get((t, pref_day), [])
                 if day_vars:
-                    has_lesson = self._model.new_bool_var(
-                        f"soft_daywish_{t}_{pref_day}"
-                    )
+                    has_lesson = self._new_bool_var("soft_daywish_%s_%s", t, pref_day)
                     self._model.add_bool_or(day_vars).only_enforce_if(has_lesson)
-                    self._model.add(sum(day_vars) == 0).only_enforce_if(
+                    self._model.add(cp_model.LinearExpr.sum(day_vars) == 0).only_enforce_if(
                         has_lesson.negated()
                     )
                     terms.append(has_lesson * weight)
@@ -1317,7 +1306,7 @@ class ScheduleSolver:
     def _soft_double_preferred_bonuses(self, weight: int) -> list:
         """Bonus für Doppelstunden bei double_preferred-Fächern (negativer Zielfunktionsterm)."""
         double_preferred = {
-            n for n, m in SUBJECT_METADATA.items()
+            n for n, m in self._subject_meta.items()
             if m.get("double_preferred")
         }
         terms = []
@@ -1334,7 +1323,7 @@ class ScheduleSolver:
         """
         tg = self.config.time_grid
         hauptfach_subjects = {
-            n for n, m in SUBJECT_METADATA.items()
+            n for n, m in self._subject_meta.items()
             if m.get("is_hauptfach")
         }
         terms = []
@@ -1345,11 +1334,11 @@ class ScheduleSolver:
             for day in range(tg.days_per_week):
                 day_vars = self._sidx_tcsd.get((t, c, s, day), [])
                 if day_vars:
-                    day_active = self._model.new_bool_var(
-                        f"soft_spread_{t}_{c}_{s}_{day}"
+                    day_active = self._new_bool_var(
+                        "soft_spread_%s_%s_%s_%s", t, c, s, day
                     )
                     self._model.add_bool_or(day_vars).only_enforce_if(day_active)
-                    self._model.add(sum(day_vars) == 0).only_enforce_if(
+                    self._model.add(cp_model.LinearExpr.sum(day_vars) == 0).only_enforce_if(
                         day_active.negated()
                     )
                     terms.append(day_active * weight)
@@ -1360,20 +1349,10 @@ class ScheduleSolver:
         """Straft Unterauslastung: dev = deputat_max − actual (≥ 0 durch _c7 garantiert)."""
         terms = []
         for teacher in self.data.teachers:
-            slot_vars = [v for k, v in self._slot.items() if k[0] == teacher.id]
-            coupling_terms = []
-            for coupling in self.data.couplings:
-                for g_idx, group in enumerate(coupling.groups):
-                    ca_key = (coupling.id, g_idx, teacher.id)
-                    if ca_key in self._coupling_assign:
-                        h = group.hours_per_week
-                        if h > 0:
-                            coupling_terms.append(self._coupling_assign[ca_key] * h)
-            if not (slot_vars or coupling_terms):
+            total = self._teacher_load_expr(teacher.id)
+            if total is None:
                 continue
             dev = self._model.new_int_var(0, teacher.deputat_max, f"dep_dev_{teacher.id}")
-            self._model.add(
-                dev == teacher.deputat_max - (sum(slot_vars) + sum(coupling_terms))
-            )
+            self._model.add(dev == teacher.deputat_max - total)
             terms.append(dev * weight)
         return terms
@@ -262,6 +262,7 @@ class TestModels:
         t = Teacher(id="TST", name="Test, A", subjects=["Deutsch"], deputat_max=20, deputat_min=16,
                     unavailable_slots=[(0, 1), (0, 2), (4, 7)])
         assert len(t.unavailable_slots) == 3
+        assert t.available_slots_count(5 * 6) == 27
 
     def test_school_class_pydantic(self):
         """SchoolClass hat id, curriculum und max_slot."""
@@ -275,6 +276,16 @@ class TestModels:
         assert sc.total_weekly_hours == 11
         assert sc.max_slot == 7
 
+    def test_total_weekly_hours_after_model_copy(self):
+        """Wochenstunden folgen einem ersetzten Curriculum."""
+        from models.school_class import SchoolClass
+        sc = SchoolClass(id="5a", grade=5, label="a",
+                         curriculum={"Mathematik": 4}, max_slot=6)
+        assert sc.total_weekly_hours == 4
+        copy = sc.model_copy(update={"curriculum": {"Mathematik": 4, "Deutsch": 5}})
+        assert copy.total_weekly_hours == 9
+        assert sc.total_weekly_hours == 4
+
     def test_room_pydantic(self):
         """Room hat id, room_type, name."""
         from models.room import Room
@@ -463,6 +474,16 @@ class TestSchoolData:
         assert isinstance(report.errors, list)
         assert isinstance(report.warnings, list)
 
+    def test_validate_feasibility_without_curriculum(self):
+        """Ohne Curriculum: nur Hinweis, keine weiteren Prüfungen."""
+        data = self._make_data()
+        data = data.model_copy(update={"classes": []})
+        report = data.validate_feasibility()
+        assert report.is_feasible
+        assert report.errors == []
+        assert len(report.warnings) == 1
+        assert "Kein Curriculum" in report.warnings[0]
+
     def test_chemie_engpass_triggers_warning(self):
         """Chemie-Engpass erzeugt Warnung wenn kein Mehrarbeit-Puffer gesetzt ist."""
         from data.fake_data import FakeDataGenerator
@@ -521,6 +542,40 @@ class TestSchoolData:
         assert len(loaded.teachers) == len(data.teachers)
         assert loaded.config.school_name == data.config.school_name
 
+    def test_teachers_by_id(self):
+        """teachers_by_id bildet Kürzel → Lehrer ab und wird nicht serialisiert."""
+        data = self._make_data()
+        assert data.teachers_by_id == {t.id: t for t in data.teachers}
+        assert "teachers_by_id" not in data.model_dump()
+        copy = data.model_copy(update={"teachers": data.teachers[:2]})
+        assert list(copy.teachers_by_id) == [t.id for t in data.teachers[:2]]
+
+    def test_teachers_by_id_after_element_replacement(self):
+        """Ersetzen eines Listenelements ist sofort sichtbar."""
+        data = self._make_data()
+        t = data.teachers[0]
+        assert data.teachers_by_id[t.id] is t
+        data.teachers[0] = t.model_copy(update={"name": "Neu"})
+        assert data.teachers_by_id[t.id].name == "Neu"
+
+    def test_teachers_by_subject(self):
+        """teachers_by_subject listet je Fach alle qualifizierten Lehrkräfte."""
+        data = self._make_data()
+        index = data.teachers_by_subject
+        for t in data.teachers:
+            for subj in t.subjects:
+                assert t in index[subj]
+        assert sum(len(v) for v in index.values()) == sum(len(t.subjects) for t in data.teachers)
+        assert all(isinstance(v, tuple) for v in index.values())
+
+    def test_teachers_by_subject_after_element_replacement(self):
+        """Ersetzen eines Listenelements aktualisiert den Fach-Index."""
+        data = self._make_data()
+        t = data.teachers[0]
+        subj = t.subjects[0]
+        data.teachers[0] = t.model_copy(update={"subjects": []})
+        assert t.id not in {x.id for x in data.teachers_by_subject.get(subj, ())}
+
     def test_load_json_nonexistent_raises(self, tmp_path: Path):
         """load_json mit nicht-existenter Datei → FileNotFoundError."""
         from models.school_data import SchoolData
@@ -641,3 +696,77 @@ class TestCli:
         runner = CliRunner()
         result = runner.invoke(cli, ["scenario", "list"])
         assert result.exit_code == 0
+
+    def test_scenario_check_without_scenarios(self):
+        """scenario check ohne Szenarien → Hinweis statt Tabelle."""
+        from click.testing import CliRunner
+        from main import cli
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["scenario", "check"])
+            assert result.exit_code == 0
+            assert "Keine Szenarien" in result.output
+
+    @pytest.mark.parametrize("cpus", [1, 2])
+    def test_scenario_check(self, monkeypatch, cpus):
+        """scenario check prüft jedes Szenario — sequentiell wie im Prozess-Pool."""
+        from click.testing import CliRunner
+        import cli._cmd_scenario as cmd
+        from main import cli
+        monkeypatch.setattr(cmd.os, "cpu_count", lambda: cpus)
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            mgr = ConfigManager()
+            mgr.save_scenario(default_school_config(), "alpha")
+            mgr.save_scenario(default_school_config(), "beta")
+            result = runner.invoke(cli, ["scenario", "check", "--seed", "7"])
+            assert result.exit_code == 0, result.output
+            assert "alpha" in result.output
+            assert "beta" in result.output
+            assert "lösbar" in result.output
+
+
+class TestParseWeights:
+    def test_parses_pairs_with_whitespace(self):
+        """Leerzeichen und leere Teile werden ignoriert, Vorzeichen erlaubt."""
+        from cli._cmd_solve import _parse_weights
+        assert _parse_weights(" gaps = 200, subject_spread=-5,,") == {
+            "gaps": 200, "subject_spread": -5,
+        }
+
+    def test_missing_equals_raises(self):
+        """Teil ohne '=' → BadParameter."""
+        import click
+        from cli._cmd_solve import _parse_weights
+        with pytest.raises(click.BadParameter, match="Ungültiges Format"):
+            _parse_weights("gaps")
+
+    def test_non_integer_value_raises(self):
+        """Nicht-ganzzahliger Wert → BadParameter."""
+        import click
+        from cli._cmd_solve import _parse_weights
+        with pytest.raises(click.BadParameter, match="ganze Zahl"):
+            _parse_weights("gaps=1.5")
+
+
+class TestLoadPins:
+    def test_missing_file_returns_none(self, tmp_path):
+        """Fehlende Pins-Datei → None."""
+        from cli._common import _load_pins
+        assert _load_pins(tmp_path / "pins.json") is None
+
+    def test_reload_after_change(self, tmp_path):
+        """Nach dem Schreiben neuer Pins liefert der Cache den neuen Stand."""
+        from cli._common import _load_pins
+        from solver.pinning import PinManager, PinnedLesson
+        p = tmp_path / "pins.json"
+        pm = PinManager()
+        pm.add_pin(PinnedLesson(teacher_id="MUE", class_id="5a",
+                                subject="Mathematik", day=0, slot_number=1))
+        pm.save_json(p)
+        assert len(_load_pins(p)) == 1
+
+        pm.add_pin(PinnedLesson(teacher_id="SCH", class_id="5b",
+                                subject="Deutsch", day=1, slot_number=2))
+        pm.save_json(p)
+        assert len(_load_pins(p)) == 2
@@ -2,6 +2,7 @@
 
 import time
 import pytest
+from pydantic import ValidationError
 
 from config.schema import (
     SchoolConfig, GradeConfig, GradeDefinition, SchoolType,
@@ -576,6 +577,45 @@ class TestPinConstraint:
         )
 
 
+class TestTeacherUnavailability:
+    """Gesperrte Lehrer-Slots bleiben in der Lösung frei."""
+
+    def test_unavailable_slots_stay_empty(self):
+        data = make_mini_school_data()
+        blocked = [(0, 1), (0, 2), (2, 3)]
+        teacher = data.teachers[0]
+        teachers = [teacher.model_copy(update={"unavailable_slots": blocked})] + data.teachers[1:]
+        data = data.model_copy(update={"teachers": teachers})
+
+        solver = ScheduleSolver(data)
+        solution = solver.solve(use_soft=False)
+        if solution.solver_status not in ("OPTIMAL", "FEASIBLE"):
+            pytest.skip(f"Mit Sperrzeiten nicht lösbar: {solution.solver_status}")
+
+        # Für gesperrte Slots werden gar keine Slot-Variablen angelegt
+        for day, slot_nr in blocked:
+            assert (teacher.id, day, slot_nr) not in solver._sidx_teacher_day_slot
+        assert not any(
+            key[0] == teacher.id and (key[3], key[4]) in blocked for key in solver._slot
+        )
+        used = {(e.day, e.slot_number) for e in solution.get_teacher_schedule(teacher.id)}
+        assert not used & set(blocked)
+
+    def test_pin_in_unavailable_slot_is_infeasible(self):
+        data = make_mini_school_data()
+        teacher = data.teachers[0]
+        teachers = [teacher.model_copy(update={"unavailable_slots": [(0, 1)]})] + data.teachers[1:]
+        data = data.model_copy(update={"teachers": teachers})
+        cls = next(c for c in data.classes
+                   if any(s in teacher.subjects for s in c.curriculum))
+        subject = next(s for s in cls.curriculum if s in teacher.subjects)
+        pin = PinnedLesson(teacher_id=teacher.id, class_id=cls.id,
+                           subject=subject, day=0, slot_number=1)
+
+        solution = ScheduleSolver(data).solve(pins=[pin], use_soft=False)
+        assert solution.solver_status == "INFEASIBLE"
+
+
 class TestPinManager:
     """PinManager Grundfunktionen."""
 
@@ -592,6 +632,15 @@ class TestPinManager:
                            subject="Mathematik", day=0, slot_number=1)
         assert pin.teacher_id == "MUE"
 
+    def test_pin_is_frozen_and_hashable(self):
+        pin = PinnedLesson(teacher_id="mue", class_id="5a",
+                           subject="Mathematik", day=0, slot_number=1)
+        same = PinnedLesson(teacher_id="MUE", class_id="5a",
+                            subject="Mathematik", day=0, slot_number=1)
+        assert len({pin, same}) == 1
+        with pytest.raises(ValidationError):
+            pin.day = 2
+
     def test_remove_pin(self):
         pm = PinManager()
         pm.add_pin(PinnedLesson(teacher_id="MUE", class_id="5a",
@@ -610,6 +659,18 @@ class TestPinManager:
         assert len(pins) == 1
         assert pins[0].teacher_id == "SCH"
 
+    def test_remove_pin_after_replace(self):
+        """Ersetzter Pin ist nicht mehr über den alten Lehrer entfernbar."""
+        pm = PinManager()
+        pm.add_pin(PinnedLesson(teacher_id="MUE", class_id="5a",
+                                subject="Mathematik", day=0, slot_number=1))
+        pm.add_pin(PinnedLesson(teacher_id="SCH", class_id="5a",
+                                subject="Deutsch", day=0, slot_number=1))
+        assert pm.remove_pin("MUE", 0, 1) is False
+        assert len(pm) == 1
+        assert pm.remove_pin("sch", 0, 1) is True
+        assert len(pm) == 0
+
     def test_save_load_json(self, tmp_path):
         pm = PinManager()
         pm.add_pin(PinnedLesson(teacher_id="MUE", class_id="5a",
@@ -668,6 +729,38 @@ class TestSolutionPersistence:
         entries = solution.get_teacher_schedule(t_id)
         assert all(e.teacher_id == t_id for e in entries)
 
+    def test_schedule_index_follows_entries(self):
+        """Abfragen und Gruppierung folgen jeder Änderung der entries-Liste."""
+        from solver.scheduler import ScheduleEntry
+
+        def _entry(t, c, day):
+            return ScheduleEntry(day=day, slot_number=1, teacher_id=t,
+                                 class_id=c, subject="Mathematik")
+
+        solution = ScheduleSolution(
+            entries=[_entry("MUE", "5a", 0), _entry("SCH", "5a", 1)],
+            assignments=[], solver_status="FEASIBLE", solve_time_seconds=0.0,
+            num_variables=0, num_constraints=0,
+            config_snapshot=default_school_config(),
+        )
+        assert len(solution.get_class_schedule("5a")) == 2
+        assert solution.get_teacher_schedule("XYZ") == []
+
+        solution.entries.append(_entry("MUE", "6b", 2))
+        assert [e.day for e in solution.get_teacher_schedule("MUE")] == [0, 2]
+
+        replaced = solution.model_copy(update={"entries": [_entry("SCH", "6b", 3)]})
+        assert replaced.get_class_schedule("5a") == []
+        assert len(solution.get_class_schedule("5a")) == 2
+
+        # Element ersetzen (gleiche Länge)
+        solution.entries[0] = _entry("XYZ", "5a", 0)
+        assert [e.teacher_id for e in solution.get_teacher_schedule("XYZ")] == ["XYZ"]
+        assert [e.day for e in solution.get_teacher_schedule("MUE")] == [2]
+        by_teacher = solution.entries_by_teacher()
+        assert sorted(by_teacher) == ["MUE", "SCH", "XYZ"]
+        assert [e.class_id for e in solution.entries_by_class()["5a"]] == ["5a", "5a"]
+
 
 # ─── Phase 3 Tests ────────────────────────────────────────────────────────────
 
@@ -768,6 +861,35 @@ class TestDoubleVars:
                 f"double-Variable mit Block-Start = sek1_max_slot ({tg.sek1_max_slot})"
             )
 
+    def test_blocked_first_half_closes_second_half(self):
+        """Ist die erste Hälfte eines Blocks gesperrt, bleibt die zweite leer."""
+        data = make_mini_school_data()
+        required = {n for n, m in SUBJECT_METADATA.items() if m.get("double_required")}
+        teacher = next((t for t in data.teachers if required & set(t.subjects)), None)
+        if teacher is None:
+            pytest.skip("Kein Lehrer mit double_required-Fach")
+        tg = data.config.time_grid
+        bs, h_next = next(
+            (db.slot_first, db.slot_second) for db in tg.double_blocks
+            if db.slot_second <= tg.sek1_max_slot
+        )
+        teachers = [
+            t.model_copy(update={"unavailable_slots": [(0, bs)]}) if t is teacher else t
+            for t in data.teachers
+        ]
+        solver = ScheduleSolver(data.model_copy(update={"teachers": teachers}))
+        solver._build_slot_index()
+        solver._build_coupling_coverage()
+        solver._create_variables()
+        solver._add_constraints()
+
+        seconds = [
+            var for (t, c, s, d, h), var in solver._slot.items()
+            if t == teacher.id and s in required and d == 0 and h == h_next
+        ]
+        assert seconds
+        assert all(list(var.proto.domain) == [0, 0] for var in seconds)
+
 
 class TestDoubleLessonsN3:
     """N=3 Sonderfall: 1 Doppelstunde + 1 Einzelstunde an anderem Tag."""
@@ -952,7 +1074,7 @@ class TestConstraintRelaxer:
         report = relaxer.diagnose(time_limit=15)
 
         # Jede Relaxierung hat einen validen Status (kein Python-Error)
-        valid_statuses = {"OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN"}
+        valid_statuses = {"OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN", "SKIPPED", "N/A"}
         for result in report.relaxations:
             assert result.status in valid_statuses, (
                 f"Relaxierung '{result.name}' hat unbekannten Status: {result.status}"
@@ -988,9 +1110,223 @@ class TestConstraintRelaxer:
             assert isinstance(result, RelaxResult)
             assert result.name
             assert result.description
-            assert result.status in ("OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN")
+            assert result.status in (
+                "OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN", "SKIPPED", "N/A"
+            )
             assert result.solve_time >= 0.0
 
+    def test_relaxer_stops_after_first_cause(self, monkeypatch):
+        """Sequenziell: nach der ersten lösbaren Relaxierung wird der Rest übersprungen."""
+        import solver.constraint_relaxer as cr
+
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 1)
+        data = make_mini_school_data()
+        report = cr.ConstraintRelaxer(data).diagnose(time_limit=10)
+        statuses = [r.status for r in report.relaxations]
+        first_hit = next(
+            (i for i, st in enumerate(statuses) if st in ("OPTIMAL", "FEASIBLE")), None
+        )
+        if first_hit is None:
+            pytest.skip("Keine Relaxierung lösbar – Abbruch nicht prüfbar")
+        assert statuses[first_hit + 1:] == ["SKIPPED"] * (len(statuses) - first_hit - 1)
+        assert "SKIPPED" not in statuses[:first_hit]
+
+        full = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+        assert "SKIPPED" not in [r.status for r in full.relaxations]
+
+    def test_relaxer_marks_noop_relaxations(self, monkeypatch):
+        """Relaxierungen ohne Wirkung auf den Datensatz laufen nicht (N/A)."""
+        import solver.constraint_relaxer as cr
+
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 1)
+        data = make_mini_school_data().model_copy(update={"couplings": []})
+        assert data.config.solver.max_gaps_per_week == 0
+        report = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+        by_name = {r.name: r for r in report.relaxations}
+        for name in ("no_couplings", "no_gap_limit"):
+            assert by_name[name].status == "N/A"
+            assert by_name[name].solve_time == 0.0
+        assert by_name["all_combined"].status != "N/A"
+
+    def test_relaxer_parallel_matches_sequential(self, monkeypatch):
+        """Parallel (Worker-Prozesse) liefert dieselben Status wie sequenziell."""
+        import solver.constraint_relaxer as cr
+
+        data = make_mini_school_data()
+        cr.ConstraintRelaxer.clear_cache()
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 4)
+        parallel = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+        # Eindeutige Worker-Ergebnisse landen im Cache des Elternprozesses
+        definitive = {"OPTIMAL", "FEASIBLE", "INFEASIBLE"}
+        ran = [r for r in parallel.relaxations if r.status in definitive]
+        assert len(cr._STATUS_CACHE) == (parallel.original_status in definitive) + len(ran)
+
+        cr.ConstraintRelaxer.clear_cache()
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 1)
+        sequential = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+        cr.ConstraintRelaxer.clear_cache()
+
+        statuses = [r.status for r in parallel.relaxations]
+        if "UNKNOWN" in statuses or "UNKNOWN" in [r.status for r in sequential.relaxations]:
+            pytest.skip("Zeitlimit erreicht – Status nicht vergleichbar")
+        assert [r.name for r in parallel.relaxations] == [r.name for r in sequential.relaxations]
+        assert statuses == [r.status for r in sequential.relaxations]
+
+    def test_relaxer_parallel_stops_after_first_cause(self, monkeypatch):
+        """Parallel ohne thorough: "all_combined" läuft nicht, wenn eine Ursache gefunden ist."""
+        import solver.constraint_relaxer as cr
+
+        data = make_mini_school_data()
+        cr.ConstraintRelaxer.clear_cache()
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 4)
+        report = cr.ConstraintRelaxer(data).diagnose(time_limit=10)
+        cr.ConstraintRelaxer.clear_cache()
+        by_name = {r.name: r.status for r in report.relaxations}
+        if not any(
+            st in ("OPTIMAL", "FEASIBLE") for name, st in by_name.items() if name != "all_combined"
+        ):
+            pytest.skip("Keine Einzel-Relaxierung lösbar – Abbruch nicht prüfbar")
+        assert by_name["all_combined"] == "SKIPPED"
+
+    def test_relaxer_parallel_skips_jobs_after_cached_cause(self, monkeypatch):
+        """Parallel ohne thorough: bekannte lösbare Ursache → kein Worker-Pool, Rest SKIPPED."""
+        import multiprocessing.context
+        import solver.constraint_relaxer as cr
+
+        data = make_mini_school_data()
+        relaxer = cr.ConstraintRelaxer(data)
+        cr.ConstraintRelaxer.clear_cache()
+        base = cr._with_solver_limits(data, 10)
+        cr._remember_status(
+            cr._problem_key(relaxer._relax_no_room_limits(base), []), "FEASIBLE"
+        )
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("Worker-Pool trotz gefundener Ursache gestartet")
+
+        monkeypatch.setattr(multiprocessing.context.BaseContext, "Pool", _no_pool)
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 4)
+        report = relaxer.diagnose(time_limit=10)
+        cr.ConstraintRelaxer.clear_cache()
+        by_name = {r.name: r.status for r in report.relaxations}
+        assert by_name["no_room_limits"] == "FEASIBLE"
+        assert all(
+            st in ("SKIPPED", "N/A") for name, st in by_name.items() if name != "no_room_limits"
+        )
+        assert "SKIPPED" in by_name.values()
+
+    def test_relaxer_parallel_terminates_running_jobs(self, monkeypatch):
+        """Parallel ohne thorough: erste Ursache beendet den Pool, Rest SKIPPED."""
+        import multiprocessing.context
+        import solver.constraint_relaxer as cr
+
+        pools = []
+
+        class _FakePool:
+            def __init__(self, processes=None):
+                self.terminated = False
+                self.consumed = []
+                pools.append(self)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self.terminate()
+
+            def terminate(self):
+                self.terminated = True
+
+            def imap_unordered(self, func, iterable):
+                # Erster Job meldet sofort eine Ursache, die übrigen "laufen noch"
+                for name, _ in iterable:
+                    self.consumed.append(name)
+                    yield name, ("FEASIBLE", 0.1)
+
+        monkeypatch.setattr(
+            multiprocessing.context.BaseContext, "Pool",
+            lambda self, processes=None: _FakePool(processes),
+        )
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 4)
+        data = make_mini_school_data()
+        cr.ConstraintRelaxer.clear_cache()
+        report = cr.ConstraintRelaxer(data).diagnose(time_limit=10)
+        cr.ConstraintRelaxer.clear_cache()
+
+        assert len(pools) == 1
+        assert pools[0].terminated
+        assert len(pools[0].consumed) == 1
+        by_name = {r.name: r.status for r in report.relaxations}
+        assert by_name[pools[0].consumed[0]] == "FEASIBLE"
+        assert by_name["all_combined"] == "SKIPPED"
+        assert [st for st in by_name.values() if st not in ("SKIPPED", "N/A")] == ["FEASIBLE"]
+
+    def test_no_double_required_leaves_metadata_untouched(self):
+        """no_double_required arbeitet mit einer Kopie der Fach-Metadaten."""
+        import copy
+        from solver.constraint_relaxer import ConstraintRelaxer
+
+        before = copy.deepcopy(SUBJECT_METADATA)
+        data = make_mini_school_data()
+        status, _ = ConstraintRelaxer(data)._run_no_double_required(
+            data, pins=[], time_limit=10,
+        )
+        assert status in ("OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN")
+        assert SUBJECT_METADATA == before
+
+    def test_relaxer_reuses_cached_results(self, monkeypatch):
+        """Gleicher Datensatz → eindeutige Ergebnisse kommen aus dem Cache."""
+        import solver.constraint_relaxer as cr
+
+        monkeypatch.setattr(cr.os, "cpu_count", lambda: 1)
+        cr.ConstraintRelaxer.clear_cache()
+        data = make_mini_school_data()
+        first = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+
+        def _no_solve(*args, **kwargs):
+            raise AssertionError("Solver trotz Cache-Treffer gestartet")
+
+        definitive = ("OPTIMAL", "FEASIBLE", "INFEASIBLE", "N/A")
+        if not all(r.status in definitive for r in first.relaxations):
+            pytest.skip("Nicht alle Relaxierungen eindeutig – Cache nicht vollständig")
+        monkeypatch.setattr(cr.ConstraintRelaxer, "_run_solver_timed", _no_solve)
+        monkeypatch.setattr(cr.ConstraintRelaxer, "_run_no_double_required", _no_solve)
+        second = cr.ConstraintRelaxer(data).diagnose(time_limit=10, thorough=True)
+        assert [r.status for r in second.relaxations] == [r.status for r in first.relaxations]
+        assert second.original_status == first.original_status
+        cr.ConstraintRelaxer.clear_cache()
+
+    def test_recommendation_from_fixes_table(self):
+        """Empfehlung nennt genau die Ursachen der lösbaren Relaxierungen."""
+        from solver.constraint_relaxer import ConstraintRelaxer, RelaxResult
+
+        def _res(name, status):
+            return RelaxResult(name=name, description=name, status=status, solve_time=0.0)
+
+        relaxer = ConstraintRelaxer(make_mini_school_data())
+        text = relaxer._build_recommendation([
+            _res("no_double_required", "INFEASIBLE"),
+            _res("no_room_limits", "FEASIBLE"),
+            _res("no_couplings", "N/A"),
+            _res("no_gap_limit", "OPTIMAL"),
+            _res("all_combined", "FEASIBLE"),
+        ])
+        assert ConstraintRelaxer.FIXES["no_room_limits"] in text
+        assert ConstraintRelaxer.FIXES["no_gap_limit"] in text
+        assert ConstraintRelaxer.FIXES["no_double_required"] not in text
+
+        combined_only = relaxer._build_recommendation([
+            _res("no_couplings", "INFEASIBLE"),
+            _res("all_combined", "FEASIBLE"),
+        ])
+        assert combined_only.startswith("Erst alle Relaxierungen kombiniert")
+
+        timed_out = relaxer._build_recommendation([
+            _res("no_couplings", "N/A"),
+            _res("all_combined", "UNKNOWN"),
+        ])
+        assert "UNKNOWN" in timed_out
+
     def test_relaxer_recommendation_nonempty(self):
         """Empfehlung ist nicht leer."""
         from solver.constraint_relaxer import ConstraintRelaxer